@@ -0,0 +1,83 @@
+"""Jinja templates for answer HTML (templates/answers/).
+
+Templates are compiled once per process; the compiled bytecode is also kept
+on disk (CHATBOT_TEMPLATE_CACHE, empty to disable) so later processes skip
+parsing. Everything substituted into a template is auto-escaped unless the
+template marks it ``|safe``. Each render is timed per template; ``stats``
+reports the counts and latencies. ``stream`` renders piece by piece, for
+answers sent as they are produced.
+"""
+import os
+import threading
+import time
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(ROOT, "templates", "answers")
+CACHE_DIR = os.environ.get("CHATBOT_TEMPLATE_CACHE", os.path.join(ROOT, ".jinja_cache"))
+
+
+class AnswerTemplates:
+    """Compiled answer templates with per-template render timing."""
+
+    def __init__(self, path=TEMPLATE_DIR, cache_dir=CACHE_DIR):
+        bytecode_cache = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        self.env = Environment(
+            loader=FileSystemLoader(path),
+            autoescape=True,
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,          # templates only change with a deploy
+            trim_blocks=True,
+            lstrip_blocks=True,
+            undefined=StrictUndefined,
+        )
+        self._lock = threading.Lock()
+        self._timings = {}              # name -> [renders, total seconds, max seconds]
+
+    def render(self, name, **context):
+        """Render templates/answers/<name> to a plain string."""
+        template = self.env.get_template(name)
+        start = time.perf_counter()
+        html = template.render(**context)
+        self._record(name, time.perf_counter() - start)
+        return html
+
+    def stream(self, name, **context):
+        """Yield the output of templates/answers/<name> as it is rendered.
+
+        Only the time spent rendering is recorded, not the time the consumer
+        holds each piece.
+        """
+        pieces = self.env.get_template(name).generate(**context)
+        elapsed = 0.0
+        while True:
+            start = time.perf_counter()
+            piece = next(pieces, None)
+            elapsed += time.perf_counter() - start
+            if piece is None:
+                break
+            yield piece
+        self._record(name, elapsed)
+
+    def _record(self, name, elapsed):
+        with self._lock:
+            timing = self._timings.setdefault(name, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += elapsed
+            timing[2] = max(timing[2], elapsed)
+
+    def stats(self):
+        with self._lock:
+            return {
+                name: {
+                    "renders": renders,
+                    "total_ms": round(total * 1e3, 3),
+                    "mean_us": round(total / renders * 1e6, 1),
+                    "max_us": round(longest * 1e6, 1),
+                }
+                for name, (renders, total, longest) in self._timings.items()
+            }
@@ -0,0 +1,177 @@
+"""ASGI entry point with the /get_response contract of help2.
+
+    uvicorn asgi_app:app --host 0.0.0.0 --port 5000
+
+Cheap requests are answered on the event loop: button actions and
+commands, faculty pages, cached questions (help2.quick_answer), /health
+and /blocks/buttons. Everything that needs the NLP pipeline
+(help2.nlp_answer: language detection, classification, NER, search)
+runs in a bounded thread pool, so a slow
+spaCy call no longer holds up the trivial requests queued behind it. At
+most CHATBOT_NLP_QUEUE requests wait for a thread; beyond that the
+request is refused with 503 and a Retry-After header.
+
+Threads rather than processes, because the pipeline shares the response
+cache, the data snapshot and the loaded models with the event loop.
+Requests and responses are the same as the Flask app's: form-encoded
+POST or query string in, JSON out, gzip/brotli and ETag/304 for
+deterministic answers included. No ASGI framework is needed.
+"""
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+
+import help2
+from compression import MIN_SIZE as COMPRESS_MIN_SIZE, body_digest, negotiate
+
+NLP_THREADS = int(os.environ.get("CHATBOT_NLP_THREADS", "4"))
+# NLP requests allowed to wait for a thread before new ones get 503
+NLP_QUEUE = int(os.environ.get("CHATBOT_NLP_QUEUE", "64"))
+# Largest accepted request body
+MAX_BODY = 64 * 1024
+
+
+class ChatApp:
+    """Minimal ASGI application around help2's answer pipeline."""
+
+    def __init__(self, threads=NLP_THREADS, queue=NLP_QUEUE):
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="nlp")
+        # Requests running on a thread or waiting for one
+        self.limit = threads + queue
+        self.waiting = 0
+        self.routes = {
+            "/get_response": self.get_response,
+            "/health": self.health,
+            "/blocks/buttons": self.block_buttons,
+            "/cache_stats": self.cache_stats,
+            "/nlp_stats": self.nlp_stats,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        route = self.routes.get(scope["path"])
+        if route is None:
+            await self.send_json(send, {"error": "not found"}, status=404)
+            return
+        await route(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def get_response(self, scope, receive, send):
+        if scope["method"] not in ("GET", "POST"):
+            await self.send_json(send, {"error": "method not allowed"}, status=405)
+            return
+        values = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True))
+        if scope["method"] == "POST":
+            body = await read_body(receive)
+            if body is None:
+                await self.send_json(send, {"error": "request too large"}, status=413)
+                return
+            values.update(parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True))
+        if 'user_message' not in values and 'action' not in values:
+            await self.send_json(send, {"error": "user_message is required"}, status=400)
+            return
+        values.setdefault('user_message', '')
+
+        try:
+            result = help2.quick_answer(values)
+        except Exception as e:
+            print(f"Error in get_response: {e}")
+            result = help2.fallback_answer(values)
+        if result is None:
+            if self.waiting >= self.limit:
+                await self.send_json(send, {"error": "busy"}, status=503, headers=[(b"retry-after", b"1")])
+                return
+            self.waiting += 1
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.executor, help2.nlp_answer, values)
+            finally:
+                self.waiting -= 1
+        deterministic = result.pop('deterministic')
+        answer = result.pop('answer')
+        payload = {**help2.answer_payload(answer, values.get('format')), **result}
+        await self.send_json(send, payload, scope=scope, deterministic=deterministic)
+
+    async def health(self, scope, receive, send):
+        await self.send_json(send, {
+            "status": "ok",
+            "snapshot": help2.data_reloader.current.version,
+            "nlp_waiting": self.waiting,
+        })
+
+    async def block_buttons(self, scope, receive, send):
+        """Button sets referenced by ``buttons`` blocks; static, so clients cache them"""
+        await self.send_json(send, help2.button_sets.catalog(), scope=scope, deterministic=True,
+                             headers=[(b"cache-control", b"public, max-age=86400")])
+
+    async def cache_stats(self, scope, receive, send):
+        await self.send_json(send, help2.response_cache.stats())
+
+    async def nlp_stats(self, scope, receive, send):
+        await self.send_json(send, {name: batcher.stats() for name, batcher in help2.ner_batchers.items()})
+
+    async def send_json(self, send, data, status=200, headers=(), scope=None, deterministic=False):
+        """Send ``data`` as JSON, compressed and with an ETag like the Flask app.
+
+        The body is serialized the way Flask's jsonify does it, so both
+        servers send the same bytes and ETags for the same answer.
+        """
+        body = (json.dumps(data, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+        headers = [(b"content-type", b"application/json"), *headers]
+        request_headers = dict(scope["headers"]) if scope else {}
+        coding = None
+        if scope and len(body) >= COMPRESS_MIN_SIZE:
+            coding = negotiate(request_headers.get(b"accept-encoding", b"").decode("latin-1"))
+            headers.append((b"vary", b"Accept-Encoding"))
+        if deterministic and status == 200:
+            digest = body_digest(body)
+            etag = f'"{help2.data_reloader.current.version}-{digest}' + (f'-{coding}"' if coding else '"')
+            headers.append((b"etag", etag.encode()))
+            if not any(name == b"cache-control" for name, _ in headers):
+                headers.append((b"cache-control", b"no-cache"))
+            if scope["method"] == "GET" and etag in request_headers.get(b"if-none-match", b"").decode("latin-1"):
+                await send({"type": "http.response.start", "status": 304, "headers": headers[1:]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        if coding:
+            body = help2.compressed_bodies.get(body, coding)
+            headers.append((b"content-encoding", coding.encode()))
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+async def read_body(receive, limit=MAX_BODY):
+    """The request body, or None if it is larger than ``limit``."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+app = ChatApp()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Benchmark: single-pass intent automaton vs. the old elif keyword cascade
+#
+#   python benchmarks/bench_intent_matcher.py
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from intent_matcher import INTENT_KEYWORDS, DEPARTMENT_ALIASES, KeywordAutomaton, match_intent, tokenize
+
+
+def legacy_intent(text):
+    """The substring cascade get_intent_and_entities used before the automaton."""
+    text_lower = text.lower()
+    for intent, patterns in INTENT_KEYWORDS.items():
+        if any(pattern in text_lower for pattern in patterns):
+            if intent == "department":
+                for dept, variations in DEPARTMENT_ALIASES.items():
+                    if any(variation in text_lower for variation in variations):
+                        break
+            return intent
+    return "general"
+
+
+# Filler words that match no keyword, so the old cascade has to run every scan
+FILLER = ("please tell me more on the college and what students should know "
+          "before our new library is open today for all people who want to read").split()
+
+
+def make_message(n_words, seed):
+    rng = random.Random(seed)
+    words = [rng.choice(FILLER) for _ in range(n_words - 2)]
+    words += ["placement", "details"]   # the last branch of the old cascade
+    return " ".join(words)
+
+
+def bench_keyword_count():
+    """Cost per 20-word message as the keyword list grows."""
+    base = [kw for keywords in INTENT_KEYWORDS.values() for kw in keywords]
+    msgs = [make_message(20, seed) for seed in range(20)]
+    print(f"{'keywords':>9} {'substring us':>13} {'automaton us':>13} {'speedup':>8}")
+    for factor in (1, 4, 16, 64):
+        keywords = base + [f"synthetic{i} term{i}" for i in range(len(base) * (factor - 1))]
+        automaton = KeywordAutomaton([(kw, kw) for kw in keywords])
+        substring = min(timeit.repeat(
+            lambda: [[kw for kw in keywords if kw in m.lower()] for m in msgs], number=50, repeat=3))
+        fast = min(timeit.repeat(
+            lambda: [list(automaton.scan(tokenize(m))) for m in msgs], number=50, repeat=3))
+        per_sub = substring / (50 * len(msgs)) * 1e6
+        per_fast = fast / (50 * len(msgs)) * 1e6
+        print(f"{len(keywords):>9} {per_sub:>13.1f} {per_fast:>13.1f} {per_sub / per_fast:>7.1f}x")
+
+
+def main():
+    print("Per-message cost vs. message length (worst case: last branch matches)")
+    print(f"{'words':>6} {'legacy us':>10} {'automaton us':>13} {'speedup':>8}")
+    for n_words in (5, 20, 80, 320, 1280):
+        msgs = [make_message(n_words, seed) for seed in range(20)]
+        number = max(1, 2000 // n_words)
+        legacy = min(timeit.repeat(lambda: [legacy_intent(m) for m in msgs], number=number, repeat=3))
+        fast = min(timeit.repeat(lambda: [match_intent(m) for m in msgs], number=number, repeat=3))
+        per_legacy = legacy / (number * len(msgs)) * 1e6
+        per_fast = fast / (number * len(msgs)) * 1e6
+        print(f"{n_words:>6} {per_legacy:>10.1f} {per_fast:>13.1f} {per_legacy / per_fast:>7.1f}x")
+    print()
+    bench_keyword_count()
+
+
+if __name__ == "__main__":
+    main()
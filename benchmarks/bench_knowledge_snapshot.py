@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# Per-worker memory and time-to-ready: mmap knowledge snapshot vs. module + JSON
+#
+#   python build_knowledge.py && python benchmarks/bench_knowledge_snapshot.py [--workers 4]
+#
+# Starts N worker processes per mode. Each loads the knowledge base, touches
+# every value once (as help2 does when it renders its answer tables), reports
+# that it is ready, and waits until all workers are up before reading its RSS
+# and PSS from /proc, so pages shared between the live workers show up as a
+# lower PSS. "module" is the current approach (import knowledge_base.py and
+# json.load college_data.json in every worker).
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+WORKER = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+if sys.argv[1] == "snapshot":
+    from knowledge_snapshot import load_knowledge
+    knowledge, preloaded = load_knowledge()
+    assert preloaded is not None, "knowledge.bin missing or stale; run build_knowledge.py"
+    college_data = preloaded[1]
+else:
+    import knowledge_base
+    knowledge = {{name: getattr(knowledge_base, name) for name in knowledge_base.KNOWLEDGE_NAMES}}
+    with open({college_data!r}, encoding="utf-8") as f:
+        college_data = json.load(f)
+opened = time.perf_counter() - start
+
+def touch(value):
+    if isinstance(value, str):
+        return len(value)
+    if hasattr(value, "items"):
+        return sum(touch(item) for item in value.values())
+    if hasattr(value, "__len__"):
+        return sum(touch(item) for item in value)
+    return 0
+
+chars = touch(knowledge) + touch(college_data)
+ready = time.perf_counter() - start
+print("ready", flush=True)
+sys.stdin.readline()
+memory = {{}}
+with open("/proc/self/smaps_rollup") as f:
+    for line in f:
+        key, _, rest = line.partition(":")
+        if key in ("Rss", "Pss", "Private_Dirty"):
+            memory[key] = int(rest.split()[0])
+print(json.dumps({{"open_ms": opened * 1e3, "ready_ms": ready * 1e3, "chars": chars, **memory}}), flush=True)
+"""
+
+
+def run_mode(mode, workers):
+    code = WORKER.format(root=ROOT, college_data=os.path.join(ROOT, "college_data.json"))
+    spawned = time.perf_counter()
+    procs = [subprocess.Popen([sys.executable, "-c", code, mode], stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, text=True) for _ in range(workers)]
+    for proc in procs:
+        assert proc.stdout.readline().strip() == "ready"
+    all_ready = time.perf_counter() - spawned
+    results = []
+    for proc in procs:
+        proc.stdin.write("\n")
+        proc.stdin.flush()
+        results.append(json.loads(proc.stdout.readline()))
+        proc.wait()
+    return all_ready, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("needs Linux /proc/<pid>/smaps_rollup")
+
+    print(f"{'mode':<10}{'open ms':>10}{'load ms':>10}{'all ready ms':>14}{'RSS KiB':>10}{'PSS KiB':>10}{'dirty KiB':>11}")
+    for mode in ("module", "snapshot"):
+        all_ready, results = run_mode(mode, args.workers)
+        n = len(results)
+        print(f"{mode:<10}"
+              f"{sum(r['open_ms'] for r in results) / n:>10.2f}"
+              f"{sum(r['ready_ms'] for r in results) / n:>10.2f}"
+              f"{all_ready * 1e3:>14.0f}"
+              f"{sum(r['Rss'] for r in results) / n:>10.0f}"
+              f"{sum(r['Pss'] for r in results) / n:>10.0f}"
+              f"{sum(r['Private_Dirty'] for r in results) / n:>11.0f}")
+    print(f"(averages over {args.workers} concurrent workers; 'open ms' is loading only, 'load ms' adds touching every value)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Benchmark and agreement report: script/lexicon classifier vs. the old get_language
+#
+#   python benchmarks/bench_language_id.py
+#
+# Reads language_corpus.tsv (text<TAB>language). langdetect is seeded so the
+# legacy numbers are repeatable; unseeded it can disagree with itself.
+
+import csv
+import os
+import re
+import sys
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+
+from langdetect import DetectorFactory, LangDetectException, detect
+
+from language_id import AMBIGUOUS_BELOW, classify_language, detect_language
+
+DetectorFactory.seed = 0
+langdetect_calls = {"old": 0}
+
+
+def legacy_get_language(text):
+    """help2.get_language before the script/lexicon classifier."""
+    try:
+        hindi_chars = re.findall(r'[ऀ-ॿ]', text)
+        english_chars = re.findall(r'[a-zA-Z]', text)
+        hinglish_indicators = ["kaise", "kya", "kab", "kitna", "hai", "hoon", "main", "aap",
+                               "college", "admission", "fees", "batao", "bolo", "btao", "kya hai",
+                               "ke baare mein", "baare mein", "kaun hain"]
+        if hindi_chars and english_chars:
+            return 'hinglish'
+        elif any(word in text.lower() for word in hinglish_indicators):
+            return 'hinglish'
+        elif hindi_chars:
+            return 'hindi'
+        else:
+            langdetect_calls["old"] += 1
+            return 'hindi' if detect(text) == 'hi' else 'english'
+    except (LangDetectException, Exception):
+        return 'english'
+
+
+def load_corpus(path=os.path.join(ROOT, "language_corpus.tsv")):
+    with open(path, encoding="utf-8", newline="") as f:
+        return [(row["text"], row["language"]) for row in csv.DictReader(f, delimiter="\t")]
+
+
+def main():
+    corpus = load_corpus()
+    texts = [text for text, _ in corpus]
+
+    legacy = [legacy_get_language(t) for t in texts]
+    fast = [detect_language(t) for t in texts]
+    fallbacks = sum(1 for t in texts if classify_language(t)[1] < AMBIGUOUS_BELOW)
+
+    n = len(corpus)
+    agree = sum(a == b for a, b in zip(legacy, fast))
+    legacy_ok = sum(a == gold for a, (_, gold) in zip(legacy, corpus))
+    fast_ok = sum(a == gold for a, (_, gold) in zip(fast, corpus))
+    print(f"corpus: {n} messages")
+    print(f"agreement with old get_language: {agree}/{n} ({agree / n:.0%})")
+    print(f"accuracy vs. labels: old {legacy_ok / n:.0%}, new {fast_ok / n:.0%}")
+    print(f"messages needing a second detector: old {langdetect_calls['old']} (langdetect), "
+          f"new {fallbacks} (n-gram model, else langdetect)")
+
+    print("\ndisagreements (text | label | old | new):")
+    for (text, gold), old, new in zip(corpus, legacy, fast):
+        if old != new:
+            print(f"  {text!r} | {gold} | {old} | {new}")
+
+    number = 20
+    t_legacy = min(timeit.repeat(lambda: [legacy_get_language(t) for t in texts], number=number, repeat=3))
+    t_fast = min(timeit.repeat(lambda: [detect_language(t) for t in texts], number=number, repeat=3))
+    per_legacy = t_legacy / (number * n) * 1e6
+    per_fast = t_fast / (number * n) * 1e6
+    print(f"\nper message: old {per_legacy:.1f} us, new {per_fast:.1f} us ({per_legacy / per_fast:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
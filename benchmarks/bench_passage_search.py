@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Passage search latency as the corpus grows: in-memory BM25 vs. SQLite FTS5
+#
+#   python benchmarks/bench_passage_search.py [--scales 1 10 100] [--no-fts5]
+#
+# Scale 1 is today's knowledge base (knowledge_base.py + college_data.json).
+# Larger scales add synthetic passages: each real passage is replicated with
+# its words resampled from the corpus vocabulary (Zipf-like frequencies) plus
+# a few new terms, so both passage count and vocabulary grow.
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+
+import knowledge_base
+from bm25_index import PassageIndex
+from intent_matcher import tokenize
+from passage_store import PassageStore, fts5_available
+from passages import Passage, iter_passages
+
+QUERIES = [
+    ("is ragging allowed", "english"), ("library opening hours", "english"),
+    ("bus timing kya hai", "hinglish"), ("wheelchair access", "english"),
+    ("what is the uniform", "english"), ("welding section in workshop", "english"),
+    ("scholarship for students", "english"), ("hostel parking", "english"),
+    ("computer lab software", "english"), ("canteen food", "english"),
+]
+
+
+def real_passages():
+    with open(os.path.join(ROOT, "college_data.json"), encoding="utf-8") as f:
+        college_data = json.load(f)
+    knowledge = {name: getattr(knowledge_base, name) for name in knowledge_base.KNOWLEDGE_NAMES}
+    return list(iter_passages(college_data, knowledge))
+
+
+def synthetic_corpus(base, scale, seed=0):
+    rng = random.Random(seed)
+    vocabulary = sorted({w for p in base for w in tokenize(p.body)})
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    corpus = list(base)
+    for replica in range(1, scale):
+        for p in base:
+            n = max(5, len(tokenize(p.body)))
+            words = rng.choices(vocabulary, weights, k=n) + [f"x{replica}w{rng.randrange(5000)}" for _ in range(3)]
+            body = " ".join(words)
+            corpus.append(Passage(f"{p.id}#{replica}", p.language, p.title, body, body))
+    return corpus
+
+
+def time_queries(search, repeat):
+    samples = []
+    for _ in range(repeat):
+        for text, language in QUERIES:
+            start = time.perf_counter()
+            search(text, language)
+            samples.append(time.perf_counter() - start)
+    samples = np.array(samples) * 1e6
+    return np.median(samples), np.percentile(samples, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--no-fts5", action="store_true")
+    args = parser.parse_args()
+    use_fts5 = not args.no_fts5 and fts5_available()
+
+    base = real_passages()
+    print(f"{'scale':>6}{'passages':>10}{'bm25 build ms':>15}{'p50 us':>9}{'p99 us':>9}"
+          + (f"{'fts5 build ms':>15}{'p50 us':>9}{'p99 us':>9}" if use_fts5 else ""))
+    for scale in args.scales:
+        corpus = synthetic_corpus(base, scale)
+        start = time.perf_counter()
+        index = PassageIndex(corpus)
+        build = (time.perf_counter() - start) * 1e3
+        p50, p99 = time_queries(index.search, args.repeat)
+        row = f"{scale:>6}{len(corpus):>10}{build:>15.1f}{p50:>9.1f}{p99:>9.1f}"
+        if use_fts5:
+            with tempfile.TemporaryDirectory() as tmp:
+                store = PassageStore(os.path.join(tmp, "passages.sqlite3"))
+                start = time.perf_counter()
+                store.sync(corpus)
+                fts_build = (time.perf_counter() - start) * 1e3
+                fts_p50, fts_p99 = time_queries(store.search, args.repeat)
+            row += f"{fts_build:>15.1f}{fts_p50:>9.1f}{fts_p99:>9.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
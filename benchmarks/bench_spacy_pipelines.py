@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Startup / RSS / latency report: full spaCy pipelines vs. the pruned NER-only ones
+#
+#   python benchmarks/bench_spacy_pipelines.py
+#
+# Each configuration runs in a fresh interpreter so RSS and load time are not
+# polluted by the previous one. "pruned (cold)" builds the artifact directory,
+# "pruned (warm)" loads from it the way every later start does.
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+
+MESSAGES = [
+    "Hello",
+    "Fees kya hai?",
+    "Computer engineering ke baare mein batao",
+    "Who is the HOD of civil engineering in Arvi, Maharashtra?",
+    "Tell me about Prof. Nikhil Ekotkhane and the mechanical department",
+    "What is the admission process for 2025?",
+    "फीस कितनी है?",
+    "Placement details for TCS and Infosys",
+]
+
+
+def rss_mb():
+    """Resident set size of this process in MB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(mode):
+    """Load both pipelines in ``mode`` and print one JSON line of measurements."""
+    base_rss = rss_mb()
+    start = time.perf_counter()
+    from spacy_pipelines import load_pipeline
+    nlp_en = load_pipeline("en_core_web_sm", mode=mode)
+    nlp_multi = load_pipeline("xx_ent_wiki_sm", mode=mode)
+    load_s = time.perf_counter() - start
+    loaded_rss = rss_mb()
+
+    timings = []
+    for _ in range(20):
+        for text in MESSAGES:
+            for nlp in (nlp_en, nlp_multi):
+                t0 = time.perf_counter()
+                nlp(text.lower())
+                timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    print(json.dumps({
+        "load_s": load_s,
+        "rss_mb": loaded_rss,
+        "model_rss_mb": loaded_rss - base_rss,
+        "p50_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95)],
+        "pipes": {"en": nlp_en.pipe_names, "xx": nlp_multi.pipe_names},
+    }))
+
+
+def run(mode, model_dir):
+    env = dict(os.environ, CHATBOT_MODEL_DIR=model_dir)
+    out = subprocess.run([sys.executable, __file__, "--child", mode],
+                         env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as model_dir:
+        results = [
+            ("full", run("full", model_dir)),
+            ("pruned (cold)", run("pruned", model_dir)),
+            ("pruned (warm)", run("pruned", model_dir)),
+        ]
+    print(f"{'mode':<15} {'load s':>7} {'RSS MB':>7} {'models MB':>10} {'p50 ms':>7} {'p95 ms':>7}")
+    for name, r in results:
+        print(f"{name:<15} {r['load_s']:>7.2f} {r['rss_mb']:>7.1f} {r['model_rss_mb']:>10.1f} "
+              f"{r['p50_ms']:>7.2f} {r['p95_ms']:>7.2f}")
+    print()
+    for name, r in results:
+        print(f"{name:<15} en: {', '.join(r['pipes']['en'])} | xx: {', '.join(r['pipes']['xx'])}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,109 @@
+"""In-memory BM25 passage retrieval.
+
+The default search backend (CHATBOT_SEARCH_BACKEND=bm25). One index per
+language is built when college_data.json is loaded and lives in the data
+snapshot, so a reload swaps it together with the answer tables.
+
+The inverted index is stored CSR-style in three NumPy arrays: for term ``t``,
+``docs[offsets[t]:offsets[t + 1]]`` are the passages containing it and
+``weights[...]`` their complete BM25 term weights. IDF and the document
+length normalisation are folded into the weights at build time, so scoring a
+query is one scatter-add per query term followed by an argmax.
+"""
+from collections import Counter
+
+import numpy as np
+
+from intent_matcher import tokenize
+from passages import STOPWORDS, search_languages
+
+# The k1 and b FTS5's bm25() uses. The scores are still not on FTS5's scale:
+# IDF here is log(1 + (N - df + 0.5) / (df + 0.5)), which never goes
+# negative, and the title is weighted by repeating its terms rather than per
+# column, so each backend has its own minimum score (CHATBOT_BM25_MIN_SCORE).
+K1 = 1.2
+B = 0.75
+# Title words count this many times
+TITLE_WEIGHT = 2
+
+
+def _terms(text):
+    return [w for w in tokenize(text) if w not in STOPWORDS]
+
+
+class BM25Index:
+    """BM25 over one language's passages."""
+
+    def __init__(self, passages, k1=K1, b=B):
+        self.ids = []
+        self.answers = []
+        counts = []
+        for passage in passages:
+            self.ids.append(passage.id)
+            self.answers.append(passage.html)
+            counts.append(Counter(_terms(passage.body) + _terms(passage.title) * TITLE_WEIGHT))
+
+        n_docs = len(counts)
+        lengths = np.array([sum(c.values()) for c in counts], dtype=np.float32)
+        avg_length = float(lengths.mean()) if n_docs else 0.0
+        # Document length normalisation, precomputed once per passage
+        norms = k1 * (1 - b + b * lengths / max(avg_length, 1e-9))
+
+        postings = {}
+        for doc, term_counts in enumerate(counts):
+            for term, tf in term_counts.items():
+                postings.setdefault(term, []).append((doc, tf))
+
+        self.vocabulary = {}
+        offsets = [0]
+        docs, weights = [], []
+        for term, entries in postings.items():
+            self.vocabulary[term] = len(self.vocabulary)
+            df = len(entries)
+            idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc, tf in entries:
+                docs.append(doc)
+                weights.append(idf * tf * (k1 + 1) / (tf + norms[doc]))
+            offsets.append(len(docs))
+        self.offsets = offsets          # plain ints: cheaper to slice with than NumPy scalars
+        self.docs = np.array(docs, dtype=np.int32)
+        self.weights = np.array(weights, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, text, limit=1):
+        """Best ``[(passage_id, html, score)]`` for ``text``; higher scores are better."""
+        term_ids = {self.vocabulary[w] for w in _terms(text) if w in self.vocabulary}
+        if not term_ids:
+            return []
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for t in term_ids:
+            start, end = self.offsets[t], self.offsets[t + 1]
+            scores[self.docs[start:end]] += self.weights[start:end]
+        if limit == 1:
+            best = [int(scores.argmax())]
+        else:
+            best = np.argsort(-scores)[:limit].tolist()
+        return [(self.ids[d], self.answers[d], float(scores[d])) for d in best if scores[d] > 0]
+
+
+class PassageIndex:
+    """One BM25Index per language, searched like PassageStore."""
+
+    def __init__(self, passages):
+        by_language = {}
+        for passage in passages:
+            by_language.setdefault(passage.language, {})[passage.id] = passage
+        self.indexes = {lang: BM25Index(items.values()) for lang, items in by_language.items()}
+
+    def __len__(self):
+        return sum(len(index) for index in self.indexes.values())
+
+    def search(self, text, language, limit=1):
+        for lang in search_languages(language):
+            index = self.indexes.get(lang)
+            hits = index.search(text, limit) if index is not None else []
+            if hits:
+                return hits
+        return []
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Compile the knowledge base into the memory-mapped snapshot help2 loads
+#
+#   python build_knowledge.py [--output knowledge.bin]
+#
+# Packs the dictionaries of knowledge_base.py and college_data.json into one
+# binary file (string table + records, see knowledge_snapshot.py). The file
+# records the mtime and size of both sources; if either changes afterwards
+# the server ignores the snapshot and falls back to importing/parsing them,
+# so rerun this after every edit.
+
+import argparse
+import json
+import os
+import time
+
+import knowledge_base
+from knowledge_snapshot import ROOT, SNAPSHOT_PATH, KnowledgeSnapshot, compile_knowledge, file_signature
+
+COLLEGE_DATA_PATH = os.path.join(ROOT, "college_data.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the knowledge base into the memory-mapped knowledge.bin")
+    parser.add_argument("--output", default=SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    college_data = {}
+    if os.path.exists(COLLEGE_DATA_PATH):
+        with open(COLLEGE_DATA_PATH, "r", encoding="utf-8") as f:
+            college_data = json.load(f)
+    sources = {"knowledge_base.py": file_signature(knowledge_base.__file__)}
+    if college_data:
+        sources["college_data.json"] = file_signature(COLLEGE_DATA_PATH)
+
+    start = time.perf_counter()
+    size = compile_knowledge({
+        "sources": sources,
+        "knowledge": {name: getattr(knowledge_base, name) for name in knowledge_base.KNOWLEDGE_NAMES},
+        "college_data": college_data,
+    }, args.output)
+    print(f"Wrote {args.output}: {size / 1024:.1f} KiB in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    # Round trip check: every value must read back unchanged
+    root = KnowledgeSnapshot(args.output).root
+    for name in knowledge_base.KNOWLEDGE_NAMES:
+        assert json.dumps(getattr(knowledge_base, name)) == json.dumps(_plain(root["knowledge"][name])), name
+    assert json.dumps(college_data) == json.dumps(_plain(root["college_data"]))
+    print(f"Verified {len(knowledge_base.KNOWLEDGE_NAMES)} knowledge entries and college_data.json")
+
+
+def _plain(value):
+    if isinstance(value, str):
+        return value
+    if hasattr(value, "items"):
+        return {key: _plain(item) for key, item in value.items()}
+    if hasattr(value, "__len__"):
+        return [_plain(item) for item in value]
+    return value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Registry of UI button commands that bypass the NLP pipeline.
+
+The HTML the bot sends back contains buttons with fixed payloads, e.g.
+``sendButtonMessage('civil faculty')``. Each payload is registered under an
+opaque action ID (``faculty.civil``) together with its precomputed answer.
+Commands are indexed by their cache fingerprint, so a click resolves with one
+normalization and one dict lookup: no language detection, classifier or NER.
+"""
+from types import MappingProxyType
+
+from response_cache import fingerprint
+
+
+class ActionRegistry:
+    """Action ID -> answer, plus canonical command text -> action ID."""
+
+    def __init__(self):
+        self._answers = {}
+        self._commands = {}
+
+    def register(self, action_id, answer, *commands):
+        """Register ``answer`` under ``action_id`` and the UI strings that send it."""
+        if action_id in self._answers:
+            raise ValueError(f"Duplicate button action {action_id!r}")
+        self._answers[action_id] = answer
+        for command in commands:
+            key = fingerprint(command)
+            owner = self._commands.setdefault(key, action_id)
+            if owner != action_id:
+                raise ValueError(f"Button command {command!r} already maps to {owner!r}")
+
+    def freeze(self):
+        """Make the registry read-only once every action is registered."""
+        self._answers = MappingProxyType(self._answers)
+        self._commands = MappingProxyType(self._commands)
+        return self
+
+    def answer(self, action_id):
+        """Answer for an opaque action ID, or None."""
+        return self._answers.get(action_id)
+
+    def match(self, key):
+        """``(action_id, answer)`` for a fingerprinted message, or None."""
+        action_id = self._commands.get(key)
+        if action_id is None:
+            return None
+        return action_id, self._answers[action_id]
+
+    def actions(self):
+        return list(self._answers)
+
+    def __len__(self):
+        return len(self._answers)
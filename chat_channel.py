@@ -0,0 +1,98 @@
+"""Long-lived chat connections: many messages over one WebSocket.
+
+Each client message is a JSON object with an ``id`` chosen by the client and
+the same fields as a /get_response form (``user_message`` or ``action``,
+optionally ``format``). Every reply carries the ``id`` it answers, so a
+client may send several messages without waiting.
+
+A reader thread receives messages into a bounded queue and the connection's
+own thread answers them in order. When ``max_pending`` messages are already
+waiting, further ones are refused at once with ``{"id": ..., "error":
+"busy"}`` instead of piling up (backpressure). A connection that sends
+nothing for ``idle_timeout`` seconds is told so and closed.
+
+Only ``receive(timeout)``, ``send(text)`` and ``close()`` are used on the
+socket, which is what flask-sock's WebSocket provides.
+"""
+import json
+import os
+import queue
+import threading
+
+MAX_PENDING = int(os.environ.get("CHATBOT_WS_MAX_PENDING", "8"))
+IDLE_TIMEOUT = float(os.environ.get("CHATBOT_WS_IDLE_TIMEOUT", "300"))
+# Longest accepted client message, in characters
+MAX_MESSAGE_SIZE = 4096
+
+_CLOSE = object()
+
+
+class ChatChannel:
+    """Serve one client connection with ``handle(message) -> reply dict``."""
+
+    def __init__(self, ws, handle, max_pending=MAX_PENDING, idle_timeout=IDLE_TIMEOUT):
+        self.ws = ws
+        self.handle = handle
+        self.idle_timeout = idle_timeout
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._send_lock = threading.Lock()
+
+    def send(self, data):
+        with self._send_lock:
+            self.ws.send(json.dumps(data, ensure_ascii=False))
+
+    def serve(self):
+        """Answer messages until the client leaves or idles out."""
+        reader = threading.Thread(target=self._read, name="chat-reader", daemon=True)
+        reader.start()
+        try:
+            while True:
+                message = self._pending.get()
+                if message is _CLOSE:
+                    break
+                try:
+                    reply = self.handle(message)
+                except Exception as e:
+                    print(f"Error in chat channel: {e}")
+                    reply = {"error": "internal"}
+                self.send({"id": message["id"], **reply})
+        except Exception as e:
+            # The client went away while we were answering
+            print(f"Chat connection closed: {e}")
+        finally:
+            self.ws.close()
+
+    def _read(self):
+        try:
+            while True:
+                raw = self.ws.receive(timeout=self.idle_timeout)
+                if raw is None:
+                    self.send({"event": "idle_timeout", "timeout": self.idle_timeout})
+                    break
+                message = self._parse(raw)
+                if message is None:
+                    continue
+                try:
+                    self._pending.put_nowait(message)
+                except queue.Full:
+                    self.send({"id": message["id"], "error": "busy"})
+        except Exception:
+            pass                        # closed by the client or the server
+        # Unblocks serve() even when the queue is full
+        self._pending.put(_CLOSE)
+
+    def _parse(self, raw):
+        """The message as a dict with an id, or None after replying with an error."""
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", "replace")
+        if len(raw) > MAX_MESSAGE_SIZE:
+            self.send({"id": None, "error": "too_large"})
+            return None
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            message = None
+        if not isinstance(message, dict) or "id" not in message:
+            self.send({"id": None, "error": "invalid"})
+            return None
+        return message
@@ -0,0 +1,184 @@
+"""Hot reload of college_data.json through immutable snapshots.
+
+A snapshot is the parsed data plus every table derived from it, built by a
+caller-supplied function. Request handlers read ``reloader.current`` once and
+use that object for the whole request; a reload parses, validates and builds
+the next snapshot on the watcher thread and then replaces the reference in
+one assignment, so in-flight requests finish on the snapshot they started
+with and nothing on the request path ever waits for a reload.
+
+Changes are picked up through watchdog (inotify on Linux) when it is
+installed, otherwise by polling the file's mtime and size.
+"""
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+
+from knowledge_records import load_faculty
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Top-level keys of college_data.json and the type each must have. Abstract
+# types, so the read-only views of knowledge.bin pass as well as parsed JSON.
+REQUIRED_KEYS = {
+    "college_name": str,
+    "departments": Sequence,
+    "leadership_info": Mapping,
+    "department_details": Mapping,
+    "faculty_data": Mapping,
+    "english_responses": Mapping,
+    "hindi_responses": Mapping,
+    "hinglish_responses": Mapping,
+}
+TYPE_NAMES = {str: "a string", Sequence: "a list", Mapping: "an object"}
+
+Snapshot = namedtuple("Snapshot", ["version", "loaded_at", "signature", "college_data", "tables"])
+
+
+class InvalidCollegeData(ValueError):
+    """college_data.json parsed but does not have the expected shape."""
+
+
+def validate_college_data(data):
+    if not isinstance(data, Mapping):
+        raise InvalidCollegeData("top level must be a JSON object")
+    for key, expected in REQUIRED_KEYS.items():
+        if key not in data:
+            raise InvalidCollegeData(f"missing key {key!r}")
+        value = data[key]
+        if not isinstance(value, expected) or (expected is Sequence and isinstance(value, str)):
+            raise InvalidCollegeData(f"{key!r} must be {TYPE_NAMES[expected]}")
+    load_faculty(data["faculty_data"])      # raises InvalidRecord for a malformed entry
+    return data
+
+
+def freeze(value):
+    """Read-only copy of parsed JSON: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class SnapshotReloader:
+    """Holds the current snapshot and swaps in a new one when the file changes.
+
+    ``build(college_data)`` returns the derived tables (any object) for a
+    frozen copy of the data. ``on_swap(snapshot)`` runs after every swap.
+    ``preloaded`` is an optional ``(signature, data)`` already parsed
+    elsewhere (the mmap knowledge snapshot); it is used for the first
+    snapshot when the file still has that signature.
+    """
+
+    def __init__(self, path, build, interval=2.0, on_swap=None, preloaded=None):
+        self.path = path
+        self.build = build
+        self.interval = interval
+        self.on_swap = on_swap
+        self.reloads = self.failures = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+        self._rejected = None       # signature of the last file that failed to load
+        signature = _file_signature(path)
+        if preloaded is not None and preloaded[0] == signature:
+            # Compiled from the same file, but checked the same way as a fresh parse
+            data = validate_college_data(preloaded[1])
+            self.current = Snapshot(1, time.time(), signature, data, build(data))
+        else:
+            self.current = self._load(signature, version=1)
+
+    def _load(self, signature, version):
+        if signature is None:
+            print(f"Warning: {self.path} not found.")
+            data = freeze({})
+        else:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = freeze(validate_college_data(json.load(f)))
+        return Snapshot(version, time.time(), signature, data, self.build(data))
+
+    def reload(self, force=False):
+        """Rebuild and swap if the file changed; return True when swapped.
+
+        A file that fails to parse or validate is reported and the current
+        snapshot stays in place.
+        """
+        with self._lock:
+            signature = _file_signature(self.path)
+            if not force and signature in (self.current.signature, self._rejected):
+                return False
+            try:
+                snapshot = self._load(signature, self.current.version + 1)
+            except (OSError, ValueError) as e:
+                # json.JSONDecodeError and InvalidCollegeData are ValueErrors
+                self.failures += 1
+                self._rejected = signature
+                print(f"Warning: keeping college data v{self.current.version}, reload failed: {e}")
+                return False
+            self.current = snapshot
+            self.reloads += 1
+        print(f"College data reloaded (v{snapshot.version})")
+        if self.on_swap is not None:
+            self.on_swap(snapshot)
+        return True
+
+    def start(self):
+        """Watch the file on a daemon thread (watchdog if available, else polling)."""
+        if self._thread is not None or self.interval <= 0:
+            return self
+        if Observer is not None:
+            self._start_observer()
+        self._thread = threading.Thread(target=self._poll, name="college-data-reloader", daemon=True)
+        self._thread.start()
+        return self
+
+    def _start_observer(self):
+        reloader = self
+        target = os.path.abspath(self.path)
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = (getattr(event, "src_path", None), getattr(event, "dest_path", None))
+                if target in paths:
+                    reloader.reload()
+
+        self._observer = Observer()
+        self._observer.schedule(Handler(), os.path.dirname(target), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def _poll(self):
+        # With watchdog running this is only a safety net for missed events
+        interval = self.interval * 10 if self._observer is not None else self.interval
+        while not self._stop.wait(interval):
+            self.reload()
+
+    def stop(self):
+        """Stop watching; ``start`` may be called again, e.g. in a forked worker."""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._stop = threading.Event()
@@ -0,0 +1,85 @@
+"""Content-Encoding negotiation and cached compressed bodies.
+
+Answers are mostly large, repetitive HTML that compresses 5-10x. Bodies are
+compressed once and kept in a ResponseCache keyed by their digest, so a
+repeated answer is served from the cache instead of being compressed again.
+Brotli is used when the ``brotli`` package is installed and the client
+accepts it; gzip otherwise.
+"""
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from response_cache import ResponseCache
+
+# Bodies smaller than this are not worth compressing
+MIN_SIZE = 512
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+def _accepted(header):
+    """{coding: q} of an Accept-Encoding header"""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate(accept_encoding):
+    """Best coding we can produce for an Accept-Encoding header, or None for identity"""
+    accepted = _accepted(accept_encoding or "")
+    offered = ("br", "gzip") if brotli is not None else ("gzip",)
+    best = None
+    for coding in offered:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > 0 and (best is None or q > best[1]):
+            best = (coding, q)
+    return best[0] if best else None
+
+
+def body_digest(body):
+    return hashlib.blake2b(body, digest_size=12).hexdigest()
+
+
+def compress(body, coding):
+    if coding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if coding == "gzip":
+        # mtime=0 keeps the output, and so its ETag, stable
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content coding {coding!r}")
+
+
+class CompressedBodies:
+    """Compressed bodies by (digest, coding), bounded like the response cache."""
+
+    def __init__(self, max_entries=1024, max_bytes=8 * 1024 * 1024):
+        self._cache = ResponseCache(max_entries=max_entries, max_bytes=max_bytes, ttl=float("inf"))
+
+    def get(self, body, coding, digest=None):
+        key = (digest or body_digest(body), coding)
+        compressed = self._cache.get(key)
+        if compressed is None:
+            compressed = compress(body, coding)
+            self._cache.put(key, compressed)
+        return compressed
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,266 @@
+"""Faculty directory search.
+
+Finds faculty members by name, position, qualification and department
+instead of listing a whole department. Names are held in a prefix trie over
+their words ("ghant" finds Prof.Priti D.Ghantewar); positions, qualifications
+and departments in inverted indexes. Every index maps to sets of positions in
+``members``, so a search is a few set intersections and results always come
+back in listing order.
+
+Listings are delivered a page at a time. A cursor names the query and the
+offset of the next page in plain text ("4:civil:::" is the second page of the
+civil listing), so it can travel in a chat command as well as a URL.
+"""
+import os
+import re
+from collections import namedtuple
+
+from intent_matcher import tokenize
+from passages import STOPWORDS
+
+# Honorifics stripped from names; in a message they mark the next word as a name
+HONORIFICS = frozenset({"prof", "professor", "dr", "mr", "mrs", "ms", "miss", "sir", "madam", "mam", "maam"})
+
+# Message words -> position index keys. "professor" alone is every member.
+POSITION_WORDS = {
+    "hod": "hod",
+    "hods": "hod",
+    "head": "hod",
+    "associate": "associate",
+    "assistant": "assistant",
+}
+# Message words -> qualification index keys. "be" and "me" are left out: in
+# a message they are nearly always ordinary words.
+QUALIFICATION_WORDS = {
+    "phd": "phd",
+    "doctorate": "phd",
+    "mtech": "mtech",
+    "msc": "msc",
+    "btech": "be",
+}
+
+# Confidence reported for a message answered from the directory
+DIRECTORY_CONFIDENCE = 0.9
+# Shortest message word used as a name prefix
+MIN_PREFIX = 3
+# Faculty cards per page of a listing
+PAGE_SIZE = int(os.environ.get("CHATBOT_FACULTY_PAGE_SIZE", "4"))
+
+FacultyQuery = namedtuple("FacultyQuery", ["names", "positions", "qualifications", "department"])
+
+_DOTTED = re.compile(r"(?<=\w)\.(?=\w)")
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_CURSOR_FIELD = re.compile(r"[a-z0-9()+]*")
+
+
+def _normalize(text):
+    """Lower-case, with dots inside abbreviations removed: "Ph.D" -> "phd"."""
+    return _DOTTED.sub("", text.lower())
+
+
+def name_words(name):
+    """Words of a faculty name without honorifics and initials."""
+    return [w for w in tokenize(name.replace(".", " ")) if len(w) > 1 and w not in HONORIFICS]
+
+
+def position_keys(position):
+    """Index keys of a position: "H.O.D. (Civil)" -> {"hod"}."""
+    text = _PARENTHESES.sub(" ", _normalize(position)).replace("head of department", "hod")
+    return set(tokenize(text))
+
+
+def qualification_keys(education):
+    """Index keys of a qualification list: "Ph.D(A), M.Tech" -> {"phd(a)", "mtech"}.
+
+    A degree that is still awaited keeps its "(a)" marker, so it does not
+    count as the completed degree.
+    """
+    keys = set()
+    for degree in _normalize(education).split(","):
+        degree = degree.strip()
+        if degree.endswith("(a)"):
+            keys.add(degree.replace(" ", ""))
+        else:
+            keys.update(tokenize(_PARENTHESES.sub(" ", degree))[:1])
+    return keys
+
+
+def department_query(department):
+    """The FacultyQuery listing a whole department."""
+    return FacultyQuery((), (), (), department)
+
+
+def encode_cursor(query, offset):
+    """Cursor of the page of ``query`` starting at ``offset``."""
+    return ":".join([str(offset), query.department or "",
+                     "+".join(query.positions), "+".join(query.qualifications), "+".join(query.names)])
+
+
+def _split(field):
+    return tuple(field.split("+")) if field else ()
+
+
+def decode_cursor(cursor):
+    """(FacultyQuery, offset) of a cursor; ValueError if it is malformed."""
+    fields = cursor.strip().split(":")
+    if len(fields) != 5 or not fields[0].isdigit() or not all(_CURSOR_FIELD.fullmatch(f) for f in fields[1:]):
+        raise ValueError(f"invalid faculty cursor: {cursor!r}")
+    offset, department, positions, qualifications, names = fields
+    return FacultyQuery(_split(names), _split(positions), _split(qualifications), department or None), int(offset)
+
+
+class PrefixTrie:
+    """Words -> ids, searchable by prefix.
+
+    Every node keeps the ids of all words below it, so a prefix lookup is a
+    walk of ``len(prefix)`` nodes.
+    """
+
+    def __init__(self):
+        self._root = ({}, set())
+
+    def insert(self, word, item):
+        node = self._root
+        node[1].add(item)
+        for ch in word:
+            node = node[0].setdefault(ch, ({}, set()))
+            node[1].add(item)
+
+    def prefix(self, prefix):
+        node = self._root
+        for ch in prefix:
+            node = node[0].get(ch)
+            if node is None:
+                return set()
+        return node[1]
+
+
+class FacultyDirectory:
+    """Searchable index over the Faculty records of every department."""
+
+    def __init__(self, departments, ignore_names=()):
+        self.members = []
+        self.names = PrefixTrie()
+        self.positions = {}
+        self.qualifications = {}
+        self.departments = {}
+        self._name_words = set()
+        self._ignore_names = frozenset(ignore_names)
+        for department in departments.values():
+            for member in department.faculty:
+                i = len(self.members)
+                self.members.append(member)
+                for word in name_words(member.name):
+                    self.names.insert(word, i)
+                    self._name_words.add(word)
+                for key in position_keys(member.position):
+                    self.positions.setdefault(key, set()).add(i)
+                for key in qualification_keys(member.education):
+                    self.qualifications.setdefault(key, set()).add(i)
+                self.departments.setdefault(member.department, set()).add(i)
+
+    def __len__(self):
+        return len(self.members)
+
+    def _name_ids(self, words):
+        """Members matching the most of ``words`` as name prefixes."""
+        hits = {}
+        for word in words:
+            for i in self.names.prefix(word):
+                hits[i] = hits.get(i, 0) + 1
+        if not hits:
+            return set()
+        best = max(hits.values())
+        return {i for i, n in hits.items() if n == best}
+
+    def search(self, name="", position="", qualification="", department=""):
+        """Members matching every given criterion, in listing order."""
+        selected = None
+        criteria = []
+        if name:
+            criteria.append(self._name_ids(name_words(name)))
+        if position:
+            criteria.append(self.positions.get(POSITION_WORDS.get(position, position), set()))
+        if qualification:
+            key = _normalize(qualification).replace(" ", "")
+            criteria.append(self.qualifications.get(QUALIFICATION_WORDS.get(key, key), set()))
+        if department:
+            criteria.append(self.departments.get(department, set()))
+        for ids in criteria:
+            selected = ids if selected is None else selected & ids
+        if selected is None:
+            selected = range(len(self.members))
+        return [self.members[i] for i in sorted(selected)]
+
+    def parse(self, text, department=None, faculty_context=False):
+        """The FacultyQuery a chat message asks, or None if it names no criterion.
+
+        Name words are recognised when they are a whole name word, or a prefix
+        of one (at least MIN_PREFIX letters) in a message that is about
+        faculty (``faculty_context``, an honorific, a position or a
+        qualification). Outside ``faculty_context`` a position or qualification
+        alone is no query: "mtech courses" asks about courses, not staff.
+        """
+        words = tokenize(_normalize(text))
+        positions = [POSITION_WORDS[w] for w in words if w in POSITION_WORDS]
+        qualifications = [QUALIFICATION_WORDS[w] for w in words if w in QUALIFICATION_WORDS]
+        honorific = any(w in HONORIFICS for w in words)
+        about_faculty = faculty_context or positions or qualifications or honorific
+        names = []
+        for word in words:
+            if word in HONORIFICS or word in POSITION_WORDS or word in QUALIFICATION_WORDS:
+                continue
+            if word in STOPWORDS or word in self._ignore_names:
+                continue
+            if word in self._name_words or (about_faculty and len(word) >= MIN_PREFIX
+                                            and self.names.prefix(word)):
+                names.append(word)
+        if not (names or positions or qualifications):
+            return None
+        if not (faculty_context or names or honorific):
+            return None
+        return FacultyQuery(tuple(names), tuple(positions), tuple(qualifications), department)
+
+    def _listing(self, ids, unique):
+        members = [self.members[i] for i in sorted(ids)]
+        if not unique:
+            return members
+        seen = set()
+        return [m for m in members if not (m.name in seen or seen.add(m.name))]
+
+    def answer(self, query):
+        """Members for a parsed query.
+
+        A named member is the answer whatever else is asked ("is Prof. Sapane
+        a PhD" shows Prof. Sapane's card); otherwise the position and
+        qualification words filter the department, or everyone. Without a
+        department, someone listed in two departments is answered once.
+        """
+        if query.names:
+            selected = self._name_ids(query.names)
+            if query.department:
+                in_department = selected & self.departments.get(query.department, set())
+                selected = in_department or selected
+            return self._listing(selected, unique=not query.department)
+        selected = set(range(len(self.members)))
+        for key in query.positions:
+            selected &= self.positions.get(key, set())
+        for key in query.qualifications:
+            selected &= self.qualifications.get(key, set())
+        if query.department:
+            selected &= self.departments.get(query.department, set())
+        return self._listing(selected, unique=not query.department)
+
+    def page(self, query, offset=0, size=PAGE_SIZE):
+        """(members, next_cursor) of one page of a query; next_cursor is None on the last page.
+
+        ValueError for an unknown department or an offset past the listing,
+        which no cursor from this directory can carry.
+        """
+        if query.department is not None and query.department not in self.departments:
+            raise ValueError(f"unknown department: {query.department!r}")
+        members = self.answer(query)
+        if offset and offset >= len(members):
+            raise ValueError(f"offset {offset} is past the {len(members)} members")
+        end = offset + size
+        return members[offset:end], (encode_cursor(query, end) if end < len(members) else None)
@@ -0,0 +1,175 @@
+"""Topic rules for messages the intent stage does not recognise.
+
+This replaces the hand-written ``elif`` chain at the end of get_response. Each
+rule is data: the terms that trigger a topic, the answer path it leads to,
+a priority, and optional subtopics (tried in order) that refine the path.
+
+A term is a token (``"bus"``), a prefix ending in ``*`` (``"ragg*"`` for
+ragging/ragged), a phrase (``"special need*"``), or a tuple of terms that must
+all occur (``("admission*", "contact*")``). Every term of every rule is
+compiled into one index, so a message is tokenized and scanned once no matter
+how many topics exist; the matching topic with the lowest priority wins.
+"""
+from intent_matcher import tokenize
+
+# Confidence reported for a message answered by a topic rule
+TOPIC_CONFIDENCE = 0.9
+
+# Topics, lowest priority first. Paths name entries of the answer maps built
+# by help2 ("topic" or "topic.subtopic").
+RULES = [
+    {"priority": 10, "path": "greeting", "when": ["hi", "hii", "hello", "hey", "namaste"]},
+    {"priority": 20, "path": "departments", "when": ["department*", "branch*"]},
+    {"priority": 30, "path": "courses", "when": ["course*", "program*"]},
+    {"priority": 35, "path": "leadership.admission",
+     "when": [("admission*", "contact*"), ("admission*", "number*")]},
+    {"priority": 40, "path": "admission", "when": ["date*", "when", "admission*"]},
+    {"priority": 45, "path": "leadership.contact",
+     "when": [("contact*", "college*"), ("contact*", "email*")]},
+    {"priority": 50, "path": "contact", "when": ["contact*", "phone*", "email*"]},
+    {"priority": 60, "path": "faculty.default", "when": ["faculty", "faculties", "professor*", "teacher*"],
+     "subtopics": [
+         (["civil"], "faculty.civil"),
+         (["mechanical"], "faculty.mechanical"),
+         (["electrical"], "faculty.electrical"),
+         (["computer*", "cse"], "faculty.computer"),
+         (["information technology", "it"], "faculty.it"),
+     ]},
+    {"priority": 70, "path": "leadership.president", "when": ["president"]},
+    {"priority": 71, "path": "leadership.principal", "when": ["principal"]},
+    {"priority": 72, "path": "leadership.director", "when": ["director"]},
+    {"priority": 73, "path": "leadership.address", "when": ["address*"]},
+    {"priority": 74, "path": "leadership.default",
+     "when": [("college*", "about"), ("college*", "info*")]},
+    {"priority": 80, "path": "discipline.default", "when": ["discipline*", "rule*", "regulation*"],
+     "subtopics": [
+         (["attend*"], "discipline.attendance"),
+         (["ragg*"], "discipline.ragging"),
+         (["anti*", "social*"], "discipline.anti_social"),
+         (["uniform*", "dress*"], "discipline.uniform"),
+         (["library*"], "discipline.library"),
+         (["behav*"], "discipline.behavior"),
+         (["schedule*", "time*"], "discipline.schedule"),
+         (["conduct*"], "discipline.conduct"),
+         (["general*", "code*"], "discipline.general"),
+         (["all", "complete*"], "discipline.full"),
+     ]},
+    {"priority": 90, "path": "transportation.default", "when": ["transport*", "bus", "buses"],
+     "subtopics": [
+         (["feature*"], "transportation.features"),
+         (["schedule*", "time*"], "transportation.schedule"),
+     ]},
+    {"priority": 100, "path": "workshop.default", "when": ["workshop*"],
+     "subtopics": [
+         (["fitting*"], "workshop.fitting"),
+         (["carpent*"], "workshop.carpentry"),
+         (["weld*"], "workshop.welding"),
+     ]},
+    {"priority": 110, "path": "computer.default", "when": ["computer*", "lab", "labs"],
+     "subtopics": [
+         (["feature*"], "computer.features"),
+         (["resource*"], "computer.resources"),
+     ]},
+    {"priority": 120, "path": "library.default", "when": ["library*", "libraries"],
+     "subtopics": [
+         (["service*"], "library.services"),
+         (["facilit*"], "library.facilities"),
+     ]},
+    {"priority": 130, "path": "fees.main", "when": ["fee*", "payment*", "scholarship*"],
+     "subtopics": [
+         (["payment*", "pay"], "fees.payment"),
+         (["scholarship*"], "fees.scholarship"),
+     ]},
+    {"priority": 140, "path": "disability.default", "when": ["disab*", "accessib*", "special need*"],
+     "subtopics": [
+         (["support*", "service*"], "disability.support"),
+         (["physical*", "ramp*", "wheelchair*"], "disability.access"),
+         (["learn*", "exam*", "software*"], "disability.learning"),
+         (["campus*", "hostel*", "parking*"], "disability.campus"),
+         (["contact*", "help*", "assist*"], "disability.contact"),
+     ]},
+]
+
+
+def _parse_term(term):
+    """'special need*' -> (('special', False), ('need', True))"""
+    parts = []
+    for word in term.split():
+        if word.endswith("*"):
+            parts.append((word[:-1], True))
+        else:
+            parts.append((word, False))
+    return tuple(parts)
+
+
+class RuleEngine:
+    """All rule terms compiled into one token index."""
+
+    def __init__(self, rules=RULES):
+        self._terms = {}            # parsed term -> term id
+        self._parsed = []           # term id -> parsed term
+        self._exact = {}            # first token -> [term id]
+        self._prefix = {}           # first-token prefix -> [term id]
+        self._term_clauses = []     # term id -> [clause id]
+        self._clause_sizes = []     # clause id -> number of distinct terms required
+        self._clause_owner = []     # clause id -> (topic priority, subtopic order, path)
+        for rule in sorted(rules, key=lambda r: r["priority"]):
+            self._add_owner(rule["when"], (rule["priority"], -1, rule["path"]))
+            for order, (when, path) in enumerate(rule.get("subtopics", ())):
+                self._add_owner(when, (rule["priority"], order, path))
+        self._prefix_lengths = sorted({len(p) for p in self._prefix})
+
+    def _term_id(self, term):
+        parsed = _parse_term(term)
+        if parsed not in self._terms:
+            term_id = len(self._parsed)
+            self._terms[parsed] = term_id
+            self._parsed.append(parsed)
+            self._term_clauses.append([])
+            word, is_prefix = parsed[0]
+            (self._prefix if is_prefix else self._exact).setdefault(word, []).append(term_id)
+        return self._terms[parsed]
+
+    def _add_owner(self, when, owner):
+        for clause in when:
+            terms = clause if isinstance(clause, tuple) else (clause,)
+            term_ids = {self._term_id(term) for term in terms}
+            clause_id = len(self._clause_sizes)
+            self._clause_sizes.append(len(term_ids))
+            self._clause_owner.append(owner)
+            for term_id in term_ids:
+                self._term_clauses[term_id].append(clause_id)
+
+    def _candidates(self, token):
+        found = self._exact.get(token, [])
+        for length in self._prefix_lengths:
+            if length > len(token):
+                break
+            found = found + self._prefix.get(token[:length], [])
+        return found
+
+    def matched_terms(self, tokens):
+        """Ids of every term occurring in ``tokens`` (one pass)."""
+        matched = set()
+        for i, token in enumerate(tokens):
+            for term_id in self._candidates(token):
+                rest = self._parsed[term_id][1:]
+                if all(i + 1 + j < len(tokens) and
+                       (tokens[i + 1 + j].startswith(word) if is_prefix else tokens[i + 1 + j] == word)
+                       for j, (word, is_prefix) in enumerate(rest)):
+                    matched.add(term_id)
+        return matched
+
+    def match(self, text):
+        """Answer path for ``text``, or None when no topic applies."""
+        counts = {}
+        for term_id in self.matched_terms(tokenize(text)):
+            for clause_id in self._term_clauses[term_id]:
+                counts[clause_id] = counts.get(clause_id, 0) + 1
+        owners = [self._clause_owner[c] for c, n in counts.items() if n == self._clause_sizes[c]]
+        topics = [priority for priority, order, _ in owners if order < 0]
+        if not topics:
+            return None
+        topic = min(topics)
+        refined = [(order, path) for priority, order, path in owners if priority == topic]
+        return min(refined, key=lambda owner: (owner[0] < 0, owner[0]))[1]
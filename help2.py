@@ -1,209 +1,191 @@
-from flask import Flask, render_template, request, jsonify
-import random
-import spacy
-from langdetect import detect, LangDetectException
+from flask import Flask, Response, render_template, request, jsonify, g
 import json
-import re
+import random
+from types import MappingProxyType
+from spacy_pipelines import load_pipeline
+import os
+from intent_matcher import INTENT_CONFIDENCE, match_intent, tokenize
+from language_id import detect_language
+from response_table import build_response_table, lookup
+from response_cache import ResponseCache, fingerprint
+from button_actions import ActionRegistry
+from fallback_rules import TOPIC_CONFIDENCE, RuleEngine
+from college_snapshot import SnapshotReloader
+from knowledge_snapshot import load_knowledge
+from knowledge_records import load_records
+from passages import iter_passages
+from passage_store import PassageStore, fts5_available
+from bm25_index import PassageIndex
+from chat_channel import ChatChannel
+from pipe_batcher import PipeBatcher
+from compression import MIN_SIZE as COMPRESS_MIN_SIZE, CompressedBodies, body_digest, negotiate
+from answer_templates import AnswerTemplates
+from response_blocks import ButtonSets, blocks_of, compose, faculty_list, fee_table, parts_of
+from faculty_directory import DIRECTORY_CONFIDENCE, FacultyDirectory, decode_cursor, department_query
 
-# Load spaCy models
 try:
-    nlp_en = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' model...")
-    from spacy.cli import download
-    download("en_core_web_sm")
-    nlp_en = spacy.load("en_core_web_sm")
+    from flask_sock import Sock
+except ImportError:
+    Sock = None                             # no /chat WebSocket without flask-sock
 
 try:
-    nlp_multi = spacy.load("xx_ent_wiki_sm")
-except OSError:
-    print("Downloading 'xx_ent_wiki_sm' model...")
-    from spacy.cli import download
-    download("xx_ent_wiki_sm")
-    nlp_multi = spacy.load("xx_ent_wiki_sm")
-
-# Load college data
-try:
-    with open('college_data.json', 'r', encoding='utf-8') as f:
-        college_data = json.load(f)
-    print("College data loaded successfully!")
-except FileNotFoundError:
-    print("Warning: college_data.json not found.")
-    college_data = {}
+    from intent_classifier import load_model as load_intent_model
+    intent_model = load_intent_model()      # None until `python train_model.py` has run
+except ImportError:
+    intent_model = None
+
+# Load spaCy models (NER-only unless CHATBOT_SPACY_MODE=full)
+nlp_en = load_pipeline("en_core_web_sm")
+nlp_multi = load_pipeline("xx_ent_wiki_sm")
+# Concurrent NER calls share one nlp.pipe batch per model
+ner_batchers = {
+    'english': PipeBatcher(nlp_en, name="en"),
+    'multi': PipeBatcher(nlp_multi, name="multi"),
+}
 
 app = Flask(__name__)
 
+# Answer HTML templates (templates/answers), compiled once, render-timed
+answer_templates = AnswerTemplates()
+
+# Answers for repeated questions, dropped whenever college_data.json is reloaded
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get("CHATBOT_CACHE_ENTRIES", "2048")),
+    max_bytes=int(os.environ.get("CHATBOT_CACHE_BYTES", str(16 * 1024 * 1024))),
+    ttl=float(os.environ.get("CHATBOT_CACHE_TTL", "600")),
+)
+# Characters of answer HTML per server-sent event of /get_response/stream
+STREAM_CHUNK_SIZE = int(os.environ.get("CHATBOT_STREAM_CHUNK", "1024"))
+# gzip/brotli bodies of recent answers, compressed once
+compressed_bodies = CompressedBodies(
+    max_bytes=int(os.environ.get("CHATBOT_COMPRESSED_CACHE_BYTES", str(8 * 1024 * 1024))),
+)
+
+# Keyword confidence below which spaCy NER still runs
+NER_CONFIDENCE_THRESHOLD = float(os.environ.get("CHATBOT_NER_THRESHOLD", "0.7"))
+# Classifier probability needed to overrule the keyword stage (the classifier
+# only knows templated phrases and a small corpus, so it must be very sure)
+INTENT_OVERRIDE_CONFIDENCE = float(os.environ.get("CHATBOT_INTENT_OVERRIDE_CONFIDENCE", "0.9"))
+# Classifier probability below which a keyword intent is dropped as a stray hit ("what is it")
+INTENT_MIN_AGREEMENT = float(os.environ.get("CHATBOT_INTENT_MIN_AGREEMENT", "0.05"))
+# Intents whose answer depends on a department entity
+ENTITY_INTENTS = {"department", "faculty"}
+
 def get_language(text):
-    """Enhanced language detection with better accuracy"""
-    try:
-        # Check for Hindi/Devanagari script
-        hindi_chars = re.findall(r'[\u0900-\u097F]', text)
-        english_chars = re.findall(r'[a-zA-Z]', text)
-        
-        # Check for Hinglish indicators
-        hinglish_indicators = ["kaise", "kya", "kab", "kitna", "hai", "hoon", "main", "aap", 
-                             "college", "admission", "fees", "batao", "bolo", "btao", "kya hai",
-                             "ke baare mein", "baare mein", "kaun hain"]
-        
-        if hindi_chars and english_chars:
-            return 'hinglish'
-        elif any(word in text.lower() for word in hinglish_indicators):
-            return 'hinglish'
-        elif hindi_chars:
-            return 'hindi'
+    """Script and Hinglish-lexicon classifier; langdetect only for ambiguous text"""
+    return detect_language(text)
+
+def get_intent_and_entities(text, language, stages=None):
+    """Advanced intent recognition and entity extraction
+
+    Keyword matching runs first. Faculty and keyword-less messages that name
+    a faculty member, position or qualification are answered from the
+    faculty directory. Messages with no intent keyword go through
+    the fallback_rules topics. When intent_model.npz exists, the trained
+    classifier then picks among the intents the keywords found; it overrules
+    the keywords (or their absence) only above INTENT_OVERRIDE_CONFIDENCE,
+    and a keyword intent it gives less than INTENT_MIN_AGREEMENT becomes
+    "general". The confidence is the classifier's when it agrees, else the
+    keyword stage's. What is still "general" is looked up in the
+    passage search backend, if one is configured. spaCy NER only runs when the intent needs a
+    department the keywords could not resolve, or when the confidence is
+    below NER_CONFIDENCE_THRESHOLD. The name of every stage that ran is
+    appended to ``stages`` when a list is passed in.
+    """
+    if stages is None:
+        stages = []
+    
+    # Stage 1: score the message against every intent in a single keyword pass
+    match = match_intent(text)
+    stages.append("keywords")
+    intent = match["intent"]
+    confidence = match["confidence"]
+    
+    # Stage 2: faculty members by name, position or qualification ("is Prof. Sapane a PhD")
+    if intent in ("faculty", "general"):
+        query = faculty_directory.parse(text, match["department"], faculty_context=intent == "faculty")
+        stages.append("directory")
+        if query is not None:
+            return "faculty", {'faculty_query': query}, max(confidence, DIRECTORY_CONFIDENCE)
+    
+    # Stage 3: topics outside the intent set (discipline, library, transport, ...)
+    topic = None
+    if intent == "general":
+        topic = fallback_rules.match(text)
+        stages.append("rules")
+    
+    # Calibrated classifier confidence instead of the fixed keyword constants
+    if topic is None and intent_model is not None:
+        rules_tried = intent == "general"
+        predicted, probability, probabilities = intent_model.predict(text)
+        # Rescore the keyword candidates; with none, the message stays general
+        candidates = [name for name in match["scores"] if name in probabilities]
+        intent = max(candidates, key=probabilities.get) if candidates else "general"
+        if predicted != intent and probability >= INTENT_OVERRIDE_CONFIDENCE:
+            intent = predicted
+        if intent == predicted:
+            confidence = probability
+        elif probabilities[intent] < INTENT_MIN_AGREEMENT:
+            intent, confidence = "general", probabilities["general"]
         else:
-            # Use langdetect for other languages
-            detected = detect(text)
-            if detected == 'hi':
-                return 'hindi'
-            else:
-                return 'english'
-    except (LangDetectException, Exception):
-        return 'english'  # Default to English
-
-def get_intent_and_entities(text, language):
-    """Advanced intent recognition and entity extraction"""
-    # Process text with appropriate model
-    if language == 'english':
-        doc = nlp_en(text.lower())
-    else:
-        doc = nlp_multi(text.lower())
+            # The keywords win the disagreement, so their confidence is reported
+            confidence = INTENT_CONFIDENCE.get(intent, match["confidence"])
+        stages.append("classifier")
+        # A keyword hit the classifier takes for general ("computer lab features")
+        if predicted == "general" and not rules_tried:
+            topic = fallback_rules.match(text)
+            stages.append("rules")
+    
+    if topic is not None:
+        return topic.split('.')[0], {'topic': topic}, TOPIC_CONFIDENCE
+    
+    # The classifier made it a faculty question: filter the directory after all
+    if intent == "faculty" and match["intent"] != "faculty":
+        query = faculty_directory.parse(text, match["department"], faculty_context=True)
+        stages.append("directory")
+        if query is not None:
+            return "faculty", {'faculty_query': query}, max(confidence, DIRECTORY_CONFIDENCE)
+    
+    # Stage 4: free-text search over every knowledge passage
+    if intent == "general" and SEARCH_BACKEND != "none":
+        hit = search_passages(text, language)
+        stages.append("search")
+        if hit is not None:
+            return intent, {'passage': hit}, confidence
     
     entities = {}
+    if match["department"]:
+        entities['department'] = match["department"]
     
-    # Extract named entities
-    for ent in doc.ents:
-        entities[ent.label_] = ent.text
-    
-    # Enhanced intent detection with confidence scoring
-    text_lower = text.lower()
-    intent = "general"
-    confidence = 0.5
-    
-    # Greeting patterns (multilingual)
-    greeting_patterns = ["hello", "hi", "hey", "namaste", "good morning", "good afternoon", 
-                        "good evening", "hii", "helo", "kaise ho", "kya haal", "sup"]
-    if any(pattern in text_lower for pattern in greeting_patterns):
-        intent = "greeting"
-        confidence = 0.9
-    
-    # Fee-related queries (multilingual)
-    elif any(pattern in text_lower for pattern in ["fee", "fees", "cost", "price", "amount", "charge", "tuition", 
-                       "payment", "scholarship", "kitni fees", "fees kitni", "paisa", "rupee", 
-                       "fees kya hai", "फीस", "शुल्क"]):
-        intent = "fees"
-        confidence = 0.8
-    
-    # Department queries (multilingual)
-    elif any(pattern in text_lower for pattern in ["department", "branch", "course", "program", "engineering", 
-                       "computer", "mechanical", "electrical", "civil", "it", "information technology",
-                       "विभाग", "शाखा", "baare mein", "about", "ke baare mein"]):
-        intent = "department"
-        confidence = 0.9
-        
-        # Extract specific department
-        dept_mapping = {
-            'computer': ['computer', 'cs', 'cse', 'computer science', 'computer engineering'],
-            'mechanical': ['mechanical', 'mech', 'mechanical engineering'],
-            'electrical': ['electrical', 'ee', 'electrical engineering'],
-            'civil': ['civil', 'civil engineering'],
-            'it': ['it', 'information technology']
-        }
-        
-        for dept, variations in dept_mapping.items():
-            if any(variation in text_lower for variation in variations):
-                entities['department'] = dept
-                break
-    
-    # Admission queries (multilingual)
-    elif any(pattern in text_lower for pattern in ["admission", "apply", "application", "entrance", "eligibility", 
-                       "process", "procedure", "form", "admission kaise", "apply kaise", 
-                       "प्रवेश", "दाखिला", "admission process"]):
-        intent = "admission"
-        confidence = 0.8
-    
-    # Faculty queries (multilingual)
-    elif any(pattern in text_lower for pattern in ["faculty", "teacher", "professor", "staff", "hod", "head", 
-                       "शिक्षक", "प्रोफेसर", "kaun hain", "faculty kaun"]):
-        intent = "faculty"
-        confidence = 0.8
-    
-    # Contact queries
-    elif any(pattern in text_lower for pattern in ["contact", "phone", "email", "address", "location", 
-                       "संपर्क", "पता", "contact kaise"]):
-        intent = "contact"
-        confidence = 0.8
-    
-    # Placement queries
-    elif any(pattern in text_lower for pattern in ["placement", "job", "career", "company", "package", 
-                       "salary", "नौकरी", "placement details"]):
-        intent = "placement"
-        confidence = 0.8
+    # Stage 5: named entities, only when the keyword stage is not decisive
+    needs_entity = intent in ENTITY_INTENTS and 'department' not in entities
+    if needs_entity or confidence < NER_CONFIDENCE_THRESHOLD:
+        doc = ner_batchers['english' if language == 'english' else 'multi'](text.lower())
+        stages.append("ner")
+        for ent in doc.ents:
+            entities.setdefault(ent.label_, ent.text)
     
     return intent, entities, confidence
 
+def resolve_response(intent, entities, language, snapshot=None):
+    """All precomputed answer variants for intent, entities and language"""
+    tables = (snapshot or data_reloader.current).tables
+    if 'passage' in entities:
+        return (entities['passage'][1],)
+    if 'faculty_query' in entities:
+        return (get_faculty_search_response(entities['faculty_query']),)
+    if 'topic' in entities:
+        answers = tables['topics']['hinglish' if language == 'hinglish' else 'english']
+        return answers.get(entities['topic']) or answers['default']
+    return lookup(tables['responses'], language, intent, entities.get('department'))
+
 def generate_response(intent, entities, language, confidence):
-    """Generate appropriate response based on intent, entities, and language"""
-    
-    # Select appropriate responses based on language
-    if language == 'hindi' and 'hindi_responses' in college_data:
-        responses = college_data['hindi_responses']
-    elif language == 'hinglish' and 'hinglish_responses' in college_data:
-        responses = college_data['hinglish_responses']
-    elif 'english_responses' in college_data:
-        responses = college_data['english_responses']
-    else:
-        # Fallback to basic responses
-        responses = college_data.get('responses', {})
-    
-    try:
-        if intent == 'greeting':
-            return responses.get('greeting', "Hello! How can I help you with college information?")
-        
-        elif intent == 'fees':
-            if isinstance(responses.get('fees'), dict):
-                return responses['fees'].get('overview', "Fee information not available.")
-            else:
-                return responses.get('fees', "Fee information not available.")
-        
-        elif intent == 'admission':
-            return responses.get('admission_info', responses.get('admission', "Admission information not available."))
-        
-        elif intent == 'department':
-            if 'department' in entities:
-                dept = entities['department']
-                # Return detailed department info from the extensive department data
-                if dept == 'computer':
-                    return cse_engineering_info['about']
-                elif dept == 'mechanical':
-                    return mechanical_engineering_info['about']
-                elif dept == 'electrical':
-                    return electrical_engineering_info['about']
-                elif dept == 'civil':
-                    return civil_engineering_info['about']
-                elif dept == 'it':
-                    return it_engineering_info['about']
-                else:
-                    return responses.get('department_info', "Department information not available.")
-            else:
-                return responses.get('department_info', "We have Computer, Mechanical, Electrical, Civil, and IT departments.")
-        
-        elif intent == 'faculty':
-            return responses.get('faculty', "Our faculty information is available for all departments.")
-        
-        elif intent == 'contact':
-            return responses.get('contact_details', contact_info if 'contact_info' in globals() else "Contact information not available.")
-        
-        elif intent == 'placement':
-            return responses.get('placement', "Our college has excellent placement opportunities with top companies.")
-        
-        else:
-            # Default response
-            return responses.get('default', "I'm here to help you with college information. Please ask about admissions, fees, departments, or facilities.")
-    
-    except Exception as e:
-        print(f"Error generating response: {e}")
-        return "I apologize, but I'm having trouble processing your request. Please try asking in a different way."
+    """Generate appropriate response based on intent, entities, and language
+
+    Answers are precomputed in the current data snapshot when college_data.json
+    is loaded; only the choice between variants (e.g. greetings) happens here.
+    """
+    return random.choice(resolve_response(intent, entities, language))
 
 # College information
 college_name = "R.V. Parankar College of Engineering and Technology, Arvi"
@@ -213,907 +195,48 @@ courses = {"B.Tech": "4 years"}
 admission_dates = "June 1 - August 15, 2025  "
 contact_info = "Phone: 0721-1234567 | Email:pcetarvi@rediffmail.com | www.rvparankar.in"
 
-# Department button template
-dept_buttons = """
-<div class="button-container">
-    <button class="dept-button" onclick="sendButtonMessage('about {dept} engineering')">About</button>
-    <button class="dept-button" onclick="sendButtonMessage('vision of {dept} engineering')">Vision</button>
-    <button class="dept-button" onclick="sendButtonMessage('mission of {dept} engineering')">Mission</button>
-    <button class="dept-button" onclick="sendButtonMessage('labs in {dept} engineering')">Our Labs</button>
-
-    <button class="dept-button" onclick="sendButtonMessage('programs in {dept}')">Programs</button>
-    <button class="dept-button" onclick="sendButtonMessage('infrastructure in {dept}')">Infrastructure</button>
-    <button class="dept-button" onclick="sendButtonMessage('faculty in {dept}')">Faculty</button>
-    <button class="dept-button" onclick="sendButtonMessage('research in {dept}')">Research</button>
-    <button class="dept-button" onclick="sendButtonMessage('activities in {dept}')">Activities</button>
-     <button class="dept-button" onclick="sendButtonMessage('achievements in {dept}')">Achievements</button>
-
-       <button class="info-button" onclick="sendButtonMessage('president')">President</button>
-    <button class="info-button" onclick="sendButtonMessage('principal')">Principal</button>
-    <button class="info-button" onclick="sendButtonMessage('director')">Director</button>
-    <button class="info-button" onclick="sendButtonMessage('college address')">Address</button>
-    <button class="info-button" onclick="sendButtonMessage('admission contact')">Admission</button>
-    <button class="info-button" onclick="sendButtonMessage('college contact')">Contact</button>
-
-    
-
-
-   </div>
-"""
-
-leadership_info = {
-    "president": """
-    <strong>President</strong><br>
-    Hon. Mr. G. W. Parankar<br>
-    President
-    """,
-    "principal": """
-    <strong>Principal</strong><br>
-    Hon. Mrs. P.R. Parankar<br>
-    Secretary
-    """,
-    "director": """
-    <strong>Director</strong><br>
-    Hon. Dr. R. W. Parankar<br>
-    Director
-    """,
-    "address": """
-    <strong>R.V. PARANKAR COLLEGE of Engineering & Technology, ARVI</strong><br>
-    Survey no.116/18, Mauza Sarangpuri,<br>
-    Arvi-Wardha NH-647, Arvi - 442201,<br>
-    Dist-Wardha, Maharashtra
-    """,
-    "admission": """
-    <strong>Admission Enquiry</strong><br>
-    8857086610, 9890377246<br>
-    9923255884, 8600443031
-    """,
-    "contact": """
-    <strong>Contact Us</strong><br>
-    www.rvparankar.in<br>
-    pcetarvi@rediffmail.com<br>
-    principalpcet1@gmail.com
-    """
-}
-
-
-# Civil Engineering Department
-civil_engineering_info = {
-    "about": """
-    <strong>DEPARTMENT OF CIVIL ENGINEERING</strong><br>
-    R.V. Parankar College of Engineering And Technology<br><br>
-    
-    <strong>ABOUT US</strong><br>
-    The R.V. Parankar College of Engineering And Technology offers Civil Engineering Department a full time Undergraduate programme in B.E. Civil Engineering.<br><br>
-    
-    The Department has a very able and skilled team of faculty members. The aim is to educate, train and develop highly skilled Civil Engineers at all levels capable of designing, constructing and maintaining environmental-friendly infrastructures.<br><br>
-    
-    The Civil Engineering laboratories are well equipped with latest instruments and machineries and cater to the Undergraduate students from Civil. The class room facilities are renowned for the academic and excellence.
-    """,
-    "vision": """
-    <strong>VISION</strong><br>
-    To create a high quality civil engineers with a technical knowledge of global standards to face the current and future challenges in the field. To guide a student for provide a good service to our nation with a sound knowledge.
-    """,
-    "mission": """
-    <strong>MISSION</strong><br>
-    To create professionals who are trained in the design and development of civil engineering systems and contribute towards research activities.<br>
-    To provide consultancy services to the community in all areas of civil engineering.<br>
-    To encourage students to study higher education and write competitive exams and various career developing courses.
-    """,
-    "labs": """
-    <strong>LABORATORIES & FACILITIES</strong><br>
-    - Concrete Technology Lab<br>
-    - Geotechnical Engineering Lab<br>
-    - Transportation Engineering Lab<br>
-    - Environmental Engineering Lab<br>
-    - Surveying Lab<br>
-    - Hydraulics & Hydraulic Machines Lab<br>
-    - CAD Lab with latest software
-    """
-}
-
-
-# Mechanical Engineering Department
-mechanical_engineering_info = {
-    "about": """
-    <strong>DEPARTMENT OF MECHANICAL ENGINEERING</strong><br>
-    R.V. Parankar College of Engineering And Technology<br><br>
-    
-    <strong>ABOUT US</strong><br>
-    The R.V. Parankar College of Engineering And Technology offers a full time Graduate Program in Mechanical Engineering that creates a community of top-notch scholars by bringing together faculty members which will establish graduate students with a common interest in innovation, creativity, and advanced professional study.<br><br>
-    
-    Through the curriculum, our department strives to prepare our undergraduate students for careers in traditional Mechanical Engineering fields as well as careers in cross-disciplined areas in academia and industry.<br><br>
-    
-    We pride ourselves on our faculty who guide each student from both exam and industry perspectives.<br><br>
-    
-    <strong>Specializations:</strong><br>
-    - Thermal and Fluid Sciences<br>
-    - Materials and Manufacturing<br>
-    - Mechanics and Systems<br>
-    - Controls<br><br>
-    
-    The best way to learn more about Mechanical Engineering at our institution is to visit us. We hope to see you soon!
-    """,
-    "vision": """
-    <strong>VISION</strong><br>
-    The Mechanical Engineering Department endeavors to be recognized globally for outstanding education and research leading to well qualified engineers, who are innovative, entrepreneurial and successful in advanced fields of mechanical engineering to cater the ever changing industrial demands and social needs.
-    """,
-    "mission": """
-    <strong>MISSION</strong><br>
-    The mission of the Department of Mechanical Engineering is to serve the students of our institution, the State, and the nation by:<br><br>
-    
-    - Providing quality education that is well-grounded in the fundamental principles of engineering, fostering innovation, and preparing students for leadership positions and successful careers in industry, government and academia.<br>
-    - Advancing the knowledge base of mechanical engineering to support the competitiveness of existing industry and to spawn new economic development through active involvement in basic and applied research in a global context.<br>
-    - Providing professional development opportunities for practicing engineers through continuing education, service, and outreach activities.
-    """,
-    "labs": """
-    <strong>OUR LABS</strong><br>
-    <strong>Fluid Machine Lab:</strong> Our state-of-the-art laboratory equipped with modern equipment for hands-on learning and research in fluid dynamics and machinery.
-    """
-}
-
-
-# Electrical Engineering Department
-electrical_engineering_info = {
-    "about": """
-    <strong>DEPARTMENT OF ELECTRICAL ENGINEERING</strong><br>
-    R.V. Parankar College of Engineering And Technology<br><br>
-    
-    <strong>ABOUT US</strong><br>
-    We have a graduate program in Electrical Engineering Department which is a brilliant rainbow of young minds from all over the country, with students coming from competitive pools and staff members who have good reputations for their work ethics.<br><br>
-    
-    The Department offers sound theoretical and practical training in state-of-the-art equipment. The Department is backed by good requirements of industries and establishments. The department offers B.E. course in Full time.
-    """,
-    "vision": """
-    <strong>VISION</strong><br>
-    Our vision is to produce Electrical Engineers with dynamic well-rounded personalities adaptable to ever increasing demands of emerging technologies involving analytical and practical skills.
-    """,
-    "mission": """
-    <strong>MISSION</strong><br>
-    - To offer good quality Under-Graduate, Post-Graduate and Doctoral programmes in electrical and electronics engineering<br>
-    - To provide state-of-the-art resources that contribute to achieve excellence in teaching-learning, research and development activities<br>
-    - To bridge the gap between industry and academia by framing curricula and syllabi based on industrial and societal needs<br>
-    - To provide suitable forums to enhance the creative talents of students and faculty members<br>
-    - To enable students to develop skills to solve complex technological problems of current times and also provide a framework for promoting collaborative and multidisciplinary activities<br>
-    - To inculcate moral and ethical values among the faculty and students
-    """,
-    "labs": """
-    <strong>OUR LABS</strong><br>
-    <strong>Network Analysis Lab:</strong> Equipped with modern instruments for circuit analysis and network theorems<br><br>
-    <strong>Electrical Machine Lab:</strong> Hands-on experience with generators, motors, and transformers
-    """
-}
-
-
-# Information Technology Department
-it_engineering_info = {
-    "about": """
-    <strong>DEPARTMENT OF INFORMATION TECHNOLOGY</strong><br>
-    R.V. Parankar College of Engineering And Technology<br><br>
-    
-    <strong>ABOUT US</strong><br>
-    Welcome to the Department of Information Technology. The Department is responsible for providing information and training in the world's everyday life of information technology. Our program combines information resources with practical applications to prepare students for successful careers in the IT industry.
-    """,
-    "vision": """
-    <strong>VISION</strong><br>
-    To be a premier center for Information Technology education, fostering innovative thinking and developing professionals who solve contemporary technology challenges.
-    """,
-    "mission": """
-    <strong>MISSION</strong><br>
-    - Impart comprehensive education in Technology fundamentals and applications<br>
-    - Develop technical skills throughout the community and enhance student learning<br>
-    - Develop professional development opportunities through educational design<br>
-    - Optimize industry partnerships and social support during student development<br>
-    - Promote practical and social opportunities in technology development
-    """,
-    "programs": """
-    <strong>PROGRAMS OFFERED</strong><br><br>
-    <strong>Ethics in Information Technology</strong><br>
-    - ACCEL supported curriculum<br>
-    - Focus on relevant developments in database management, networking, and IT infrastructure<br><br>
-    
-    <strong>Advanced Information Technology</strong><br>
-    - Advanced study in emerging IT domains<br>
-    - Research-focused approach<br><br>
-    
-    <strong>Automation Technology</strong><br>
-    - Resource opportunities for research in IT specifications<br>
-    - Industry-aligned curriculum
-    """,
-    "infrastructure": """
-    <strong>INFRASTRUCTURE</strong><br>
-    Our department provides modern facilities to support effective learning:<br><br>
-    
-    <strong>Computer Laboratories</strong><br>
-    - Current hardware and software resources<br>
-    - High-speed internet connectivity<br><br>
-    
-    <strong>Specialized Tools</strong><br>
-    - Software testing tools<br>
-    - Internet security systems<br>
-    - Data intelligence platforms
-    """,
-    "faculty": """
-    <strong>FACULTY</strong><br>
-    The department is supported by qualified faculty members with diverse expertise in Information Technology disciplines. Our instructors combine academic knowledge with practical experience to provide students with well-rounded education.
-    """,
-    "research": """
-    <strong>RESEARCH AREAS</strong><br><br>
-    <strong>Core Technologies</strong><br>
-    - Data Mining and Business Intelligence<br>
-    - Network Systems and Architecture<br><br>
-    
-    <strong>Emerging Fields</strong><br>
-    - Dynamic Software Interaction<br>
-    - Machine Learning Applications
-    """,
-    "activities": """
-    <strong>STUDENT ACTIVITIES</strong><br><br>
-    <strong>Technical Development</strong><br>
-    - IT project challenges<br>
-    - Technical peer presentations<br><br>
-    
-    <strong>Professional Growth</strong><br>
-    - Business development workshops<br>
-    - Student experience enhancement programs
-    """
-}
-
-
-# Computer Science Engineering Department
-cse_engineering_info = {
-    "about": """
-    <strong>DEPARTMENT OF COMPUTER SCIENCE ENGINEERING</strong><br>
-    R.V. Parankar College of Engineering And Technology<br><br>
-    
-    <strong>ABOUT US</strong><br>
-    Welcome to the Department of Computer Science Engineering. We are committed to excellence in computing education, research, and innovation. Our program provides students with a strong foundation in computer science principles along with practical skills to solve complex computing problems.
-    """,
-    "vision": """
-    <strong>VISION</strong><br>
-    To be recognized as a center of excellence in Computer Science Education and Research, producing globally competent professionals who can contribute to technological advancements and societal development.
-    """,
-    "mission": """
-    <strong>MISSION</strong><br>
-    - Provide quality education in computer science fundamentals and emerging technologies<br>
-    - Foster innovation through research and development activities<br>
-    - Develop problem-solving skills through hands-on learning experiences<br>
-    - Establish strong industry-academia collaborations<br>
-    - Promote ethical values and social responsibility among students
-    """,
-    "programs": """
-    <strong>PROGRAMS OFFERED</strong><br><br>
-    <strong>Bachelor of Engineering (CSE)</strong><br>
-    - 4-year undergraduate program<br>
-    - Specializations in AI, Cybersecurity, and Data Science<br>
-    - Industry-aligned curriculum<br><br>
-    
-    <strong>Master of Technology (CSE)</strong><br>
-    - 2-year postgraduate program<br>
-    - Research-focused with thesis option<br>
-    - Advanced courses in emerging technologies<br><br>
-    
-    <strong>Doctoral Program (Ph.D.)</strong><br>
-    - Research in cutting-edge computing areas<br>
-    - Collaboration with industry and research labs<br>
-    - Interdisciplinary research opportunities
-    """,
-    "labs": """
-    <strong>LABORATORIES</strong><br>
-    Our department boasts state-of-the-art computing facilities:<br><br>
-    
-    <strong>Advanced Computing Lab</strong><br>
-    - High-performance workstations<br>
-    - Cloud computing infrastructure<br>
-    - Parallel computing resources<br><br>
-    
-    <strong>AI & Data Science Lab</strong><br>
-    - GPU-accelerated systems<br>
-    - Big data processing tools<br>
-    - Machine learning frameworks<br><br>
-    
-    <strong>Networking & Cybersecurity Lab</strong><br>
-    - Cisco networking equipment<br>
-    - Ethical hacking tools<br>
-    - Security testing environment
-    """,
-    "faculty": """
-    <strong>FACULTY</strong><br>
-    Our faculty members are highly qualified with expertise in various domains of computer science including Artificial Intelligence, Cybersecurity, Software Engineering, and Data Science. Many hold Ph.D. degrees and have extensive research and industry experience.
-    """,
-    "research": """
-    <strong>RESEARCH AREAS</strong><br><br>
-    <strong>Core Computing</strong><br>
-    - Algorithms and Complexity<br>
-    - Computer Systems and Architecture<br>
-    - Programming Languages<br><br>
-    
-    <strong>Emerging Technologies</strong><br>
-    - Artificial Intelligence and Machine Learning<br>
-    - Internet of Things (IoT)<br>
-    - Blockchain Technology<br><br>
-    
-    <strong>Applied Computing</strong><br>
-    - Data Science and Big Data Analytics<br>
-    - Computer Vision and Image Processing<br>
-    - Cloud and Edge Computing
-    """,
-    "achievements": """
-    <strong>STUDENT ACHIEVEMENTS</strong><br><br>
-    <strong>Technical Competitions</strong><br>
-    - Hackathon winners at national level<br>
-    - Coding competition champions<br>
-    - Research paper publications<br><br>
-    
-    <strong>Placements</strong><br>
-    - 100+ placements in top tech companies<br>
-    - Higher studies at prestigious universities<br>
-    - Successful startup ventures
-    """
-}
-
-
-discipline_rules = {
-    "overview": """
-    <strong>College Discipline & Rules</strong><br><br>
-    The College is a community in which a large number of people live together. It is therefore essential that all members have due regard for the rights of others. The Incharge Principal/Faculty (Student Activities) looks after the disciplinary matters and problems arising from a breach of the College rules. The College rules are intended to help preserve a happy and harmonious atmosphere for all those living and working in the College.
-    """,
-    "attendance": """
-    <strong>ATTENDANCE</strong><br><br>
-    • Students should fulfill minimum 75% attendance for all programs (theory & practical)<br>
-    • As per Nagpur University Ordinance No. 6<br>
-    • Absences must be reported in writing in advance<br>
-    • Students failing to meet attendance requirements won't be eligible for certification
-    """,
-    "ragging": """
-    <strong>RAGGING</strong><br><br>
-    • Strictly forbidden by law (Maharashtra Prohibition on Ragging Act 1999)<br>
-    • Penalties include:<br>
-      &nbsp;&nbsp;- Up to 2 years imprisonment<br>
-      &nbsp;&nbsp;- Fine up to ₹10,000<br>
-      &nbsp;&nbsp;- Dismissal from college for 5 years
-    """,
-    "anti_social": """
-    <strong>ANTI-SOCIAL ACTIVITIES</strong><br><br>
-    • Participation in political/anti-social activities prohibited<br>
-    • Strict disciplinary action will be taken against violators
-    """,
-    "uniform": """
-    <strong>UNIFORM</strong><br><br>
-    • Prescribed dress code must be followed<br>
-    • Aprons compulsory in laboratories<br>
-    • No eatables in labs<br>
-    • Mobile phones strictly prohibited in lab areas
-    """,
-    "library": """
-    <strong>LIBRARY</strong><br><br>
-    • Books arranged systematically by title/subject<br>
-    • Students must maintain this order during reference work<br>
-    • Mobile phones strictly prohibited
-    """,
-    "behavior": """
-    <strong>BEHAVIOR</strong><br><br>
-    • Students must conduct themselves appropriately at all times<br>
-    • Must uphold the institution's image and standing
-    """,
-    "schedule": """
-    <strong>TIME SCHEDULE</strong><br><br>
-    • Students must arrive on time and attend all lectures<br>
-    • All term work must be completed as scheduled<br>
-    • Failure to complete term work may result in being barred from university exams
-    """,
-    "conduct": """
-    <strong>CONDUCT</strong><br><br>
-    • Students accountable for behavior both on and off campus<br>
-    • Tampering with fire safety equipment is a serious offense
-    """,
-    "general": """
-    <strong>GENERAL RULES</strong><br><br>
-    • Must abide by all college rules and regulations<br>
-    • Regularly check notice boards for updates<br>
-    • Always carry ID card on campus<br>
-    • Playing games on campus prohibited<br>
-    • Severe punishments including rustication for misbehavior
-    """
-}
-
-
-
-# Transportation Information
-transportation_info = {
-    "overview": """
-    <strong>School Bus Transportation</strong><br><br>
-    Our safe and reliable bus service connects major city locations to the college campus, ensuring convenient transportation for all students.
-    """,
-    "features": """
-    <strong>Key Features</strong><br><br>
-    • Comprehensive Coverage: Serving all major neighborhoods and city stops<br>
-    • Multiple Routes: Options to suit different schedules<br>
-    • Regular Timings: Morning and afternoon services<br>
-    • Safety First: GPS-equipped buses with trained drivers<br>
-    • Student ID Access: Easy boarding with college ID cards
-    """,
-    "schedule": """
-    <strong>Schedule Information</strong><br><br>
-    <strong>Morning Pickups:</strong> 9:00 AM - 10:30 AM (every 20-30 minutes)<br><br>
-    <strong>Afternoon Returns:</strong> 5:00 PM - 6:30 PM<br><br>
-    Special schedules available during exams and events
-    """
-}
-
-
-
-# Workshop Information
-workshop_info = {
-    "overview": """
-    <strong>General Workshop</strong><br><br>
-    The General Workshop forms an integral part of the Institution as it is heavily involved in carrying out the practical oriented study of various manufacturing activities with the help of sophisticated equipment, machinery, and tools.<br><br>
-    Basic Engineering workshop curriculum is framed in all engineering/technology programmes to make all students proficient in the use of hand tools, equipment and machinery in various workshop sections.
-    """,
-    "fitting": """
-    <strong>Fitting Section</strong><br><br>
-    In fitting shop various processes are performed on metals to give them desired shape and size and fit them with mating parts. Both ferrous and non-ferrous metals are dealt with in this section.
-    """,
-    "carpentry": """
-    <strong>Carpentry Section</strong><br><br>
-    Carpentry is a skilled trade in which the primary work performed is the use of wood to construct items as large as buildings and as small as desk drawers. Students learn wood-working skills like making furniture and wooden articles.
-    """,
-    "welding": """
-    <strong>Welding Section</strong><br><br>
-    A well maintained and advanced Welding section provides hands-on introduction to the common welding processes used in industry.
-    """
-}
-
-
-
-# Computer Facilities Information
-computer_info = {
-    "overview": """
-    <strong>Computer Facility</strong><br><br>
-    Our state-of-the-art computer facilities provide students with access to cutting-edge technology and software to support their academic and research needs.
-    """,
-    "features": """
-    <strong>High-Performance Labs</strong><br>
-    • Multiple computer labs equipped with latest hardware<br>
-    • High-speed internet connectivity<br><br>
-    
-    <strong>Specialized Software</strong><br>
-    • Access to industry-standard software for engineering, design, programming, and data analysis<br><br>
-    
-    <strong>24/7 Access</strong><br>
-    • Selected labs available round-the-clock for projects and assignments<br><br>
-    
-    <strong>Technical Support</strong><br>
-    • Dedicated staff available to assist with technical issues
-    """,
-    "resources": """
-    <strong>Available Resources</strong><br><br>
-    • 300+ workstations across campus<br>
-    • High-end workstations for CAD/CAM applications<br>
-    • 3D printing and rapid prototyping facilities<br>
-    • Virtual reality development lab<br>
-    • Data center with cloud computing resources
-    """
-}
-
-
-
-# Library Information
-library_info = {
-    "overview": """
-    <strong>Convenient Library</strong><br><br>
-    Our modern library provides students with comprehensive resources and a peaceful environment for study and research, supporting all academic programs.
-    """,
-    "services": """
-    <strong>Library Services</strong><br><br>
-    • 100,000+ print volumes<br>
-    • Access to 50+ online databases<br>
-    • 200+ print journal subscriptions<br>
-    • E-book collection (50,000+ titles)<br>
-    • Interlibrary loan services<br>
-    • Reference assistance<br>
-    • Study rooms and carrels<br>
-    • Printing and scanning facilities<br>
-    • Accessibility services<br>
-    • Information literacy instruction
-    """,
-    "facilities": """
-    <strong>Facilities</strong><br><br>
-    <strong>Reading Areas</strong><br>
-    • Comfortable seating with natural lighting<br><br>
-    
-    <strong>Digital Resources</strong><br>
-    • Computer stations with online resource access<br><br>
-    
-    <strong>Group Study Rooms</strong><br>
-    • Bookable rooms with presentation technology<br><br>
-    
-    <strong>Special Collections</strong><br>
-    • Rare books and archives for specialized research
-    """
-}
-
-
-# B.Tech Fees Structure Information
-btech_fees = {
-    "overview": """
-    <strong>B.Tech Fee Structure (2024-25)</strong><br><br>
-    <table border="1" cellpadding="5" cellspacing="0">
-        <tr>
-            <th>Category</th>
-            <th>Indian Students (₹)</th>
-            <th>International Students ($)</th>
-        </tr>
-        <tr>
-            <td>Tuition Fee</td>
-            <td>1,20,000</td>
-            <td>2,000</td>
-        </tr>
-        <tr>
-            <td>Development Fee</td>
-            <td>1,000</td>
-            <td>500</td>
-        </tr>
-        <tr>
-            <td>Examination Fee</td>
-            <td>2,300</td>
-            <td>-</td>
-        </tr>
-        <tr>
-            <td>Other Charges</td>
-            <td>8,000</td>
-            <td>300</td>
-        </tr>
-        <tr>
-            <td><strong>Total Annual Fees</strong></td>
-            <td><strong>1,31,000</strong></td>
-            <td><strong>2,800</strong></td>
-        </tr>
-    </table>
-    """,
-    "payment": """
-    <strong>Payment Options for B.Tech</strong><br><br>
-    • <strong>Installment Plan:</strong> 50% at admission + 50% before semester 2<br>
-    • <strong>Payment Methods:</strong> Online/NEFT/DD/Cash<br>
-    • <strong>Early Bird Discount:</strong> 5% on full annual payment<br>
-    • <strong>Late Fee:</strong> ₹500/week after due date
-    """,
-    "scholarship": """
-    <strong>B.Tech Scholarships</strong><br><br>
-    • <strong>Merit Scholarship:</strong> Up to 50% fee waiver (Based on 12th/JEE score)<br>
-    • <strong>EBC Scholarship:</strong> 25% waiver for economically backward students<br>
-    • <strong>Sports Quota:</strong> 30-50% waiver for state/national players<br>
-    • <strong>Girl Child Scholarship:</strong> 20% waiver for female students
-    """
-}
-
-
-# Disability Friendly Facilities Information
-disability_facilities = {
-    "overview": """
-    <strong>Disability Friendly Facilities</strong><br><br>
-    Our college is committed to providing an inclusive environment for all students. We offer comprehensive support services and accessible facilities to ensure equal opportunities for students with disabilities.
-    """,
-    "support": """
-    <strong>Support Services</strong><br><br>
-    • Dedicated disability support coordinator<br>
-    • Counseling services for students with disabilities<br>
-    • Peer mentoring program<br>
-    • Assistive technology training<br>
-    • Regular accessibility audits of campus facilities
-    """,
-    "accessibility": """
-    <strong>Physical Accessibility</strong><br><br>
-    • Wheelchair ramps at all building entrances<br>
-    • Elevators with Braille buttons and audio announcements<br>
-    • Disabled-friendly restrooms on each floor<br>
-    • Tactile pathways for visually impaired students<br>
-    • Accessible seating in classrooms and auditoriums
-    """,
-    "learning": """
-    <strong>Learning Support</strong><br><br>
-    • Specialized software for students with learning disabilities<br>
-    • Screen readers and magnifiers available in computer labs<br>
-    • Sign language interpreters available upon request<br>
-    • Extended time for exams when needed<br>
-    • Alternative format textbooks (audio, braille, large print)
-    """,
-    "campus": """
-    <strong>Campus Facilities</strong><br><br>
-    • Reserved parking spaces near all buildings<br>
-    • Accessible cafeteria with adjustable furniture<br>
-    • Disabled-friendly hostel accommodations<br>
-    • Emergency alert systems with visual and audio signals<br>
-    • Accessible sports and recreation facilities
-    """,
-    "contact": """
-    <strong>Need Disability Support?</strong><br><br>
-    Our dedicated support team is available to assist students with disabilities. Contact us for personalized assistance and accommodations.
-    """
-}
-
-# Faculty Information by Department
-faculty_data = {
-    "civil": [
-        {
-            "name": "Prof.Dr.Ravindra W.Parankar",
-            "position": "Head of Department",
-            "education": "PHD, M.Tech, MA, DCE",
-            "experience": "21 Years",
-            "contact": "7620245615",
-            "email": ""
-        },
-        {
-            "name": "Prof.Rahul M Kachole",
-            "position": "Associate Professor",
-            "education": "M.Tech",
-            "experience": "18 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Pranav P.Pande",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "11 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Mohit Chandak",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE",
-            "experience": "10 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Jayesh Gandhi",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "05 Years",
-            "contact": "",
-            "email": ""
-        }
-    ],
-    "mechanical": [
-        {
-            "name": "Prof. Nikhil Ekotkhane",
-            "position": "H.O.D. (Mechanical Engineering)",
-            "education": "M.Tech (Machine Design)",
-            "experience": "12 Years",
-            "contact": "9890377246",
-            "email": ""
-        },
-        {
-            "name": "Dr. Krishnan",
-            "position": "Associate Professor",
-            "education": "M.Tech, PhD",
-            "experience": "10 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof. Yogesh A. Paliwal",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE, DME (Thermal Engineering)",
-            "experience": "20 Years",
-            "contact": "9923255884",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof. Pravin A. Sapane",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE, DME (Advance Production Tech.)",
-            "experience": "17 Years",
-            "contact": "8857086610",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof. Tarachand G. Lokhande",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE",
-            "experience": "15 Years",
-            "contact": "",
-            "email": ""
-        }
-    ],
-    "electrical": [
-        {
-            "name": "Prof.Dr.E.Sujata",
-            "position": "H.O.D. (Electrical Engineering)",
-            "education": "Ph.D, M.Tech",
-            "experience": "15+ Years in Teaching & Research",
-            "contact": "+91 9999377246",
-            "email": "Contact Professor"
-        },
-        {
-            "name": "Prof.Mehendra A. Gurunasingani",
-            "position": "Associate Professor",
-            "education": "M.Tech, BE",
-            "experience": "12 Years Teaching Experience",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Harsha V.Hood",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE",
-            "experience": "10 Years in Teaching",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Sanket Thakare",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE",
-            "experience": "2 Years Teaching Experience",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Vaishnavi Bhende",
-            "position": "Assistant Professor",
-            "education": "Ph.D, M.Tech, BE",
-            "experience": "10 Years in Teaching & Research",
-            "contact": "",
-            "email": "Email Professor"
-        }
-    ],
-
+# Department section buttons (the button-container menu)
+department_sections = [
+    ("about {dept} engineering", "About"),
+    ("vision of {dept} engineering", "Vision"),
+    ("mission of {dept} engineering", "Mission"),
+    ("labs in {dept} engineering", "Our Labs"),
+    ("programs in {dept}", "Programs"),
+    ("infrastructure in {dept}", "Infrastructure"),
+    ("faculty in {dept}", "Faculty"),
+    ("research in {dept}", "Research"),
+    ("activities in {dept}", "Activities"),
+    ("achievements in {dept}", "Achievements"),
+]
+college_buttons = [
+    ("president", "President"),
+    ("principal", "Principal"),
+    ("director", "Director"),
+    ("college address", "Address"),
+    ("admission contact", "Admission"),
+    ("college contact", "Contact"),
+]
 
-    
- "computer": [
-        {
-            "name": "Prof.Priti D.Ghantewar",
-            "position": "H.O.D. (Computer Science & Engineering)",
-            "education": "Ph.D(A), M.Tech",
-            "experience": "16 Years",
-            "contact": "8669022917",
-            "email": "Contact HOD"
-        },
-        {
-            "name": "Dr.K.Muralibabu",
-            "position": "Associate Professor",
-            "education": "Ph.D, M.Tech",
-            "experience": "12 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Manisha B.Bannagare",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "10 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Rutuja A.Khodake",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE",
-            "experience": "05 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Nitin M.Wadnare",
-            "position": "Assistant Professor",
-            "education": "MSc(Computer)",
-            "experience": "08 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Swati P.Akhare",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "06 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Amol Sarode",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "15 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Deepali Gajanan Hande",
-            "position": "Assistant Professor",
-            "education": "M.Tech(AI)",
-            "experience": "04 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Snehal V.Borade",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "04 Years",
-            "contact": "",
-            "email": "Email Professor"
-        }
-    ],
+# College knowledge base, memory-mapped from knowledge.bin when it is up to
+# date (python build_knowledge.py), else the dictionaries in knowledge_base.py
+knowledge, preloaded_college_data = load_knowledge()
+leadership_info = knowledge["leadership_info"]
+discipline_rules = knowledge["discipline_rules"]
+transportation_info = knowledge["transportation_info"]
+workshop_info = knowledge["workshop_info"]
+computer_info = knowledge["computer_info"]
+library_info = knowledge["library_info"]
+disability_facilities = knowledge["disability_facilities"]
+department_info = knowledge["department_info"]
+courses_info = knowledge["courses_info"]
+admission_info = knowledge["admission_info"]
+contact_details = knowledge["contact_details"]
 
+# Departments (sections + faculty) and fees as validated, typed records
+records = load_records(knowledge)
+department_records = records.departments
+fee_schedule = records.fees
 
-     "it": [
-        {
-            "name": "Prof.Priti D.Ghantewar",
-            "position": "H.O.D. (Information Technology)",
-            "education": "Ph.D(A), M.Tech",
-            "experience": "16 Years",
-            "contact": "8669022917",
-            "email": "Contact HOD"
-        },
-        {
-            "name": "Dr.K.Muralibabu",
-            "position": "Associate Professor",
-            "education": "Ph.D, M.Tech",
-            "experience": "12 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Manisha B.Bannagare",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "10 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Rutuja A.Khodake",
-            "position": "Assistant Professor",
-            "education": "M.Tech, BE",
-            "experience": "05 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Nitin M.Wadnare",
-            "position": "Assistant Professor",
-            "education": "MSc(Computer)",
-            "experience": "08 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Swati P.Akhare",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "06 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Amol Sarode",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "15 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Deepali Gajanan Hande",
-            "position": "Assistant Professor",
-            "education": "M.Tech(AI)",
-            "experience": "04 Years",
-            "contact": "",
-            "email": "Email Professor"
-        },
-        {
-            "name": "Prof.Snehal V.Borade",
-            "position": "Assistant Professor",
-            "education": "M.Tech",
-            "experience": "04 Years",
-            "contact": "",
-            "email": "Email Professor"
-        }
-    ]
-}
 
 
 
@@ -1124,78 +247,15 @@ responses = {
         "Hi there! Ask me about B.Tech fee structure or admission process."
     ],
     "fees": {
-        "main": btech_fees["overview"],
-        "payment": btech_fees["payment"],
-        "scholarship": btech_fees["scholarship"],
-        "default": btech_fees["overview"] + "<br><br>You can also ask about:<br>- Payment options<br>- Scholarship opportunities"
+        "main": fee_schedule.overview,
+        "payment": fee_schedule.payment,
+        "scholarship": fee_schedule.scholarship,
+        "default": fee_schedule.overview + "<br><br>You can also ask about:<br>- Payment options<br>- Scholarship opportunities"
     },
     "default": "I can provide information about B.Tech fees. Try asking:<br>- What is the B.Tech fee structure?<br>- What are the payment options?<br>- Are there any scholarships available?"
 }
 
 
-# Detailed responses for each category
-department_info = """
-<strong>Departments Offered:</strong><br><br>
-1. <strong>Computer Engineering</strong><br>
-   - Focus on software development and computer systems<br>
-   - Well-equipped computer labs with latest technology<br><br>
-
-2. <strong>Mechanical Engineering</strong><br>
-   - Covers thermodynamics, fluid mechanics, and machine design<br>
-   - State-of-the-art workshop facilities<br><br>
-
-3. <strong>Electrical Engineering</strong><br>
-   - Specializations in power systems and control systems<br>
-   - Modern electrical machines and power electronics labs<br><br>
-
-4. <strong>Civil Engineering</strong><br>
-   - Focus on structural design and construction technology<br>
-   - Comprehensive surveying and concrete technology labs
-"""
-
-courses_info = """
-<strong>Courses Offered:</strong><br><br>
-• <strong>Bachelor of Technology (B.Tech)</strong><br>
-  - Duration: 4 years<br>
-  - Specializations: Computer, Mechanical, Electrical, Civil<br><br>
-
-• <strong>Diploma Programs</strong><br>
-  - Duration: 3 years<br>
-  - Available in all engineering disciplines<br><br>
-
-• <strong>Post Graduate Programs</strong><br>
-  - M.Tech in various specializations (2 years)
-"""
-
-admission_info = """
-<strong>Admission Dates & Process:</strong><br><br>
-• <strong>Application Period:</strong> June 1 - August 15, 2025<br>
-• <strong>Eligibility:</strong> 10+2 with Physics, Chemistry, and Mathematics<br>
-• <strong>Entrance Exam:</strong> JEE Main or State CET scores accepted<br><br>
-
-<strong>Important Dates:</strong><br>
-- Application Start: June 1, 2025<br>
-- Last Date to Apply: August 15, 2025<br>
-- Counseling Starts: August 20, 2025<br>
-- Classes Begin: September 1, 2025
-"""
-
-contact_details = """
-<strong>Contact Information:</strong><br><br>
-• <strong>Address:</strong><br>
-  R.V. Parankar College of Engineering & Technology,<br>
-  Survey no.116/18, Mauza Sarangpuri,<br>
-  Arvi-Wardha NH-647, Arvi - 442201,<br>
-  Dist-Wardha, Maharashtra<br><br>
-
-• <strong>Phone:</strong> 0721-1234567<br>
-• <strong>Email:</strong> pcetarvi@rediffmail.com<br>
-• <strong>Website:</strong> www.rvparankar.in<br><br>
-
-<strong>Admission Helpline:</strong><br>
-8857086610, 9890377246<br>
-9923255884, 8600443031
-"""
 
 
 
@@ -1203,51 +263,21 @@ contact_details = """
 def get_department_response(dept, query_type):
     """Helper function to get department specific responses"""
     dept_map = {
-        "civil": civil_engineering_info,
-        "mechanical": mechanical_engineering_info,
-        "electrical": electrical_engineering_info,
-        "information technology": it_engineering_info,
-        "it": it_engineering_info,
-         "computer science": cse_engineering_info,
-        "cse": cse_engineering_info,
-        "computer science engineering": cse_engineering_info
+        "information technology": "it",
+        "computer science": "computer",
+        "cse": "computer",
+        "computer science engineering": "computer"
     }
-    dept_info = dept_map.get(dept, {})
-    response = dept_info.get(query_type, "")
-    buttons = dept_buttons.format(dept=dept)
+    record = department_records.get(dept_map.get(dept, dept))
+    response = record.section(query_type) if record else ""
+    buttons = answer_templates.render(
+        "department_menu.html",
+        sections=[(command.format(dept=dept), label) for command, label in department_sections],
+        college=college_buttons,
+    )
     return response + buttons
 
 
-def format_faculty_card(prof):
-    """Format a faculty member's information as an HTML card."""
-    return f"""
-    <div class="faculty-card">
-        <h3>{prof.get('name', '')}</h3>
-        <p><strong>Position:</strong> {prof.get('position', '')}</p>
-        <p><strong>Education:</strong> {prof.get('education', '')}</p>
-        <p><strong>Experience:</strong> {prof.get('experience', '')}</p>
-        {'<p><strong>Contact:</strong> ' + prof['contact'] + '</p>' if prof.get('contact') else ''}
-        {'<p><strong>Email:</strong> ' + prof['email'] + '</p>' if prof.get('email') else ''}
-    </div>
-    """
-
-def format_faculty_card(prof):
-    """Format a faculty member's information as an HTML card."""
-    contact_html = f'<p><strong>Contact:</strong> <a href="tel:{prof["contact"].replace(" ", "").replace("+", "")}">{prof["contact"]}</a></p>' if prof.get("contact") else ""
-    email_html = f'<p><strong>Email:</strong> <a href="mailto:{prof["email"].split()[-1].lower()}@rvparankar.in">{prof["email"]}</a></p>' if prof.get("email") and "Email" in prof["email"] else f'<p>{prof.get("email", "")}</p>'
-    
-    return f"""
-    <div class="faculty-card">
-        <h3>{prof.get('name', '')}</h3>
-        <p><strong>Position:</strong> {prof.get('position', '')}</p>
-        <p><strong>Education:</strong> {prof.get('education', '')}</p>
-        <p><strong>Experience:</strong> {prof.get('experience', '')}</p>
-        {contact_html}
-        {email_html}
-    </div>
-    """
-
-
 def get_faculty_response(dept):
     icons = {
         "civil": "fas fa-hard-hat",
@@ -1265,66 +295,78 @@ def get_faculty_response(dept):
     }
     icon = icons.get(dept, "fas fa-chalkboard-teacher")
     title = dept_titles.get(dept, "Faculty")
-    cards = "".join([format_faculty_card(prof) for prof in faculty_data.get(dept, [])])
-    
-    if cards:
-        return f"""
-        <div class="faculty-section">
-            <h2><i class="{icon}"></i> {title}</h2>
-            <div class="faculty-grid">
-                {cards}
-            </div>
-        </div>
-        """
-    else:
-        return f"""
-        <div class="faculty-section">
-            <h2><i class="{icon}"></i> {title}</h2>
-            <p>No faculty data available for this department.</p>
-        </div>
-        """
-
-dept_buttons = """
-<div class="dept-button-container">
-    <button class="dept-button" onclick="sendButtonMessage('civil faculty')">Civil</button>
-    <button class="dept-button" onclick="sendButtonMessage('mechanical faculty')">Mechanical</button>
-    <button class="dept-button" onclick="sendButtonMessage('electrical faculty')">Electrical</button>
-    <button class="dept-button" onclick="sendButtonMessage('computer faculty')">Computer</button>
-    <button class="dept-button" onclick="sendButtonMessage('it faculty')">IT</button>
-</div>
-"""
+    # Only the first page of cards; the rest is fetched with the cursor
+    members, next_cursor = faculty_directory.page(department_query(dept))
+    html = render_faculty_list(members, next_cursor, title, icon,
+                               empty_message="No faculty data available for this department.")
+    if members:
+        return compose(faculty_list(html, title, icon, members, next_cursor))
+    return html
+
+def render_faculty_list(members, next_cursor, title="", icon="", empty_message=""):
+    """A faculty-section of pre-rendered cards"""
+    return answer_templates.render(
+        "faculty_list.html",
+        title=title, icon=icon, empty_message=empty_message,
+        cards=[faculty_cards[prof] for prof in members],
+        next_cursor=next_cursor, page_command=FACULTY_PAGE_COMMAND,
+    )
+
+dept_buttons = answer_templates.render("department_buttons.html", departments=[
+    ("civil", "Civil"),
+    ("mechanical", "Mechanical"),
+    ("electrical", "Electrical"),
+    ("computer", "Computer"),
+    ("it", "IT"),
+])
+
+# Button groups that structured (format=blocks) answers refer to by ID
+button_sets = ButtonSets()
+button_sets.add("departments", dept_buttons)
 
 # Faculty Card Formatting Function
 def format_faculty_card(prof):
-    """Format a faculty member's information as an HTML card."""
-    contact_html = f'<p><strong>Contact:</strong> <a href="tel:{prof["contact"].replace(" ", "").replace("+", "")}">{prof["contact"]}</a></p>' if prof.get("contact") else ""
-    email_html = f'<p><strong>Email:</strong> <a href="mailto:{prof["email"].split()[-1].lower()}@rvparankar.in">{prof["email"]}</a></p>' if prof.get("email") and "Email" in prof["email"] else f'<p>{prof.get("email", "")}</p>'
-    
-    return f"""
-    <div class="faculty-card">
-        <h3>{prof.get('name', '')}</h3>
-        <p><strong>Position:</strong> {prof.get('position', '')}</p>
-        <p><strong>Education:</strong> {prof.get('education', '')}</p>
-        <p><strong>Experience:</strong> {prof.get('experience', '')}</p>
-        {contact_html}
-        {email_html}
-    </div>
-    """
+    """Format a Faculty record as an HTML card."""
+    return answer_templates.render("faculty_card.html", prof=prof)
 
 # Function to get IT Faculty Response
 def get_it_faculty_response():
-    cards = "".join([format_faculty_card(prof) for prof in faculty_data.get("it", [])])
-    return f"""
-    <div class="faculty-section">
-        <h2><i class="fas fa-network-wired"></i> Information Technology Faculty</h2>
-        <div class="faculty-grid">
-            {cards}
-        </div>
-    </div>
-    """
+    return get_faculty_response("it")
+
+# Name, position and qualification search over every department's faculty;
+# the college's own name is not a faculty name
+faculty_directory = FacultyDirectory(department_records, ignore_names=tokenize(college_name))
+faculty_cards = {prof: format_faculty_card(prof) for prof in faculty_directory.members}
 
+# Chat command of the "Show more" button: "faculty page <cursor>"
+FACULTY_PAGE_COMMAND = "faculty page "
 
+def get_faculty_page(cursor):
+    """(html, next_cursor) of a later page of a faculty listing
 
+    Raises ValueError for a malformed cursor.
+    """
+    query, offset = decode_cursor(cursor)
+    members, next_cursor = faculty_directory.page(query, offset)
+    page = faculty_list(render_faculty_list(members, next_cursor), "", "", members, next_cursor)
+    if next_cursor:
+        return compose(page), next_cursor
+    return compose(page, button_sets.block("departments")), next_cursor
+
+# Faculty listings are rendered once, not on every request
+faculty_listings = {dept: compose(get_faculty_response(dept), button_sets.block("departments"))
+                    for dept, record in department_records.items() if record.faculty}
+
+def get_faculty_search_response(query):
+    """First page of the faculty members a directory search found"""
+    members, next_cursor = faculty_directory.page(query)
+    title, icon = "Faculty", "fas fa-chalkboard-teacher"
+    if not members:
+        return compose(render_faculty_list(members, None, title, icon,
+                                           empty_message="No faculty member matches your question."),
+                       button_sets.block("departments"))
+    return compose(faculty_list(render_faculty_list(members, next_cursor, title, icon),
+                                title, icon, members, next_cursor))
 
 # Sample responses for the chatbot
 responses ={
@@ -1335,29 +377,23 @@ responses ={
     ],
 
     "faculty": {
-        "civil": lambda: get_faculty_response("civil") + dept_buttons,
-        "mechanical": lambda: get_faculty_response("mechanical") + dept_buttons,
-        "electrical": lambda: get_faculty_response("electrical") + dept_buttons,
-        "computer": lambda: get_faculty_response("computer") + dept_buttons,
-        "it": lambda: get_faculty_response("it") + dept_buttons,
-        "default": lambda: f"""
-        <div class="faculty-intro">
-            <h2><i class="fas fa-chalkboard-teacher"></i> Our Distinguished Faculty</h2>
-            <p>Select a department to view faculty members:</p>
-            {dept_buttons}
-        </div>
-        """
+        **faculty_listings,
+        "default": answer_templates.render(
+            "faculty_intro.html", buttons=dept_buttons,
+            heading="Our Distinguished Faculty",
+            prompt="Select a department to view faculty members:",
+        )
     },
      # [Previous response templates remain unchanged...]
    
     "leadership": {
-        "president": leadership_info["president"] + dept_buttons ,
-        "principal": leadership_info["principal"] + dept_buttons ,
-        "director": leadership_info["director"] + dept_buttons ,
-        "address": leadership_info["address"] + dept_buttons ,
-        "admission": leadership_info["admission"] + dept_buttons ,
-        "contact": leadership_info["contact"] + dept_buttons ,
-        "default": "Here's information about our institution:" + dept_buttons 
+        "president": compose(leadership_info["president"], button_sets.block("departments")),
+        "principal": compose(leadership_info["principal"], button_sets.block("departments")),
+        "director": compose(leadership_info["director"], button_sets.block("departments")),
+        "address": compose(leadership_info["address"], button_sets.block("departments")),
+        "admission": compose(leadership_info["admission"], button_sets.block("departments")),
+        "contact": compose(leadership_info["contact"], button_sets.block("departments")),
+        "default": compose("Here's information about our institution:", button_sets.block("departments"))
     },
    
    "discipline": {
@@ -1404,10 +440,10 @@ responses ={
     },
 
     "fees": {
-        "main": btech_fees["overview"],
-        "payment": btech_fees["payment"],
-        "scholarship": btech_fees["scholarship"],
-        "default": btech_fees["overview"] + "<br><br>You can also ask about:<br>- Payment options<br>- Scholarship opportunities"
+        "main": compose(fee_table(fee_schedule.overview)),
+        "payment": fee_schedule.payment,
+        "scholarship": fee_schedule.scholarship,
+        "default": compose(fee_table(fee_schedule.overview), "<br><br>You can also ask about:<br>- Payment options<br>- Scholarship opportunities")
     },
 
      # [Previous response templates remain unchanged...]
@@ -1436,18 +472,12 @@ hinglish_responses = {
     "admission": admission_info,
     "contact": contact_details,
     "faculty": {
-        "civil": lambda: get_faculty_response("civil") + dept_buttons,
-        "mechanical": lambda: get_faculty_response("mechanical") + dept_buttons,
-        "electrical": lambda: get_faculty_response("electrical") + dept_buttons,
-        "computer": lambda: get_faculty_response("computer") + dept_buttons,
-        "it": lambda: get_faculty_response("it") + dept_buttons,
-        "default": lambda: f"""
-        <div class="faculty-intro">
-            <h2><i class="fas fa-chalkboard-teacher"></i> Hamaare Pratishthit Faculty</h2>
-            <p>Faculty sadasyon ko dekhne ke liye ek department chunein:</p>
-            {dept_buttons}
-        </div>
-        """
+        **faculty_listings,
+        "default": answer_templates.render(
+            "faculty_intro.html", buttons=dept_buttons,
+            heading="Hamaare Pratishthit Faculty",
+            prompt="Faculty sadasyon ko dekhne ke liye ek department chunein:",
+        )
     },
     "default": "Maaf kijiye, main samajh nahi paya. Kya aap departments, courses, admission dates, ya contact information ke baare me pooch sakte hain?"
 }
@@ -1459,161 +489,414 @@ hinglish_keywords = [
     'chahiye', 'mil', 'sakte', 'sakta', 'jaankari', 'prakriya', 'tareekh'
 ]
 
+# Fixed payloads of the bot's own buttons, answered without the NLP pipeline
+section_commands = {
+    "about": "about {dept} engineering",
+    "vision": "vision of {dept} engineering",
+    "mission": "mission of {dept} engineering",
+    "labs": "labs in {dept} engineering",
+    "programs": "programs in {dept}",
+    "infrastructure": "infrastructure in {dept}",
+    "research": "research in {dept}",
+    "activities": "activities in {dept}",
+    "achievements": "achievements in {dept}",
+}
+leadership_commands = {
+    "president": "president",
+    "principal": "principal",
+    "director": "director",
+    "address": "college address",
+    "admission": "admission contact",
+    "contact": "college contact",
+}
+
+button_actions = ActionRegistry()
+for dept, listing in faculty_listings.items():
+    button_actions.register(f"faculty.{dept}", listing, f"{dept} faculty", f"faculty in {dept}")
+for dept, record in department_records.items():
+    for section, command in section_commands.items():
+        if section in record.sections:
+            button_actions.register(f"department.{dept}.{section}",
+                                    compose(record.sections[section], button_sets.block("departments")),
+                                    command.format(dept=dept))
+for topic, command in leadership_commands.items():
+    button_actions.register(f"leadership.{topic}", responses["leadership"][topic], command)
+button_actions.freeze()
+
+def flatten_answers(topics):
+    """{"faculty": {"civil": ...}} -> {"faculty.civil": (...,)} for rule paths"""
+    answers = {}
+    for topic, value in topics.items():
+        if isinstance(value, dict):
+            for subtopic, answer in value.items():
+                answers[f"{topic}.{subtopic}"] = tuple(answer) if isinstance(answer, list) else (answer,)
+        else:
+            answers[topic] = tuple(value) if isinstance(value, list) else (value,)
+    return answers
+
+# Topic answers for fallback_rules paths; greetings, the general topics and
+# faculty are localized, the rest only exists in English
+topic_answers = flatten_answers({
+    **responses,
+    "departments": department_info,
+    "courses": courses_info,
+    "admission": admission_info,
+    "contact": contact_details,
+})
+hinglish_topic_answers = flatten_answers(hinglish_responses)
+fallback_rules = RuleEngine()
+
+# Free-text search over every knowledge passage for messages no intent or
+# topic rule covers: CHATBOT_SEARCH_BACKEND=bm25 (in-memory, rebuilt with the
+# data snapshot), fts5 (SQLite FTS5 on disk) or none
+SEARCH_BACKEND = os.environ.get("CHATBOT_SEARCH_BACKEND", "bm25")
+# Relevance below which a search hit is not used as the answer, per backend:
+# FTS5's bm25() uses its own IDF and per-column weights, so the two scales differ
+SEARCH_MIN_SCORES = {
+    "bm25": float(os.environ.get("CHATBOT_BM25_MIN_SCORE", "2.0")),
+    "fts5": float(os.environ.get("CHATBOT_FTS5_MIN_SCORE", os.environ.get("CHATBOT_SEARCH_MIN_SCORE", "2.0"))),
+}
+passage_store = None
+if SEARCH_BACKEND == "fts5":
+    if fts5_available():
+        passage_store = PassageStore()
+    else:
+        print("Warning: this SQLite build has no FTS5; passage search disabled")
+        SEARCH_BACKEND = "none"
+
+def search_passages(text, language):
+    """Best (passage_id, html, score) for text, or None below the backend's minimum score"""
+    if SEARCH_BACKEND == "bm25":
+        hits = data_reloader.current.tables['passages'].search(text, language)
+    elif passage_store is not None:
+        hits = passage_store.search(text, language)
+    else:
+        hits = []
+    if hits and hits[0][2] >= SEARCH_MIN_SCORES[SEARCH_BACKEND]:
+        return hits[0]
+    return None
+
+def build_tables(college_data):
+    """Answer tables derived from college_data.json, rebuilt on every reload"""
+    if passage_store is not None:
+        # Only passages that changed since the last build are rewritten
+        added, updated, removed = passage_store.sync(iter_passages(college_data, knowledge))
+        print(f"Passage index: {added} added, {updated} updated, {removed} removed")
+    # Every (language, intent, department) answer of the NLP path, rendered once
+    table = build_response_table(
+        college_data,
+        department_answers={dept: record.section('about') for dept, record in department_records.items()},
+        faculty_answers=faculty_listings,
+        contact_fallback=contact_info,
+        # The fee table, so format=blocks gets a fee_table block; hindi keeps its translation
+        fees_answers={'english': responses["fees"]["main"], 'hinglish': responses["fees"]["main"]},
+    )
+    english = {**topic_answers, "default": lookup(table, 'english', 'general')}
+    return MappingProxyType({
+        'passages': PassageIndex(iter_passages(college_data, knowledge)) if SEARCH_BACKEND == "bm25" else None,
+        'responses': table,
+        'topics': MappingProxyType({
+            'english': MappingProxyType(english),
+            'hinglish': MappingProxyType({**english, **hinglish_topic_answers}),
+        }),
+    })
+
+# Immutable snapshot of college_data.json and its tables; a watcher thread
+# swaps in a new one when the file changes (CHATBOT_RELOAD_INTERVAL=0 disables it)
+data_reloader = SnapshotReloader(
+    'college_data.json', build_tables,
+    interval=float(os.environ.get("CHATBOT_RELOAD_INTERVAL", "2")),
+    on_swap=lambda snapshot: response_cache.clear(),
+    preloaded=preloaded_college_data,
+).start()
+print("College data loaded successfully!")
+
 def is_hinglish(text):
     """Check if the text contains Hinglish keywords."""
     return any(keyword in text.lower().split() for keyword in hinglish_keywords)
 
 
 
+@app.after_request
+def encode_response(response):
+    """Strong ETags (and 304s) for deterministic answers, gzip/br from a cache
+
+    The ETag is the data snapshot version, a digest of the JSON body and the
+    content coding, so it changes whenever the bytes sent would change.
+    """
+    if response.status_code != 200 or response.direct_passthrough or not response.is_json:
+        return response
+    body = response.get_data()
+    coding = negotiate(request.headers.get('Accept-Encoding')) if len(body) >= COMPRESS_MIN_SIZE else None
+    digest = body_digest(body)
+    response.vary.add('Accept-Encoding')
+    if g.get('deterministic'):
+        response.set_etag(f"{data_reloader.current.version}-{digest}" + (f"-{coding}" if coding else ""))
+        response.headers.setdefault('Cache-Control', 'no-cache')
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+    if coding:
+        response.set_data(compressed_bodies.get(body, coding, digest))
+        response.headers['Content-Encoding'] = coding
+    return response
+
 @app.route('/')
 def home():
     """Render the main chatbot interface"""
     return render_template('help.html', college_name=college_name)
 
-@app.route('/get_response', methods=['POST'])
-def get_response():
-    """Handle user messages and return chatbot responses using NLP"""
+def answer_payload(answer, fmt):
+    """``response`` HTML, or ``blocks`` when the client asked for format=blocks"""
+    if fmt == 'blocks':
+        return {'blocks': list(blocks_of(answer))}
+    return {'response': answer}
+
+def quick_answer(values):
+    """Answer requests that need no NLP: button actions and commands, faculty
+    pages and cached questions. Returns the answer_message dict, or None.
+    """
+    # Clients that know the opaque action ID of a button can send it directly
+    action_id = values.get('action')
+    if action_id:
+        answer = button_actions.answer(action_id)
+        if answer is not None:
+            return {'answer': answer, 'action': action_id, 'stages': ['button'], 'deterministic': True}
+    
+    user_message = values['user_message'].strip()
+    
+    if not user_message:
+        return {'answer': "Please enter a message!", 'deterministic': False}
+    
+    # "Show more faculty": the next page of a listing, straight from its cursor
+    if user_message.lower().startswith(FACULTY_PAGE_COMMAND):
+        try:
+            answer, _ = get_faculty_page(user_message[len(FACULTY_PAGE_COMMAND):].lower())
+        except ValueError:
+            pass
+        else:
+            return {'answer': answer, 'stages': ['faculty_page'], 'deterministic': True}
+    
+    # Button clicks send fixed strings; resolve them before cache and NLP
+    key = fingerprint(user_message)
+    button = button_actions.match(key)
+    if button is not None:
+        action_id, answer = button
+        return {'answer': answer, 'action': action_id, 'stages': ['button'], 'deterministic': True}
+    
+    # Repeated questions skip the NLP pipeline; variants still rotate
+    cached = response_cache.get((data_reloader.current.version, key))
+    if cached is not None:
+        return {
+            'answer': random.choice(cached['variants']),
+            'language': cached['language'],
+            'intent': cached['intent'],
+            'confidence': cached['confidence'],
+            'stages': ['cache'],
+            'deterministic': len(cached['variants']) == 1,
+        }
+    return None
+
+def answer_message(values):
+    """The answer to one chat request, with its metadata
+
+    ``values`` are the request parameters (user_message, or the action ID of
+    a button). Returns a dict with the ``answer``, ``deterministic`` (no
+    random variants) and the fields reported next to the answer (action,
+    language, intent, confidence, stages).
+    """
     try:
-        user_message = request.form['user_message'].strip()
-        
-        if not user_message:
-            return jsonify({'response': "Please enter a message!"})
+        result = quick_answer(values)
+    except Exception as e:
+        print(f"Error in get_response: {e}")
+        return fallback_answer(values)
+    return result if result is not None else nlp_answer(values)
+
+def nlp_answer(values):
+    """answer_message for a request quick_answer left unanswered: the NLP pipeline"""
+    try:
+        # One snapshot for the whole request, even if a reload swaps it meanwhile
+        snapshot = data_reloader.current
+        user_message = values['user_message'].strip()
         
         # Process the message through our NLP pipeline
+        stages = []
         language = get_language(user_message)
-        intent, entities, confidence = get_intent_and_entities(user_message, language)
-        response = generate_response(intent, entities, language, confidence)
-        
-        return jsonify({
-            'response': response,
+        stages.append("language")
+        intent, entities, confidence = get_intent_and_entities(user_message, language, stages)
+        variants = resolve_response(intent, entities, language, snapshot)
+        response_cache.put((snapshot.version, fingerprint(user_message)), {
+            'variants': variants,
             'language': language,
             'intent': intent,
             'confidence': confidence
         })
         
+        return {
+            'answer': random.choice(variants),
+            'language': language,
+            'intent': intent,
+            'confidence': confidence,
+            'stages': stages,
+            'deterministic': len(variants) == 1,
+        }
+        
     except Exception as e:
         print(f"Error in get_response: {e}")
-        # Fallback to original logic if NLP fails
-        user_message = request.form['user_message'].lower()
-        
-        use_hinglish = is_hinglish(user_message)
-        current_responses = hinglish_responses if use_hinglish else responses
- 
-    # Determine the appropriate response
-    if any(word in user_message for word in ['hi', 'hello', 'hey', 'namaste']):
-        response = random.choice(current_responses["greeting"])
-    elif 'department' in user_message or 'branch' in user_message:
-        response = current_responses["departments"]
-    elif 'course' in user_message or 'program' in user_message:
-        response = current_responses["courses"]
-    elif 'date' in user_message or 'when' in user_message or 'admission' in user_message:
-        response = current_responses["admission"]
-    elif 'contact' in user_message or 'phone' in user_message or 'email' in user_message:
-        response = current_responses["contact"]
-    elif 'faculty' in user_message or 'professor' in user_message or 'teacher' in user_message:
-        if 'civil' in user_message:
-            response = current_responses["faculty"]["civil"]()
-        elif 'mechanical' in user_message:
-            response = current_responses["faculty"]["mechanical"]()
-        elif 'electrical' in user_message:
-            response = current_responses["faculty"]["electrical"]()
-        elif 'computer' in user_message or 'cse' in user_message:
-            response = current_responses["faculty"]["computer"]()
-        elif 'information technology' in user_message or 'it' in user_message:
-            response = current_responses["faculty"]["it"]()
-        else:
-            response = current_responses["faculty"]["default"]()
-    elif 'president' in user_message:
-        response = responses["leadership"]["president"]
-    elif 'principal' in user_message:
-        response = responses["leadership"]["principal"]
-    elif 'director' in user_message:
-        response = responses["leadership"]["director"]
-    elif 'address' in user_message:
-        response = responses["leadership"]["address"]
-    elif 'admission' in user_message and ('contact' in user_message or 'number' in user_message):
-        response = responses["leadership"]["admission"]
-    elif 'contact' in user_message and ('college' in user_message or 'email' in user_message):
-        response = responses["leadership"]["contact"]
-    elif 'college' in user_message and ('about' in user_message or 'info' in user_message):
-        response = responses["leadership"]["default"]
-    elif 'discipline' in user_message or 'rules' in user_message or 'regulation' in user_message:
-        if 'attend' in user_message:
-            response = responses["discipline"]["attendance"]
-        elif 'ragg' in user_message:
-            response = responses["discipline"]["ragging"]
-        elif 'anti' in user_message or 'social' in user_message:
-            response = responses["discipline"]["anti_social"]
-        elif 'uniform' in user_message or 'dress' in user_message:
-            response = responses["discipline"]["uniform"]
-        elif 'library' in user_message:
-            response = responses["discipline"]["library"]
-        elif 'behav' in user_message:
-            response = responses["discipline"]["behavior"]
-        elif 'schedule' in user_message or 'time' in user_message:
-            response = responses["discipline"]["schedule"]
-        elif 'conduct' in user_message:
-            response = responses["discipline"]["conduct"]
-        elif 'general' in user_message or 'code' in user_message:
-            response = responses["discipline"]["general"]
-        elif 'all' in user_message or 'complete' in user_message:
-            response = responses["discipline"]["full"]
-        else:
-            response = responses["discipline"]["default"]
-    elif 'transport' in user_message or 'bus' in user_message:
-        if 'feature' in user_message:
-            response = responses["transportation"]["features"]
-        elif 'schedule' in user_message or 'time' in user_message:
-            response = responses["transportation"]["schedule"]
-        else:
-            response = responses["transportation"]["default"]
-    elif 'workshop' in user_message:
-        if 'fitting' in user_message:
-            response = responses["workshop"]["fitting"]
-        elif 'carpent' in user_message:
-            response = responses["workshop"]["carpentry"]
-        elif 'weld' in user_message:
-            response = responses["workshop"]["welding"]
-        else:
-            response = responses["workshop"]["default"]
-    elif 'computer' in user_message or 'lab' in user_message:
-        if 'feature' in user_message:
-            response = responses["computer"]["features"]
-        elif 'resource' in user_message:
-            response = responses["computer"]["resources"]
-        else:
-            response = responses["computer"]["default"]
-    elif 'library' in user_message:
-        if 'service' in user_message:
-            response = responses["library"]["services"]
-        elif 'facilit' in user_message:
-            response = responses["library"]["facilities"]
-        else:
-            response = responses["library"]["default"]
-    elif 'fee' in user_message or 'payment' in user_message or 'scholarship' in user_message:
-        if 'payment' in user_message or 'pay' in user_message:
-            response = responses["fees"]["payment"]
-        elif 'scholarship' in user_message:
-            response = responses["fees"]["scholarship"]
-        else:
-            response = responses["fees"]["main"]
-    elif 'disab' in user_message or 'accessib' in user_message or 'special need' in user_message:
-        if 'support' in user_message or 'service' in user_message:
-            response = responses["disability"]["support"]
-        elif 'physical' in user_message or 'ramp' in user_message or 'wheelchair' in user_message:
-            response = responses["disability"]["access"]
-        elif 'learn' in user_message or 'exam' in user_message or 'software' in user_message:
-            response = responses["disability"]["learning"]
-        elif 'campus' in user_message or 'hostel' in user_message or 'parking' in user_message:
-            response = responses["disability"]["campus"]
-        elif 'contact' in user_message or 'help' in user_message or 'assist' in user_message:
-            response = responses["disability"]["contact"]
+        return fallback_answer(values)
+
+def fallback_answer(values):
+    """The topic rules' answer, for when the NLP pipeline fails"""
+    user_message = values.get('user_message', '')
+    language = 'hinglish' if is_hinglish(user_message) else 'english'
+    topic = fallback_rules.match(user_message) or 'default'
+    answers = data_reloader.current.tables['topics'][language]
+    variants = answers.get(topic) or answers['default']
+    return {'answer': random.choice(variants), 'stages': ['rules'], 'deterministic': False}
+
+@app.route('/get_response', methods=['GET', 'POST'])
+def get_response():
+    """Handle user messages and return chatbot responses using NLP
+
+    ``format=blocks`` returns typed blocks (see response_blocks) instead of
+    the HTML ``response``. Answers without random variants get an ETag, so a
+    GET repeating a question can be answered with 304 Not Modified.
+    """
+    result = answer_message(request.values)
+    g.deterministic = result.pop('deterministic')
+    return jsonify({**answer_payload(result.pop('answer'), request.values.get('format')), **result})
+
+def chat_reply(message):
+    """Reply to one WebSocket chat message: /get_response's JSON without the id"""
+    result = answer_message(message)
+    del result['deterministic']
+    return {**answer_payload(result.pop('answer'), message.get('format')), **result}
+
+if Sock is not None:
+    sock = Sock(app)
+    
+    @sock.route('/chat')
+    def chat_socket(ws):
+        """One WebSocket per chat session, messages multiplexed by id (see chat_channel)"""
+        ChatChannel(ws, chat_reply).serve()
+
+def html_chunks(html, size):
+    """Pieces of at most about ``size`` characters, cut after a tag"""
+    start = 0
+    while len(html) - start > size:
+        cut = html.rfind('>', start, start + size) + 1
+        if cut <= start:
+            cut = start + size
+        yield html[start:cut]
+        start = cut
+    if start < len(html):
+        yield html[start:]
+
+def stream_answer(answer):
+    """HTML of an answer in pieces, in order
+
+    A paginated faculty list is streamed in full, card by card, from the
+    pre-rendered cards: its header and first cards go out before the rest
+    are even looked up. Everything else is cut into STREAM_CHUNK_SIZE pieces.
+    """
+    for html, block in parts_of(answer):
+        if block['type'] == 'faculty_list' and block['next']:
+            query, offset = decode_cursor(block['next'])
+            members = faculty_directory.answer(query)[offset - len(block['members']):]
+            yield from answer_templates.stream(
+                "faculty_list.html",
+                title=block['title'], icon=block['icon'], empty_message="",
+                cards=(faculty_cards[prof] for prof in members),
+                next_cursor=None, page_command=FACULTY_PAGE_COMMAND,
+            )
         else:
-            response = responses["disability"]["default"]    
+            yield from html_chunks(html, STREAM_CHUNK_SIZE)
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/get_response/stream', methods=['GET', 'POST'])
+def stream_response():
+    """Server-sent events version of /get_response for large answers
+
+    Sends a ``meta`` event (intent, language, stages, ...), then ``chunk``
+    events of {"html": ...} as the answer is produced, then ``done``. Pieces
+    are batched up to STREAM_CHUNK_SIZE characters per event.
+    """
+    result = answer_message(request.values)
+    del result['deterministic']
+    answer = result.pop('answer')
+    
+    def events():
+        yield sse_event('meta', result)
+        pending = []
+        pending_size = 0
+        for piece in stream_answer(answer):
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= STREAM_CHUNK_SIZE:
+                yield sse_event('chunk', {'html': "".join(pending)})
+                pending, pending_size = [], 0
+        if pending:
+            yield sse_event('chunk', {'html': "".join(pending)})
+        yield sse_event('done', {})
+    
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/faculty/search')
+def faculty_search():
+    """Faculty members as JSON, by name prefix, position, qualification and department
+
+    ``q`` is a free-text question parsed like a chat message (or else a name
+    prefix); the other parameters are matched as given.
+    """
+    args = request.args
+    if args.get('q'):
+        query = faculty_directory.parse(args['q'], args.get('department') or match_intent(args['q'])["department"])
+        members = faculty_directory.answer(query) if query is not None else faculty_directory.search(name=args['q'])
     else:
-        response = current_responses["default"]
- 
-    return jsonify({'response': response})
+        members = faculty_directory.search(
+            name=args.get('name', ''),
+            position=args.get('position', '').lower(),
+            qualification=args.get('qualification', ''),
+            department=args.get('department', '').lower(),
+        )
+    g.deterministic = True
+    return jsonify({'count': len(members), 'results': [prof.as_dict() for prof in members]})
+
+@app.route('/faculty/page')
+def faculty_page():
+    """One page of a faculty listing as HTML, plus the cursor of the next one"""
+    try:
+        answer, next_cursor = get_faculty_page(request.args.get('cursor', ''))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    g.deterministic = True
+    return jsonify({**answer_payload(answer, request.args.get('format')), 'next': next_cursor})
+
+@app.route('/blocks/buttons')
+def block_buttons():
+    """Button sets referenced by ``buttons`` blocks; static, so clients cache them"""
+    g.deterministic = True
+    response = jsonify(button_sets.catalog())
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    return response
+
+@app.route('/render_stats')
+def render_stats():
+    """Render counts and latencies per answer template"""
+    return jsonify(answer_templates.stats())
+
+@app.route('/nlp_stats')
+def nlp_stats():
+    """Batch sizes and queueing delay of the NER micro-batchers"""
+    return jsonify({name: batcher.stats() for name, batcher in ner_batchers.items()})
+
+@app.route('/cache_stats')
+def cache_stats():
+    """Hit/miss/eviction counters of the response cache"""
+    return jsonify(response_cache.stats())
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Linear intent classifier over hashed character n-gram TF-IDF features.
+
+The model is stored in ``intent_model.npz`` (written by ``train_model.py``):
+
+    labels       intent names, one per weight row
+    weights      (n_intents, n_features) float32
+    bias         (n_intents,) float32
+    idf          (n_features,) float32 inverse document frequencies
+    temperature  scalar softmax temperature fitted on held-out data
+
+Scoring a batch of messages is one matrix multiply, and the softmax over the
+temperature-scaled logits gives calibrated confidences for every intent.
+"""
+import os
+import numpy as np
+
+from ngram_features import batch_ngram_indices, ngram_indices
+
+MODEL_PATH = os.environ.get("CHATBOT_INTENT_MODEL",
+                            os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_model.npz"))
+
+
+def featurize(texts, idf):
+    """Row-normalized TF-IDF matrix (len(texts), len(idf)) for ``texts``."""
+    n_features = len(idf)
+    rows, indices = batch_ngram_indices(texts, n_features)
+    counts = np.bincount(rows * n_features + indices,
+                         minlength=len(texts) * n_features).astype(np.float32)
+    matrix = np.log1p(counts.reshape(len(texts), n_features)) * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    probs = np.exp(logits)
+    return probs / probs.sum(axis=1, keepdims=True)
+
+
+class IntentClassifier:
+    """Multinomial logistic regression over TF-IDF n-gram features."""
+
+    def __init__(self, labels, weights, bias, idf, temperature=1.0):
+        self.labels = [str(label) for label in labels]
+        self.weights = weights
+        self.bias = bias
+        self.idf = idf
+        self.temperature = float(temperature)
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        with np.load(path) as data:
+            return cls(data["labels"], data["weights"], data["bias"],
+                       data["idf"], data["temperature"])
+
+    def save(self, path=MODEL_PATH):
+        np.savez(path, labels=np.array(self.labels), weights=self.weights.astype(np.float32),
+                 bias=self.bias.astype(np.float32), idf=self.idf.astype(np.float32),
+                 temperature=np.float32(self.temperature))
+
+    def logits(self, texts):
+        return featurize(texts, self.idf) @ self.weights.T + self.bias
+
+    def predict_proba(self, texts):
+        """(len(texts), n_intents) matrix of calibrated probabilities."""
+        return softmax(self.logits(texts) / self.temperature)
+
+    def predict(self, text):
+        """Return ``(intent, confidence, {intent: probability})`` for one message."""
+        probs = self.predict_proba([text])[0]
+        best = int(probs.argmax())
+        return self.labels[best], float(probs[best]), dict(zip(self.labels, probs.tolist()))
+
+
+def train(texts, labels, n_features=1 << 12, epochs=500, learning_rate=5.0, l2=1e-4):
+    """Fit an IntentClassifier with full-batch gradient descent."""
+    intents = sorted(set(labels))
+    y = np.array([intents.index(label) for label in labels])
+
+    doc_freq = np.zeros(n_features, dtype=np.float64)
+    for text in texts:
+        doc_freq[np.unique(ngram_indices(text, n_features))] += 1
+    idf = np.log((1 + len(texts)) / (1 + doc_freq)) + 1
+
+    x = featurize(texts, idf.astype(np.float32))
+    onehot = np.eye(len(intents), dtype=np.float32)[y]
+    weights = np.zeros((len(intents), n_features), dtype=np.float32)
+    bias = np.zeros(len(intents), dtype=np.float32)
+    for _ in range(epochs):
+        grad = (softmax(x @ weights.T + bias) - onehot) / len(texts)
+        weights -= learning_rate * (grad.T @ x + l2 * weights)
+        bias -= learning_rate * grad.sum(axis=0)
+    return IntentClassifier(intents, weights, bias, idf.astype(np.float32))
+
+
+def fit_temperature(model, texts, labels):
+    """Pick the softmax temperature minimizing log-loss on held-out data."""
+    logits = model.logits(texts)
+    y = np.array([model.labels.index(label) for label in labels])
+    best_t, best_nll = 1.0, np.inf
+    for t in np.exp(np.linspace(np.log(0.05), np.log(5.0), 60)):
+        probs = softmax(logits / t)
+        nll = -np.log(probs[np.arange(len(y)), y] + 1e-12).mean()
+        if nll < best_nll:
+            best_t, best_nll = float(t), nll
+    model.temperature = best_t
+    return best_t
+
+
+def load_model(path=MODEL_PATH):
+    """Load the classifier if it has been trained, else return None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return IntentClassifier.load(path)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Warning: could not load intent model {path}: {e}")
+        return None
@@ -0,0 +1,187 @@
+"""Single-pass keyword matcher for intent detection.
+
+All intent keywords, department aliases and Hinglish phrases are compiled once
+at import time into a token-level Aho-Corasick automaton. A message is
+tokenized and scanned once; every hit is scored against every intent instead
+of stopping at the first ``elif`` branch that fires. Matching works on whole
+tokens, so "hi" no longer matches inside "this".
+"""
+import string
+
+# Punctuation is mapped to spaces and the text split on whitespace; this is
+# several times cheaper than a regex tokenizer and keeps Devanagari vowel
+# signs (which are not \w in Python) inside their words.
+_PUNCT_TO_SPACE = str.maketrans({ch: " " for ch in string.punctuation + "।॥‘’“”…"})
+
+# Intent keywords, in priority order (used to break score ties)
+INTENT_KEYWORDS = {
+    "greeting": ["hello", "hi", "hey", "namaste", "good morning", "good afternoon",
+                 "good evening", "hii", "helo", "kaise ho", "kya haal", "sup"],
+    "fees": ["fee", "fees", "cost", "price", "amount", "charge", "tuition",
+             "payment", "scholarship", "kitni fees", "fees kitni", "paisa", "rupee",
+             "fees kya hai", "फीस", "शुल्क"],
+    "department": ["department", "branch", "course", "program", "engineering",
+                   "विभाग", "शाखा", "baare mein", "about", "ke baare mein"],
+    "admission": ["admission", "apply", "application", "entrance", "eligibility",
+                  "process", "procedure", "form", "admission kaise", "apply kaise",
+                  "प्रवेश", "दाखिला", "admission process"],
+    "faculty": ["faculty", "teacher", "teachers", "professor", "professors", "staff",
+                "hod", "hods", "head", "शिक्षक", "प्रोफेसर", "kaun hain", "faculty kaun"],
+    "contact": ["contact", "phone", "email", "address", "location",
+                "संपर्क", "पता", "contact kaise"],
+    "placement": ["placement", "job", "career", "company", "package",
+                  "salary", "नौकरी", "placement details"],
+}
+
+# Confidence reported for each intent when it wins
+INTENT_CONFIDENCE = {
+    "greeting": 0.9,
+    "fees": 0.8,
+    "department": 0.9,
+    "admission": 0.8,
+    "faculty": 0.8,
+    "contact": 0.8,
+    "placement": 0.8,
+}
+
+# Department aliases, resolved to the keys used by faculty_data / *_engineering_info
+DEPARTMENT_ALIASES = {
+    "computer": ["computer", "cs", "cse", "computer science", "computer engineering"],
+    "mechanical": ["mechanical", "mech", "mechanical engineering"],
+    "electrical": ["electrical", "ee", "electrical engineering"],
+    "civil": ["civil", "civil engineering"],
+    "it": ["it", "information technology"],
+}
+
+# Per-token weights. Salutations and bare department names are weak evidence:
+# "hi, what are the fees" is a fees question and "civil faculty" is a faculty one.
+GREETING_WEIGHT = 0.5
+DEPARTMENT_ALIAS_WEIGHT = 0.5
+KEYWORD_WEIGHT = 1.0
+
+
+def tokenize(text):
+    """Split lower-cased text into word tokens."""
+    return text.lower().translate(_PUNCT_TO_SPACE).split()
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over token sequences.
+
+    Patterns are phrases of one or more tokens; each carries an arbitrary
+    payload that is returned for every occurrence found by ``scan``.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for phrase, payload in patterns:
+            tokens = tokenize(phrase)
+            if tokens:
+                self._add(tokens, payload)
+        self._build_failure_links()
+
+    def _add(self, tokens, payload):
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(tokens), payload))
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(token, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, tokens):
+        """Yield (start_index, length, payload) for every pattern occurrence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        # Most tokens start no pattern at all; jump straight between the ones that do
+        starts = [i for i, token in enumerate(tokens) if token in root]
+        state = 0
+        pos = 0
+        for start in starts:
+            if start < pos:
+                continue
+            state = 0
+            for i in range(start, len(tokens)):
+                token = tokens[i]
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+                for length, payload in out[state]:
+                    yield i - length + 1, length, payload
+                if not state:
+                    break
+            pos = i + 1
+
+
+def _compile_patterns():
+    patterns = []
+    for intent, keywords in INTENT_KEYWORDS.items():
+        weight = GREETING_WEIGHT if intent == "greeting" else KEYWORD_WEIGHT
+        for keyword in keywords:
+            patterns.append((keyword, ("intent", intent, weight)))
+    for dept, aliases in DEPARTMENT_ALIASES.items():
+        for alias in aliases:
+            patterns.append((alias, ("department", dept, DEPARTMENT_ALIAS_WEIGHT)))
+    return patterns
+
+
+_automaton = KeywordAutomaton(_compile_patterns())
+_priority = {intent: rank for rank, intent in enumerate(INTENT_KEYWORDS)}
+
+
+def match_intent(text):
+    """Scan the message once and score it against every intent.
+
+    Returns a dict with the winning ``intent`` ("general" when nothing
+    matched), its ``confidence``, the per-intent ``scores``, the resolved
+    ``department`` (or None) and the matched ``keywords``.
+    """
+    tokens = tokenize(text)
+    scores = {}
+    dept_hits = {}
+    keywords = []
+
+    for start, length, (kind, label, weight) in _automaton.scan(tokens):
+        keywords.append(" ".join(tokens[start:start + length]))
+        if kind == "department":
+            # Longest alias wins, then the earliest mention
+            best = dept_hits.get(label)
+            if best is None or (length, -start) > best:
+                dept_hits[label] = (length, -start)
+            label = "department"
+        scores[label] = scores.get(label, 0.0) + weight * length
+
+    intent = "general"
+    confidence = 0.5
+    if scores:
+        intent = max(scores, key=lambda name: (scores[name], -_priority[name]))
+        confidence = INTENT_CONFIDENCE[intent]
+
+    department = None
+    if dept_hits:
+        department = max(dept_hits, key=dept_hits.get)
+
+    return {
+        "intent": intent,
+        "confidence": confidence,
+        "scores": scores,
+        "department": department,
+        "keywords": keywords,
+    }
@@ -0,0 +1,138 @@
+"""Typed, ``__slots__``-backed records for the college knowledge base.
+
+The knowledge base arrives as nested dicts (knowledge_base.py, the mmap
+snapshot or college_data.json). ``load_records`` validates it once and turns
+it into compact records; derived fields such as the ``tel:`` and ``mailto:``
+links of a faculty member are computed here, at load time, instead of with
+string munging every time a card is rendered.
+"""
+from collections import namedtuple
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+
+# Department key -> knowledge base entry holding its sections (about, vision, ...)
+DEPARTMENT_SOURCES = {
+    "civil": "civil_engineering_info",
+    "mechanical": "mechanical_engineering_info",
+    "electrical": "electrical_engineering_info",
+    "computer": "cse_engineering_info",
+    "it": "it_engineering_info",
+}
+
+EMAIL_DOMAIN = "rvparankar.in"
+
+KnowledgeRecords = namedtuple("KnowledgeRecords", ["departments", "fees"])
+
+
+class InvalidRecord(ValueError):
+    """A knowledge base entry is missing a field or has the wrong type."""
+
+
+def _text(data, field, where, required=False):
+    value = data.get(field, "")
+    if not isinstance(value, str):
+        raise InvalidRecord(f"{where}: {field!r} must be a string")
+    if required and not value:
+        raise InvalidRecord(f"{where}: {field!r} is required")
+    return value
+
+
+class Faculty:
+    """One faculty member, with its contact links resolved at load time."""
+
+    __slots__ = ("department", "name", "position", "education", "experience",
+                 "contact", "email", "tel_link", "mailto_link")
+
+    def __init__(self, department, name, position="", education="", experience="", contact="", email=""):
+        self.department = department
+        self.name = name
+        self.position = position
+        self.education = education
+        self.experience = experience
+        self.contact = contact
+        self.email = email
+        self.tel_link = "tel:" + contact.replace(" ", "").replace("+", "") if contact else ""
+        # Entries only carry a label such as "Email Professor"; its last word
+        # is the mailbox at the college domain
+        self.mailto_link = f"mailto:{email.split()[-1].lower()}@{EMAIL_DOMAIN}" if "Email" in email else ""
+
+    @classmethod
+    def from_dict(cls, department, data, where="faculty"):
+        if not isinstance(data, Mapping):
+            raise InvalidRecord(f"{where}: expected an object")
+        return cls(department, _text(data, "name", where, required=True),
+                   *(_text(data, field, where) for field in
+                     ("position", "education", "experience", "contact", "email")))
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        return f"Faculty({self.department!r}, {self.name!r})"
+
+
+class Department:
+    """A department: its rendered sections and its faculty, in listing order."""
+
+    __slots__ = ("key", "sections", "faculty")
+
+    def __init__(self, key, sections, faculty):
+        self.key = key
+        self.sections = sections
+        self.faculty = faculty
+
+    def section(self, name, default=""):
+        return self.sections.get(name, default)
+
+    def __repr__(self):
+        return f"Department({self.key!r}, {len(self.faculty)} faculty)"
+
+
+class FeeSchedule:
+    """B.Tech fee information."""
+
+    __slots__ = ("overview", "payment", "scholarship")
+
+    def __init__(self, overview, payment, scholarship):
+        self.overview = overview
+        self.payment = payment
+        self.scholarship = scholarship
+
+    @classmethod
+    def from_dict(cls, data, where="btech_fees"):
+        if not isinstance(data, Mapping):
+            raise InvalidRecord(f"{where}: expected an object")
+        return cls(*(_text(data, field, where, required=True)
+                     for field in ("overview", "payment", "scholarship")))
+
+
+def load_faculty(faculty_data, where="faculty_data"):
+    """{department: [dict, ...]} -> {department: (Faculty, ...)}"""
+    if not isinstance(faculty_data, Mapping):
+        raise InvalidRecord(f"{where}: expected an object")
+    faculty = {}
+    for department, members in faculty_data.items():
+        if isinstance(members, str) or not isinstance(members, Sequence):
+            raise InvalidRecord(f"{where}.{department}: expected a list")
+        faculty[department] = tuple(Faculty.from_dict(department, member, f"{where}.{department}[{i}]")
+                                    for i, member in enumerate(members))
+    return faculty
+
+
+def load_records(knowledge):
+    """Validate the knowledge base mapping and build its records."""
+    faculty = load_faculty(knowledge["faculty_data"])
+    departments = {}
+    for key, source in DEPARTMENT_SOURCES.items():
+        sections = knowledge[source]
+        if not isinstance(sections, Mapping):
+            raise InvalidRecord(f"{source}: expected an object")
+        departments[key] = Department(
+            key,
+            MappingProxyType({name: _text(sections, name, source) for name in sections}),
+            faculty.get(key, ()),
+        )
+    # Departments that only have faculty listed keep their listing too
+    for key in faculty.keys() - departments.keys():
+        departments[key] = Department(key, MappingProxyType({}), faculty[key])
+    return KnowledgeRecords(MappingProxyType(departments), FeeSchedule.from_dict(knowledge["btech_fees"]))
@@ -0,0 +1,257 @@
+"""Memory-mapped binary snapshot of the college knowledge base.
+
+``build_knowledge.py`` compiles the dictionaries of knowledge_base.py and
+college_data.json into ``knowledge.bin``; every worker then opens the file
+with ``mmap`` instead of holding its own copy of the parsed data, so N
+workers share one set of physical pages and startup parses no JSON.
+
+Layout (little endian, every section 4-byte aligned)::
+
+    header          magic, format, counts and section offsets (HEADER)
+    string offsets  (n_strings + 1) x u32 into the string blob
+    nodes           n_nodes x (kind, count, first item) u32
+    items           u32 values; a dict node owns 2 * count key/value items
+                    followed by count item positions sorted by key bytes,
+                    a list node owns count values
+    string blob     every distinct string once, UTF-8
+
+A value is a u32 whose low two bits are a tag (string, dict node, list
+node, JSON scalar stored as a string) and whose remaining bits are an index.
+Dicts and lists are exposed as read-only Mapping / Sequence views that
+decode strings from the mapped pages on access.
+"""
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"CKB1"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4s9I")
+
+TAG_STRING, TAG_DICT, TAG_LIST, TAG_SCALAR = range(4)
+KIND_DICT, KIND_LIST = 0, 1
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.environ.get("CHATBOT_KNOWLEDGE_SNAPSHOT", os.path.join(ROOT, "knowledge.bin"))
+KNOWLEDGE_SOURCE = os.path.join(ROOT, "knowledge_base.py")
+
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class _Writer:
+    def __init__(self):
+        self.strings = {}
+        self.nodes = []
+        self.items = []
+
+    def string(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def value(self, obj):
+        if isinstance(obj, str):
+            return self.string(obj) << 2 | TAG_STRING
+        if isinstance(obj, Mapping):
+            return self.mapping(obj) << 2 | TAG_DICT
+        if isinstance(obj, (list, tuple)):
+            return self.sequence(obj) << 2 | TAG_LIST
+        return self.string(json.dumps(obj)) << 2 | TAG_SCALAR
+
+    def mapping(self, obj):
+        keys = [str(key) for key in obj]
+        pairs = [(self.string(key), self.value(item)) for key, item in zip(keys, obj.values())]
+        order = sorted(range(len(keys)), key=lambda i: keys[i].encode("utf-8"))
+        node = len(self.nodes)
+        self.nodes.append((KIND_DICT, len(pairs), len(self.items)))
+        for key, item in pairs:
+            self.items.extend((key << 2 | TAG_STRING, item))
+        self.items.extend(order)
+        return node
+
+    def sequence(self, obj):
+        values = [self.value(item) for item in obj]
+        node = len(self.nodes)
+        self.nodes.append((KIND_LIST, len(values), len(self.items)))
+        self.items.extend(values)
+        return node
+
+
+def compile_knowledge(data, path=SNAPSHOT_PATH):
+    """Write ``data`` (nested dicts/lists of JSON values) to ``path`` atomically."""
+    writer = _Writer()
+    root = writer.value(data)
+    encoded = [text.encode("utf-8") for text in writer.strings]
+    offsets = [0]
+    for blob in encoded:
+        offsets.append(offsets[-1] + len(blob))
+
+    str_offsets_at = HEADER.size
+    nodes_at = str_offsets_at + 4 * len(offsets)
+    items_at = nodes_at + 12 * len(writer.nodes)
+    blob_at = items_at + 4 * len(writer.items)
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded), len(writer.nodes), len(writer.items),
+                            root, str_offsets_at, nodes_at, items_at, blob_at))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for node in writer.nodes:
+            f.write(struct.pack("<3I", *node))
+        f.write(struct.pack(f"<{len(writer.items)}I", *writer.items))
+        f.write(b"".join(encoded))
+    os.replace(tmp, path)
+    return os.path.getsize(path)
+
+
+class KnowledgeSnapshot:
+    """Read-only view of a compiled snapshot file."""
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, n_strings, n_nodes, n_items, root,
+         str_offsets_at, nodes_at, items_at, blob_at) = HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} knowledge snapshot")
+        view = memoryview(self._mm)
+        self._offsets = view[str_offsets_at:nodes_at].cast("I")
+        self._nodes = view[nodes_at:items_at].cast("I")
+        self._items = view[items_at:blob_at].cast("I")
+        self._blob = blob_at
+        self.root = self.value(root)
+
+    def string_bytes(self, index):
+        return self._mm[self._blob + self._offsets[index]:self._blob + self._offsets[index + 1]]
+
+    def value(self, raw):
+        tag, index = raw & 3, raw >> 2
+        if tag == TAG_STRING:
+            return self.string_bytes(index).decode("utf-8")
+        if tag == TAG_DICT:
+            return Record(self, index)
+        if tag == TAG_LIST:
+            return Items(self, index)
+        return json.loads(self.string_bytes(index))
+
+    def node(self, index):
+        return self._nodes[3 * index + 1], self._nodes[3 * index + 2]
+
+
+class Record(Mapping):
+    """A dict stored in the snapshot; keys are found by binary search."""
+
+    __slots__ = ("_snapshot", "_count", "_first")
+
+    def __init__(self, snapshot, node):
+        self._snapshot = snapshot
+        self._count, self._first = snapshot.node(node)
+
+    def _key_bytes(self, position):
+        return self._snapshot.string_bytes(self._snapshot._items[self._first + 2 * position] >> 2)
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        target = key.encode("utf-8")
+        items = self._snapshot._items
+        order = self._first + 2 * self._count
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            position = items[order + mid]
+            if self._key_bytes(position) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            position = items[order + lo]
+            if self._key_bytes(position) == target:
+                return self._snapshot.value(items[self._first + 2 * position + 1])
+        raise KeyError(key)
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self._key_bytes(position).decode("utf-8")
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"Record({dict(self)!r})"
+
+
+class Items(Sequence):
+    """A list stored in the snapshot."""
+
+    __slots__ = ("_snapshot", "_count", "_first")
+
+    def __init__(self, snapshot, node):
+        self._snapshot = snapshot
+        self._count, self._first = snapshot.node(node)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._snapshot.value(self._snapshot._items[self._first + index])
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"Items({list(self)!r})"
+
+
+def open_snapshot(path=SNAPSHOT_PATH, sources=()):
+    """Root of the snapshot at ``path``, or None if it is missing or stale.
+
+    ``sources`` are files the snapshot was built from; if any changed since
+    the build (mtime or size) the snapshot is not used.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        root = KnowledgeSnapshot(path).root
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not open knowledge snapshot {path}: {e}")
+        return None
+    built_from = root.get("sources", {})
+    for source in sources:
+        recorded = built_from.get(os.path.basename(source))
+        if recorded is None or list(recorded) != file_signature(source):
+            print(f"Warning: {path} is older than {os.path.basename(source)}; "
+                  f"run python build_knowledge.py")
+            return None
+    return root
+
+
+def load_knowledge(path=SNAPSHOT_PATH):
+    """Return ``(knowledge, preloaded_college_data)``.
+
+    ``knowledge`` maps the names in knowledge_base.KNOWLEDGE_NAMES to their
+    values: views into the snapshot when it is current, else the module's own
+    dictionaries. ``preloaded_college_data`` is ``(signature, data)`` of the
+    college_data.json compiled into the snapshot, or None.
+    """
+    root = open_snapshot(path, sources=[KNOWLEDGE_SOURCE])
+    if root is None:
+        import knowledge_base
+        return {name: getattr(knowledge_base, name) for name in knowledge_base.KNOWLEDGE_NAMES}, None
+    signature = root["sources"].get("college_data.json")
+    if signature is None:
+        return root["knowledge"], None
+    return root["knowledge"], (tuple(signature), root["college_data"])
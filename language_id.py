@@ -0,0 +1,97 @@
+"""Fast script-based language classifier for english / hindi / hinglish.
+
+One pass over the message tokens counts Devanagari and Latin words and looks
+the Latin ones up in a hashed (frozenset) lexicon of romanized Hindi words.
+Most messages are decided here; ``classify_language`` also returns a
+confidence so callers can fall back to a slower detector only when the
+answer is genuinely ambiguous.
+
+Ambiguous messages go to the trained n-gram model (language_model.npy, see
+train_language_model.py) when it is available, and only to langdetect when
+neither the model nor NumPy is.
+"""
+from intent_matcher import tokenize
+
+try:
+    from language_model import load_model
+    _model = load_model()
+except ImportError:
+    _model = None
+
+# Romanized Hindi words that do not double as common English words
+HINGLISH_WORDS = frozenset([
+    "aap", "aapka", "aapki", "aapko", "aur", "baare", "bata", "batao", "bataiye",
+    "bataye", "bhai", "bhi", "bolo", "btao", "chahiye", "chahte", "dijiye", "haan",
+    "hai", "hain", "hamare", "hoga", "hogi", "hoon", "hota", "hoti", "hum",
+    "humare", "hun", "jaankari", "janna", "kab", "kaha", "kahan", "kaise", "kaisa",
+    "kaisi", "kar", "karna", "karo", "kaun", "kaunsa", "khulti", "kis", "kisme",
+    "kitna", "kitne", "kitni", "konsa", "konsi", "kripya", "kuch", "kya", "kyu",
+    "kyun", "liye", "mein", "milega", "milegi", "mujhe", "naam", "nahi", "nahin",
+    "prakriya", "sabhi", "sakta", "sakte", "sikhate", "tareekh", "theek", "tum",
+    "wala", "wali", "yaha", "yahan", "yaar", "zaroori", "accha", "acha", "namaste",
+])
+
+# Romanized Hindi words that are also English words or fragments ("main", "par")
+HINGLISH_WEAK_WORDS = frozenset(["main", "ka", "ki", "ke", "ko", "se", "par", "ho", "na"])
+
+# Confidence below which the result should be double-checked by another detector
+AMBIGUOUS_BELOW = 0.6
+
+
+def _is_devanagari(token):
+    return "ऀ" <= token[0] <= "ॿ"
+
+
+def classify_language(text):
+    """Classify ``text`` as 'english', 'hindi' or 'hinglish'.
+
+    Returns a ``(language, confidence)`` tuple. Confidence is below
+    AMBIGUOUS_BELOW when the script and lexicon evidence do not settle it.
+    """
+    devanagari = latin = 0
+    hinglish = 0.0
+    for token in tokenize(text):
+        if token.isascii():
+            if not token.isalpha():
+                continue            # numbers, "b.tech" fragments, ids
+            latin += 1
+            if token in HINGLISH_WORDS:
+                hinglish += 1
+            elif token in HINGLISH_WEAK_WORDS:
+                hinglish += 0.5
+        elif _is_devanagari(token):
+            devanagari += 1
+
+    if devanagari and latin:
+        return 'hinglish', 0.9
+    if devanagari:
+        return 'hindi', 0.99
+    if not latin:
+        return 'english', 0.0      # digits, emoji or another script
+
+    ratio = hinglish / latin
+    if hinglish >= 2 or ratio >= 0.25:
+        return 'hinglish', min(0.99, 0.6 + ratio)
+    if hinglish:
+        # A stray weak word in a long English sentence is fine; in a short one it is not
+        return 'english', 0.8 - 2 * ratio
+    return 'english', 0.9 if latin >= 2 else 0.7
+
+
+def detect_language(text):
+    """Classify ``text``, asking a slower detector only when the answer is ambiguous."""
+    language, confidence = classify_language(text)
+    if confidence >= AMBIGUOUS_BELOW:
+        return language
+    if _model is not None:
+        return _model.predict(text)[0]
+    try:
+        from langdetect import detect, LangDetectException
+    except ImportError:
+        return language
+    try:
+        if detect(text) == 'hi':
+            return 'hindi'
+    except LangDetectException:
+        pass
+    return language
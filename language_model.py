@@ -0,0 +1,70 @@
+"""Character n-gram naive Bayes language identifier (english/hindi/hinglish).
+
+The model is a single float32 ``.npy`` array of shape
+``(len(LANGUAGES), n_features + 1)``: per-language log-probabilities of every
+hashed n-gram bucket, with the log prior in the last column. It is opened with
+``mmap_mode='r'`` so every worker shares the same pages and start-up does no
+parsing. Train it with ``python train_language_model.py``.
+"""
+import os
+import numpy as np
+
+from ngram_features import ngram_indices
+
+LANGUAGES = ("english", "hindi", "hinglish")
+MODEL_PATH = os.environ.get("CHATBOT_LANGUAGE_MODEL",
+                            os.path.join(os.path.dirname(os.path.abspath(__file__)), "language_model.npy"))
+
+
+class LanguageModel:
+    """Naive Bayes scorer over a (memory-mapped) log-probability table."""
+
+    def __init__(self, table):
+        self.table = table
+        self.n_features = table.shape[1] - 1
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        table = np.load(path, mmap_mode="r")
+        if table.ndim != 2 or table.shape[0] != len(LANGUAGES):
+            raise ValueError(f"{path} is not a language model table")
+        return cls(table)
+
+    def save(self, path=MODEL_PATH):
+        np.save(path, np.asarray(self.table, dtype=np.float32))
+
+    def predict(self, text):
+        """Return ``(language, probability)`` for ``text``."""
+        idx = ngram_indices(text, self.n_features)
+        scores = self.table[:, idx].sum(axis=1) + self.table[:, -1]
+        probs = np.exp(scores - scores.max())
+        probs /= probs.sum()
+        best = int(probs.argmax())
+        return LANGUAGES[best], float(probs[best])
+
+
+def train(texts, labels, n_features=1 << 14, alpha=0.1):
+    """Fit a LanguageModel on ``texts`` labelled with names from LANGUAGES."""
+    counts = np.zeros((len(LANGUAGES), n_features), dtype=np.float64)
+    docs = np.zeros(len(LANGUAGES), dtype=np.float64)
+    for text, label in zip(texts, labels):
+        row = LANGUAGES.index(label)
+        np.add.at(counts[row], ngram_indices(text, n_features), 1)
+        docs[row] += 1
+
+    table = np.empty((len(LANGUAGES), n_features + 1), dtype=np.float32)
+    smoothed = counts + alpha
+    table[:, :-1] = np.log(smoothed / smoothed.sum(axis=1, keepdims=True))
+    table[:, -1] = np.log((docs + 1) / (docs.sum() + len(LANGUAGES)))
+    return LanguageModel(table)
+
+
+def load_model(path=MODEL_PATH):
+    """Load the model if it has been trained, else return None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return LanguageModel.load(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not load language model {path}: {e}")
+        return None
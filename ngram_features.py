@@ -0,0 +1,66 @@
+"""Hashed character n-gram features, computed with NumPy.
+
+Text is turned into an array of code points and every n-gram hash is
+computed with whole-array arithmetic, so there is no per-character Python
+loop. Hashes are plain polynomial hashes (not Python's salted ``hash``), so
+the same text maps to the same features in every process.
+"""
+import numpy as np
+
+NGRAM_ORDERS = (1, 2, 3, 4)
+_MASK = np.uint64(0xFFFFFFFF)
+_BASE = np.uint64(1000003)
+_MIX = np.uint64(0x2C1B3C6D)
+
+
+def normalize(text):
+    """Lower-case, collapse whitespace and pad with spaces as word boundaries."""
+    return " " + " ".join(text.lower().split()) + " "
+
+
+def _window_hashes(codes, n):
+    """Hash of every length-``n`` window of ``codes``."""
+    length = len(codes)
+    h = np.full(length - n + 1, n, dtype=np.uint64)
+    for k in range(n):
+        h = (h * _BASE + codes[k:length - n + 1 + k]) & _MASK
+    return ((h ^ (h >> np.uint64(15))) * _MIX) & _MASK
+
+
+def _codes(text):
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+
+def ngram_indices(text, n_features, orders=NGRAM_ORDERS):
+    """Feature indices (one per n-gram occurrence) for ``text``."""
+    codes = _codes(normalize(text))
+    parts = [_window_hashes(codes, n) for n in orders if len(codes) >= n]
+    if not parts:
+        return np.zeros(0, dtype=np.intp)
+    return (np.concatenate(parts) % np.uint64(n_features)).astype(np.intp)
+
+
+def batch_ngram_indices(texts, n_features, orders=NGRAM_ORDERS):
+    """``(rows, indices)`` of every n-gram occurrence in a batch of texts.
+
+    All texts are hashed in one pass over their concatenation; windows that
+    cross from one text into the next are dropped.
+    """
+    codes = _codes("\0".join(normalize(text) for text in texts))
+    boundary = np.cumsum(codes == 0)        # text number of every position
+    rows, parts = [], []
+    for n in orders:
+        if len(codes) < n:
+            break
+        start_row = boundary[:len(codes) - n + 1]
+        end_row = boundary[n - 1:]
+        # A window is inside one text when it starts after the last separator
+        # before its end and does not start on a separator itself
+        keep = (start_row == end_row) & (codes[:len(codes) - n + 1] != 0)
+        rows.append(start_row[keep])
+        parts.append(_window_hashes(codes, n)[keep])
+    if not parts:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    indices = (np.concatenate(parts) % np.uint64(n_features)).astype(np.intp)
+    return np.concatenate(rows).astype(np.intp), indices
+
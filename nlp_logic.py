@@ -1,24 +1,11 @@
-import spacy
-from langdetect import detect, LangDetectException
+from spacy_pipelines import load_pipeline
+from language_id import detect_language
 import json
 import random
 
-# Load spaCy models
-try:
-    nlp_en = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' model...")
-    from spacy.cli import download
-    download("en_core_web_sm")
-    nlp_en = spacy.load("en_core_web_sm")
-
-try:
-    nlp_multi = spacy.load("xx_ent_wiki_sm")
-except OSError:
-    print("Downloading 'xx_ent_wiki_sm' model...")
-    from spacy.cli import download
-    download("xx_ent_wiki_sm")
-    nlp_multi = spacy.load("xx_ent_wiki_sm")
+# Load spaCy models (NER-only unless CHATBOT_SPACY_MODE=full)
+nlp_en = load_pipeline("en_core_web_sm")
+nlp_multi = load_pipeline("xx_ent_wiki_sm")
 
 # Load college data from JSON file
 with open('college_data.json', 'r', encoding='utf-8') as f:
@@ -36,18 +23,7 @@ hinglish_responses = college_data["hinglish_responses"]
 
 def get_language(text):
     """Detects the language of the given text."""
-    try:
-        lang = detect(text)
-        if lang.startswith('en'):
-            return 'en'
-        elif lang.startswith('hi'):
-            # Check for Hinglish keywords
-            if any(word in text.lower() for word in ["kaise", "kya", "hai", "college", "admission"]):
-                return 'hinglish'
-            return 'hi'
-    except LangDetectException:
-        return 'en'  # Default to English
-    return 'en'
+    return {'english': 'en', 'hindi': 'hi'}.get(detect_language(text), 'hinglish')
 
 def get_intent_and_entities(text, lang):
     """Extracts intent and entities from the text using spaCy."""
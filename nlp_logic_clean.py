@@ -1,25 +1,11 @@
-import spacy
-from langdetect import detect, LangDetectException
+from spacy_pipelines import load_pipeline
+from language_id import detect_language
 import json
 import random
-import re
 
-# Load spaCy models
-try:
-    nlp_en = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' model...")
-    from spacy.cli import download
-    download("en_core_web_sm")
-    nlp_en = spacy.load("en_core_web_sm")
-
-try:
-    nlp_multi = spacy.load("xx_ent_wiki_sm")
-except OSError:
-    print("Downloading 'xx_ent_wiki_sm' model...")
-    from spacy.cli import download
-    download("xx_ent_wiki_sm")
-    nlp_multi = spacy.load("xx_ent_wiki_sm")
+# Load spaCy models (NER-only unless CHATBOT_SPACY_MODE=full)
+nlp_en = load_pipeline("en_core_web_sm")
+nlp_multi = load_pipeline("xx_ent_wiki_sm")
 
 # Load college data from JSON file
 with open('college_data.json', 'r', encoding='utf-8') as f:
@@ -33,24 +19,7 @@ leadership_info = college_data["leadership_info"]
 
 def get_language(text):
     """Detect the language of the input text"""
-    try:
-        # Basic language detection
-        detected = detect(text)
-        
-        # Check for Hindi/Devanagari script
-        hindi_chars = re.findall(r'[\u0900-\u097F]', text)
-        english_chars = re.findall(r'[a-zA-Z]', text)
-        
-        if hindi_chars and english_chars:
-            return 'hinglish'
-        elif hindi_chars:
-            return 'hindi' 
-        elif detected == 'hi':
-            return 'hindi'
-        else:
-            return 'english'
-    except LangDetectException:
-        return 'english'  # default fallback
+    return detect_language(text)
 
 def get_intent_and_entities(text, language):
     """Extract intent and entities from text using spaCy NLP"""
@@ -0,0 +1,121 @@
+"""SQLite FTS5 store of knowledge passages, one full-text table per language.
+
+Optional search backend (CHATBOT_SEARCH_BACKEND=fts5): passages live on disk
+and are ranked by SQLite's built-in BM25, so only the matching rows are ever
+loaded into Python. ``sync`` is incremental: a content digest per passage is
+kept next to the index, and after college_data.json changes only added,
+changed or removed passages are written.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+
+from intent_matcher import tokenize
+from passages import STOPWORDS, search_languages
+
+DB_PATH = os.environ.get("CHATBOT_PASSAGE_DB",
+                         os.path.join(os.path.dirname(os.path.abspath(__file__)), "passages.sqlite3"))
+LANGUAGES = ("english", "hindi", "hinglish")
+
+
+def fts5_available():
+    try:
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(body)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _digest(passage):
+    return hashlib.blake2b(f"{passage.title}\0{passage.html}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def match_query(text):
+    """FTS5 MATCH expression: the message's content words, OR-ed and quoted."""
+    words = [w for w in tokenize(text) if w not in STOPWORDS]
+    return " OR ".join('"' + w.replace('"', '""') + '"' for w in dict.fromkeys(words))
+
+
+class PassageStore:
+    """Passages indexed in ``passages_<language>`` FTS5 tables."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        conn = self._conn()
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS passage_digest "
+                         "(language TEXT, id TEXT, digest TEXT, PRIMARY KEY (language, id))")
+            for language in LANGUAGES:
+                conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS passages_{language} USING fts5("
+                             "id UNINDEXED, title, body, html UNINDEXED, "
+                             "tokenize = 'unicode61 remove_diacritics 2')")
+
+    def _conn(self):
+        # One connection per thread; WAL lets searches run during a sync
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def after_fork(self):
+        """Drop connections inherited from the parent; each process opens its own."""
+        self._local = threading.local()
+
+    def sync(self, passages):
+        """Bring the index in line with ``passages``; return (added, updated, removed)."""
+        added = updated = 0
+        with self._write_lock:
+            conn = self._conn()
+            with conn:
+                known = {(lang, pid): digest for lang, pid, digest in
+                         conn.execute("SELECT language, id, digest FROM passage_digest")}
+                seen = set()
+                for passage in passages:
+                    key = (passage.language, passage.id)
+                    if passage.language not in LANGUAGES or key in seen:
+                        continue
+                    seen.add(key)
+                    digest = _digest(passage)
+                    if known.get(key) == digest:
+                        continue
+                    table = f"passages_{passage.language}"
+                    if key in known:
+                        conn.execute(f"DELETE FROM {table} WHERE id = ?", (passage.id,))
+                        updated += 1
+                    else:
+                        added += 1
+                    conn.execute(f"INSERT INTO {table} (id, title, body, html) VALUES (?, ?, ?, ?)",
+                                 (passage.id, passage.title, passage.body, passage.html))
+                    conn.execute("INSERT OR REPLACE INTO passage_digest VALUES (?, ?, ?)",
+                                 (passage.language, passage.id, digest))
+                removed = known.keys() - seen
+                for language, passage_id in removed:
+                    conn.execute(f"DELETE FROM passages_{language} WHERE id = ?", (passage_id,))
+                    conn.execute("DELETE FROM passage_digest WHERE language = ? AND id = ?",
+                                 (language, passage_id))
+        return added, updated, len(removed)
+
+    def search(self, text, language, limit=1):
+        """Best ``[(passage_id, html, score)]`` for ``text``; higher scores are better."""
+        query = match_query(text)
+        if not query:
+            return []
+        conn = self._conn()
+        for lang in search_languages(language):
+            # bm25() is lower-is-better; titles weigh more than bodies
+            rows = conn.execute(
+                f"SELECT id, html, -bm25(passages_{lang}, 0, 2.0, 1.0, 0) AS score "
+                f"FROM passages_{lang} WHERE passages_{lang} MATCH ? ORDER BY score DESC LIMIT ?",
+                (query, limit)).fetchall()
+            if rows:
+                return rows
+        return []
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM passage_digest").fetchone()[0]
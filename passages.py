@@ -0,0 +1,77 @@
+"""Knowledge passages for free-text search.
+
+Every answer-sized string of the knowledge base becomes a passage: the
+sections of knowledge_base.py (discipline rules, library, transport, ...)
+and, from college_data.json, the department details and the per-language
+responses. A passage keeps its HTML for answering and a
+plain-text body for indexing.
+"""
+import html
+import re
+from collections import namedtuple
+from collections.abc import Mapping
+
+Passage = namedtuple("Passage", ["id", "language", "title", "body", "html"])
+
+# college_data.json response dictionaries and the language they are written in
+RESPONSE_LANGUAGES = {
+    "english_responses": "english",
+    "hindi_responses": "hindi",
+    "hinglish_responses": "hinglish",
+}
+# knowledge_base entries that are not prose passages
+SKIP_KNOWLEDGE = {"faculty_data"}
+
+# Query words too common to rank on
+STOPWORDS = frozenset("""
+a an the is are was were be to of in on at for and or with about me my i you your we our it this that
+what which who how when where do does can could please tell give show kya hai hain ka ki ke ko me mein se
+batao bataiye kaise kab kaun
+""".split())
+
+_TAG = re.compile(r"<[^>]+>")
+
+
+def plain_text(markup):
+    """Body text of an HTML answer, for indexing."""
+    return " ".join(html.unescape(_TAG.sub(" ", markup)).split())
+
+
+def _walk(prefix, value):
+    """(id, text) for every string under ``value``."""
+    if isinstance(value, str):
+        yield prefix, value
+    elif isinstance(value, Mapping):
+        for key, item in value.items():
+            yield from _walk(f"{prefix}.{key}", item)
+
+
+def iter_passages(college_data, knowledge):
+    """Yield a Passage for every string in the knowledge base."""
+    for name, value in knowledge.items():
+        if name in SKIP_KNOWLEDGE:
+            continue
+        for passage_id, markup in _walk(name, value):
+            yield _passage(passage_id, "english", markup)
+    # leadership_info is in both sources; the knowledge base copy is richer
+    for passage_id, markup in _walk("department_details", college_data.get("department_details", {})):
+        yield _passage(passage_id, "english", markup)
+    for name, language in RESPONSE_LANGUAGES.items():
+        for passage_id, markup in _walk(name, college_data.get(name, {})):
+            yield _passage(passage_id, language, markup)
+
+
+def _passage(passage_id, language, markup):
+    title = passage_id.rsplit(".", 1)[-1].replace("_", " ")
+    return Passage(passage_id, language, title, plain_text(markup), markup)
+
+
+def search_languages(language):
+    """Languages to search, in order, for a query in ``language``.
+
+    Hindi and Hinglish users regularly use English words, and most of the
+    knowledge base only exists in English.
+    """
+    if language in ("hindi", "hinglish"):
+        return (language, "english")
+    return ("english",)
@@ -0,0 +1,137 @@
+"""Micro-batching of concurrent spaCy calls through ``nlp.pipe``.
+
+Requests served in parallel each need one short document. Instead of every
+thread calling ``nlp(text)`` on its own, they hand the text to a
+``PipeBatcher``: its scheduler thread takes every waiting text (up to
+``max_batch``), runs them through one ``nlp.pipe`` call and gives every
+caller its Doc. Texts that arrive while a pipe call runs form the next
+batch. The batch is held open for at most ``window`` seconds, and only
+while more callers are in flight than it holds. A caller that arrives alone
+is sent at once, so a server handling one request at a time (serve.py
+workers) never waits; at peak one pipe call replaces many separate ones.
+
+``stats`` reports the distribution of batch sizes and of the time texts
+spent queued before their batch started.
+
+Environment variables:
+    CHATBOT_NLP_BATCH_WINDOW_MS  collection window (default 3, 0 disables batching)
+    CHATBOT_NLP_MAX_BATCH        largest batch (default 32)
+"""
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import Future
+
+BATCH_WINDOW = float(os.environ.get("CHATBOT_NLP_BATCH_WINDOW_MS", "3")) / 1000
+MAX_BATCH = int(os.environ.get("CHATBOT_NLP_MAX_BATCH", "32"))
+# Upper bounds (ms) of the queueing delay histogram buckets
+DELAY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100)
+
+
+class PipeBatcher:
+    """Callable like ``nlp(text)``, but batched with concurrent callers."""
+
+    def __init__(self, nlp, window=BATCH_WINDOW, max_batch=MAX_BATCH, name="nlp"):
+        self.nlp = nlp
+        self.window = window
+        self.max_batch = max_batch
+        self.name = name
+        self._queue = queue.Queue()
+        self._thread = None
+        self._callers = 0               # callers waiting for a Doc
+        self._start_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._sizes = {}                # batch size -> batches
+        self._delays = [0] * (len(DELAY_BUCKETS_MS) + 1)
+        self._delay_total = 0.0
+        self._delay_max = 0.0
+        self._pipe_total = 0.0
+
+    def __call__(self, text):
+        if self.window <= 0 or self.max_batch <= 1:
+            return self.nlp(text)
+        self._ensure_thread()
+        future = Future()
+        with self._lock:
+            self._callers += 1
+        self._queue.put((text, time.perf_counter(), future))
+        return future.result()
+
+    def _ensure_thread(self):
+        # Started lazily, so a worker forked by serve.py starts its own
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-batcher", daemon=True)
+                self._thread.start()
+
+    def _collect(self):
+        """The next batch: the waiting texts, plus late callers within the window."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+            with self._lock:
+                others = self._callers - len(batch)
+            remaining = deadline - time.perf_counter()
+            # Nobody else is on the way: do not hold the batch back
+            if others <= 0 or remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            start = time.perf_counter()
+            with self._lock:
+                self._callers -= len(batch)
+            try:
+                docs = list(self.nlp.pipe([text for text, _, _ in batch], batch_size=len(batch)))
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, _, future), doc in zip(batch, docs):
+                    future.set_result(doc)
+            self._record(batch, start, time.perf_counter() - start)
+
+    def _record(self, batch, start, elapsed):
+        with self._lock:
+            self._sizes[len(batch)] = self._sizes.get(len(batch), 0) + 1
+            self._pipe_total += elapsed
+            for _, queued, _ in batch:
+                delay = start - queued
+                self._delays[bisect_left(DELAY_BUCKETS_MS, delay * 1e3)] += 1
+                self._delay_total += delay
+                self._delay_max = max(self._delay_max, delay)
+
+    def stats(self):
+        with self._lock:
+            batches = sum(self._sizes.values())
+            texts = sum(size * count for size, count in self._sizes.items())
+            return {
+                "window_ms": self.window * 1e3,
+                "max_batch": self.max_batch,
+                "batches": batches,
+                "texts": texts,
+                "mean_batch": round(texts / batches, 2) if batches else 0.0,
+                "batch_sizes": dict(sorted(self._sizes.items())),
+                "queue_delay": {
+                    "mean_ms": round(self._delay_total / texts * 1e3, 3) if texts else 0.0,
+                    "max_ms": round(self._delay_max * 1e3, 3),
+                    # Texts per bucket, by upper bound; None is everything slower
+                    "histogram": [[bound, count] for bound, count in zip(DELAY_BUCKETS_MS + (None,), self._delays)],
+                },
+                "pipe_mean_ms": round(self._pipe_total / batches * 1e3, 3) if batches else 0.0,
+            }
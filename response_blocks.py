@@ -0,0 +1,126 @@
+"""Structured response blocks, the opt-in alternative to HTML answers.
+
+An answer is normally one HTML string. ``compose`` builds that same string
+from parts and remembers the typed blocks it was made of, so a client that
+asks for ``format=blocks`` gets data instead of markup:
+
+    {"type": "html", "html": "..."}
+    {"type": "buttons", "ref": "departments"}
+    {"type": "faculty_list", "title": ..., "icon": ..., "members": [...], "next": cursor}
+    {"type": "fee_table", "title": ..., "columns": [...], "rows": [[...], ...]}
+
+Button sets are sent by reference only; their contents are served once by
+``ButtonSets.catalog`` for the client to cache. Answers that were not
+composed are a single html block.
+"""
+import re
+from html.parser import HTMLParser
+
+from passages import plain_text
+
+_BUTTON = re.compile(r"""<button class="([^"]*)"[^>]*?onclick="sendButtonMessage\('([^']*)'\)">([^<]*)</button>""")
+
+
+class Answer(str):
+    """An HTML answer that also knows its parts: ``(html, block)`` pairs."""
+
+    def __new__(cls, parts):
+        answer = super().__new__(cls, "".join(html for html, _ in parts))
+        answer.parts = parts
+        answer.blocks = tuple(block for html, block in parts
+                              if block["type"] != "html" or html.strip())
+        return answer
+
+
+def compose(*parts):
+    """Concatenate parts into an Answer.
+
+    A part is another Answer, HTML (an html block) or an ``(html, block)``
+    pair from one of the block constructors below.
+    """
+    pairs = []
+    for part in parts:
+        if isinstance(part, Answer):
+            pairs.extend(part.parts)
+        elif isinstance(part, str):
+            pairs.append((part, {"type": "html", "html": part}))
+        else:
+            pairs.append(part)
+    return Answer(tuple(pairs))
+
+
+def parts_of(answer):
+    """The ``(html, block)`` parts of an answer; a plain string is one html part."""
+    parts = getattr(answer, "parts", None)
+    if parts is None:
+        return ((answer, {"type": "html", "html": answer}),)
+    return parts
+
+
+def blocks_of(answer):
+    """The blocks of an answer; a plain string is one html block."""
+    blocks = getattr(answer, "blocks", None)
+    if blocks is None:
+        return ({"type": "html", "html": answer},)
+    return blocks
+
+
+class ButtonSets:
+    """Named button groups, parsed from the markup that renders them."""
+
+    def __init__(self):
+        self._sets = {}
+        self._html = {}
+
+    def add(self, ref, html):
+        buttons = [{"label": label.strip(), "message": message, "style": style}
+                   for style, message, label in _BUTTON.findall(html)]
+        if not buttons:
+            raise ValueError(f"Button set {ref!r} has no buttons")
+        self._sets[ref] = buttons
+        self._html[ref] = html
+
+    def block(self, ref):
+        """``(html, block)`` part referring to a registered set."""
+        return self._html[ref], {"type": "buttons", "ref": ref}
+
+    def catalog(self):
+        return {ref: list(buttons) for ref, buttons in self._sets.items()}
+
+
+def faculty_list(html, title, icon, members, next_cursor=None):
+    """``(html, block)`` part for rendered faculty cards."""
+    return html, {"type": "faculty_list", "title": title, "icon": icon,
+                  "members": [prof.as_dict() for prof in members], "next": next_cursor}
+
+
+class _TableParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "tr":
+            self.rows.append([])
+        elif tag in ("td", "th"):
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th") and self._cell is not None and self.rows:
+            self.rows[-1].append(" ".join("".join(self._cell).split()))
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def fee_table(html):
+    """``(html, block)`` part for an HTML fee table; the text before it is the title."""
+    parser = _TableParser()
+    parser.feed(html)
+    if not parser.rows:
+        raise ValueError("fee_table: no <table> rows")
+    title = plain_text(html.split("<table", 1)[0])
+    return html, {"type": "fee_table", "title": title, "columns": parser.rows[0], "rows": parser.rows[1:]}
@@ -0,0 +1,103 @@
+"""Bounded LRU + TTL cache for chatbot answers.
+
+Messages are fingerprinted after normalization (Unicode NFC, case folding,
+punctuation stripped, whitespace collapsed), so "Fees?" and "  fees " share an
+entry. The cache stores the resolved answer *variants*, not the final string,
+so random greetings keep rotating on hits. Entries are bounded both by count
+and by an approximate byte budget, expire after a TTL, and are all dropped
+(``clear``) when the data they were computed from is reloaded.
+"""
+import string
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+_PUNCT_TO_SPACE = str.maketrans({ch: " " for ch in string.punctuation + "।॥‘’“”…"})
+
+
+def fingerprint(message):
+    """Normalized cache key for a user message."""
+    text = unicodedata.normalize("NFC", message).casefold()
+    return " ".join(text.translate(_PUNCT_TO_SPACE).split())
+
+
+def _entry_size(value):
+    """Rough byte cost of a cached value (strings dominate)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for item in value.values():
+            size += _entry_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += _entry_size(item)
+    return size
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with a TTL and a memory bound."""
+
+    def __init__(self, max_entries=2048, max_bytes=16 * 1024 * 1024, ttl=600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()       # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def get(self, key):
+        """Cached value for ``key``, or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] < now:
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, value):
+        size = _entry_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        """Drop every entry (the data they came from was reloaded)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,87 @@
+"""Precompiled (language, intent, entity) -> answer lookup table.
+
+Every answer the NLP path can give is resolved and rendered once, when the
+college data is loaded, into an immutable mapping. Each value is a tuple of
+variants; only the random choice among variants happens per request.
+"""
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+
+LANGUAGES = ("english", "hindi", "hinglish")
+
+DEFAULTS = {
+    "greeting": "Hello! How can I help you with college information?",
+    "fees": "Fee information not available.",
+    "admission": "Admission information not available.",
+    "department": "We have Computer, Mechanical, Electrical, Civil, and IT departments.",
+    "faculty": "Our faculty information is available for all departments.",
+    "contact": "Contact information not available.",
+    "placement": "Our college has excellent placement opportunities with top companies.",
+    "general": "I'm here to help you with college information. Please ask about admissions, fees, departments, or facilities.",
+}
+
+
+def _variants(value):
+    """Normalize a response (string or list of strings) into a tuple."""
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return tuple(value)
+    return (value,)
+
+
+def _language_answers(responses, contact_fallback):
+    """Intent -> answer for one language's response dictionary."""
+    fees = responses.get('fees', DEFAULTS["fees"])
+    if isinstance(fees, Mapping):
+        fees = fees.get('overview', DEFAULTS["fees"])
+    return {
+        "greeting": responses.get('greeting', DEFAULTS["greeting"]),
+        "fees": fees,
+        "admission": responses.get('admission_info', responses.get('admission', DEFAULTS["admission"])),
+        "department": responses.get('department_info', DEFAULTS["department"]),
+        "faculty": responses.get('faculty', DEFAULTS["faculty"]),
+        "contact": responses.get('contact_details', responses.get('contact', contact_fallback or DEFAULTS["contact"])),
+        "placement": responses.get('placement', DEFAULTS["placement"]),
+        "general": responses.get('default', DEFAULTS["general"]),
+    }
+
+
+def select_responses(college_data, language):
+    """The response dictionary generate_response used for ``language``."""
+    key = f"{language}_responses"
+    if language != 'english' and key in college_data:
+        return college_data[key]
+    if 'english_responses' in college_data:
+        return college_data['english_responses']
+    return college_data.get('responses', {})
+
+
+def build_response_table(college_data, department_answers, faculty_answers, contact_fallback=None,
+                         fees_answers=None):
+    """Render every (language, intent, entity) answer once.
+
+    ``department_answers`` and ``faculty_answers`` map department keys to
+    already rendered HTML; they are the same in every language.
+    ``fees_answers`` maps languages to a fees answer that replaces the data
+    file's text (the typed fee table).
+    """
+    table = {}
+    for language in LANGUAGES:
+        answers = _language_answers(select_responses(college_data, language), contact_fallback)
+        if fees_answers and language in fees_answers:
+            answers["fees"] = fees_answers[language]
+        for intent, answer in answers.items():
+            table[(language, intent, None)] = _variants(answer)
+        for dept, answer in department_answers.items():
+            table[(language, "department", dept)] = _variants(answer)
+        for dept, answer in faculty_answers.items():
+            table[(language, "faculty", dept)] = _variants(answer)
+    return MappingProxyType(table)
+
+
+def lookup(table, language, intent, entity=None):
+    """Variants for the most specific key present, falling back to 'general'."""
+    if language not in LANGUAGES:
+        language = 'english'
+    return (table.get((language, intent, entity))
+            or table.get((language, intent, None))
+            or table[(language, "general", None)])
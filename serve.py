@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Production entry point: load everything once, then fork workers.
+
+    python serve.py [--host 0.0.0.0] [--port 5000] [--workers 4] [--max-requests 1000]
+
+The master imports help2, which loads both spaCy pipelines, the knowledge
+snapshot, the answer tables and the templates. It then freezes the heap
+(``gc.freeze()``) so the collector never writes to those objects again, and
+forks the workers. The workers share the master's pages copy-on-write
+instead of each loading its own copy of the models.
+
+Each worker serves requests one at a time from the shared listening socket
+and exits after ``--max-requests`` (plus a random jitter, so workers do not
+all restart together); the master replaces every worker that exits. SIGTERM
+or SIGINT stops the master and its workers after their current request.
+
+Because a worker handles one connection at a time, the endpoints that keep
+a connection open (the /chat WebSocket and /get_response/stream) would hold
+a whole worker for as long as the client stays connected. Workers refuse
+them with 503; serve them from ``python help2.py`` (threaded) instead.
+
+``python help2.py`` still starts the Werkzeug development server.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import signal
+import socket
+import sys
+
+from werkzeug.serving import make_server
+
+WORKERS = int(os.environ.get("CHATBOT_WORKERS", str(os.cpu_count() or 1)))
+MAX_REQUESTS = int(os.environ.get("CHATBOT_MAX_REQUESTS", "1000"))
+MAX_REQUESTS_JITTER = int(os.environ.get("CHATBOT_MAX_REQUESTS_JITTER", "50"))
+# How often an idle worker checks whether it was asked to stop
+POLL_INTERVAL = 1.0
+# Endpoints that hold their connection open, refused by the workers
+LONG_LIVED_PATHS = ("/chat", "/get_response/stream")
+
+
+def load_app():
+    """Import the app with every model loaded, then freeze the heap."""
+    import help2
+    # Background threads do not survive fork(); restart them in each worker
+    help2.data_reloader.stop()
+    gc.collect()
+    gc.freeze()
+    return help2
+
+
+def refuse_long_lived(app):
+    """Wrap ``app`` so LONG_LIVED_PATHS get 503 instead of tying up the worker."""
+    def worker_app(environ, start_response):
+        if environ.get("PATH_INFO") not in LONG_LIVED_PATHS:
+            return app(environ, start_response)
+        body = json.dumps({"error": "not available on this server, use /get_response"}).encode("utf-8")
+        start_response("503 Service Unavailable", [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(body))),
+        ])
+        return [body]
+    return worker_app
+
+
+def run_worker(chatbot, listener, max_requests):
+    """Serve up to ``max_requests`` requests, then exit for replacement."""
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # the master handles Ctrl-C
+    chatbot.data_reloader.start()
+    if chatbot.passage_store is not None:
+        chatbot.passage_store.after_fork()
+    random.seed()
+
+    host, port = listener.getsockname()[:2]
+    server = make_server(host, port, refuse_long_lived(chatbot.app), fd=listener.fileno())
+    # handle_request() gives up after POLL_INTERVAL without a request
+    server.timeout = POLL_INTERVAL
+    timed_out = False
+
+    def on_timeout():
+        nonlocal timed_out
+        timed_out = True
+
+    server.handle_timeout = on_timeout
+    served = 0
+    while not stopping and served < max_requests:
+        timed_out = False
+        server.handle_request()
+        if not timed_out:
+            served += 1
+    os._exit(0)
+
+
+class Master:
+    def __init__(self, chatbot, listener, workers, max_requests, jitter):
+        self.chatbot = chatbot
+        self.listener = listener
+        self.workers = workers
+        self.max_requests = max_requests
+        self.jitter = jitter
+        self.children = set()
+        self.running = True
+
+    def spawn(self):
+        max_requests = self.max_requests + random.randint(0, self.jitter)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(self.chatbot, self.listener, max_requests)
+            finally:
+                os._exit(1)
+        self.children.add(pid)
+
+    def stop(self, signum, frame):
+        self.running = False
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.workers):
+            self.spawn()
+        print(f"Master {os.getpid()}: {self.workers} workers on "
+              f"http://{self.listener.getsockname()[0]}:{self.listener.getsockname()[1]}")
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            self.children.discard(pid)
+            if self.running:
+                if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+                    print(f"Worker {pid} recycled after its request limit")
+                else:
+                    print(f"Worker {pid} died ({status}); replacing it")
+                self.spawn()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fork production server for the college chatbot")
+    parser.add_argument("--host", default=os.environ.get("CHATBOT_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("CHATBOT_PORT", "5000")))
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--max-requests", type=int, default=MAX_REQUESTS)
+    parser.add_argument("--max-requests-jitter", type=int, default=MAX_REQUESTS_JITTER)
+    args = parser.parse_args()
+
+    listener = socket.create_server((args.host, args.port), backlog=2048)
+    listener.set_inheritable(True)
+    chatbot = load_app()
+    Master(chatbot, listener, max(1, args.workers), args.max_requests, args.max_requests_jitter).run()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Loading of the spaCy pipelines used by the chatbot.
+
+The chatbot only ever reads ``doc.ents``, so by default the pipelines are
+loaded without the tagger, parser, lemmatizer and attribute_ruler. The pruned
+pipeline is written to a local artifact directory the first time and later
+starts load it from there instead of the full installed package.
+
+Environment variables:
+    CHATBOT_SPACY_MODE  "pruned" (default) or "full"
+    CHATBOT_MODEL_DIR   artifact directory (default: models/ next to this file)
+"""
+import os
+import spacy
+
+SPACY_MODE = os.environ.get("CHATBOT_SPACY_MODE", "pruned")
+MODEL_DIR = os.environ.get("CHATBOT_MODEL_DIR",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), "models"))
+
+# Components that never contribute to doc.ents
+UNUSED_COMPONENTS = ["tagger", "parser", "lemmatizer", "attribute_ruler",
+                     "morphologizer", "senter", "sentencizer"]
+
+
+def _load_package(name, **kwargs):
+    """Load an installed spaCy package, downloading it if it is missing."""
+    try:
+        return spacy.load(name, **kwargs)
+    except OSError:
+        print(f"Downloading '{name}' model...")
+        from spacy.cli import download
+        download(name)
+        return spacy.load(name, **kwargs)
+
+
+def _drop_idle_tok2vec(nlp):
+    """Remove a shared tok2vec once nothing that is left listens to it."""
+    if "tok2vec" in nlp.pipe_names and not nlp.get_pipe("tok2vec").listening_components:
+        nlp.remove_pipe("tok2vec")
+
+
+def pruned_path(name):
+    """Artifact directory holding the pruned copy of pipeline ``name``."""
+    return os.path.join(MODEL_DIR, f"{name}-ner")
+
+
+def build_pruned_pipeline(name):
+    """Load ``name`` without unused components and save it as an artifact."""
+    nlp = _load_package(name, exclude=UNUSED_COMPONENTS)
+    _drop_idle_tok2vec(nlp)
+    path = pruned_path(name)
+    try:
+        os.makedirs(MODEL_DIR, exist_ok=True)
+        nlp.to_disk(path)
+        print(f"Saved pruned '{name}' pipeline ({', '.join(nlp.pipe_names)}) to {path}")
+    except OSError as e:
+        print(f"Warning: could not save pruned pipeline to {path}: {e}")
+    return nlp
+
+
+def load_pipeline(name, mode=None):
+    """Load spaCy pipeline ``name`` in ``mode`` ("pruned" or "full")."""
+    mode = mode or SPACY_MODE
+    if mode == "full":
+        return _load_package(name)
+
+    path = pruned_path(name)
+    if os.path.isdir(path):
+        try:
+            return spacy.load(path)
+        except (OSError, ValueError) as e:
+            # Artifact written by another spaCy version or half-written: rebuild it
+            print(f"Warning: ignoring pruned pipeline at {path}: {e}")
+    return build_pruned_pipeline(name)
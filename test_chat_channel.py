@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Tests for the WebSocket chat channel, over an in-memory socket
+
+import json
+import queue
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(__file__))
+
+from chat_channel import ChatChannel
+
+
+class MemorySocket:
+    def __init__(self, messages):
+        self.incoming = queue.Queue()
+        for message in messages:
+            self.incoming.put(json.dumps(message))
+        self.sent = []
+        self.closed = False
+
+    def receive(self, timeout=None):
+        try:
+            return self.incoming.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def send(self, text):
+        self.sent.append(json.loads(text))
+
+    def close(self):
+        self.closed = True
+
+
+def test_replies_carry_the_message_id_and_idle_connections_close():
+    ws = MemorySocket([{"id": 1, "user_message": "hi"}, {"id": 2, "user_message": "fees"}, "not an object"])
+    ChatChannel(ws, lambda m: {"response": m["user_message"].upper()}, idle_timeout=0.05).serve()
+    replies = [m for m in ws.sent if m.get("id") in (1, 2)]
+    assert replies == [{"id": 1, "response": "HI"}, {"id": 2, "response": "FEES"}]
+    assert {"id": None, "error": "invalid"} in ws.sent
+    assert ws.sent[-1]["event"] == "idle_timeout" and ws.closed
+
+
+def test_a_full_queue_refuses_messages():
+    release = threading.Event()
+
+    def slow(message):
+        release.wait(1)
+        return {"response": "ok"}
+
+    ws = MemorySocket([{"id": i, "user_message": "x"} for i in range(5)])
+    channel = ChatChannel(ws, slow, max_pending=2, idle_timeout=0.05)
+    thread = threading.Thread(target=channel.serve)
+    thread.start()
+    thread.join(0.5)
+    release.set()
+    thread.join(2)
+    busy = [m["id"] for m in ws.sent if m.get("error") == "busy"]
+    answered = [m["id"] for m in ws.sent if m.get("response") == "ok"]
+    assert busy and sorted(busy + answered) == list(range(5))
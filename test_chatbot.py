@@ -6,7 +6,9 @@ import os
 sys.path.append(os.path.dirname(__file__))
 
 # Import functions directly from help2.py
-from help2 import get_language, get_intent_and_entities, generate_response
+import help2
+from help2 import app, chat_reply, get_language, get_intent_and_entities, generate_response
+from intent_matcher import INTENT_CONFIDENCE
 
 def test_chatbot_responses():
     """Test various inputs to see what responses are generated"""
@@ -48,5 +50,49 @@ def test_chatbot_responses():
         
         print("-" * 50)
 
+def test_fees_question_returns_fee_table_block():
+    """The NLP answer to a fees question carries the typed fee table"""
+    client = app.test_client()
+    blocks = client.post('/get_response', data={'user_message': 'fees', 'format': 'blocks'}).get_json()['blocks']
+    assert [block['type'] for block in blocks] == ['fee_table']
+    assert blocks[0]['rows']
+
+def test_degree_words_without_faculty_context_are_not_directory_queries():
+    """Courses and study plans that mention a degree are not faculty listings"""
+    for message in ("mtech courses", "i want to do phd after btech"):
+        stages = []
+        intent, entities, _ = get_intent_and_entities(message, "english", stages)
+        assert 'faculty_query' not in entities, message
+        assert intent != "faculty", message
+
+def test_blank_format_outside_a_request_is_html():
+    """answer_payload never reads the Flask request (WebSocket and ASGI callers)"""
+    assert 'response' in chat_reply({'id': 1, 'user_message': 'fees', 'format': ''})
+
+class FixedClassifier:
+    """Intent model stand-in that always returns the same probabilities"""
+
+    def __init__(self, probabilities):
+        self.probabilities = probabilities
+
+    def predict(self, text):
+        best = max(self.probabilities, key=self.probabilities.get)
+        return best, self.probabilities[best], dict(self.probabilities)
+
+def test_classifier_disagreement_keeps_keyword_confidence():
+    """A kept keyword intent reports the keyword confidence; a stray hit becomes general"""
+    model = help2.intent_model
+    try:
+        # "it" is the IT department alias; the classifier barely agrees
+        help2.intent_model = FixedClassifier({"department": 0.006, "general": 0.85, "fees": 0.144})
+        intent, _, confidence = get_intent_and_entities("what is it", "english")
+        assert (intent, confidence) == ("general", 0.85)
+
+        help2.intent_model = FixedClassifier({"admission": 0.10, "general": 0.88, "fees": 0.02})
+        intent, _, confidence = get_intent_and_entities("how do i apply to this college", "english")
+        assert (intent, confidence) == ("admission", INTENT_CONFIDENCE["admission"])
+    finally:
+        help2.intent_model = model
+
 if __name__ == "__main__":
     test_chatbot_responses()
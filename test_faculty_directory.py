@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Tests for the faculty directory search
+
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+import knowledge_base
+from faculty_directory import FacultyDirectory, decode_cursor, department_query, encode_cursor
+from knowledge_records import load_records
+
+directory = FacultyDirectory(
+    load_records({name: getattr(knowledge_base, name) for name in knowledge_base.KNOWLEDGE_NAMES}).departments,
+    ignore_names=["parankar"],
+)
+
+
+def names(members):
+    return [prof.name for prof in members]
+
+
+def test_name_prefixes_and_filters():
+    assert names(directory.search(name="ghant", department="it")) == ["Prof.Priti D.Ghantewar"]
+    assert names(directory.search(qualification="Ph.D", department="civil")) == ["Prof.Dr.Ravindra W.Parankar"]
+    assert names(directory.search(position="hod", department="mechanical")) == ["Prof. Nikhil Ekotkhane"]
+
+
+def test_awaited_degree_is_not_the_degree():
+    assert "Prof.Priti D.Ghantewar" not in names(directory.search(qualification="phd"))
+    assert "Prof.Priti D.Ghantewar" in names(directory.search(qualification="Ph.D(A)"))
+
+
+def test_messages_are_parsed_into_queries():
+    query = directory.parse("is Prof. Sapane a PhD")
+    assert names(directory.answer(query)) == ["Prof. Pravin A. Sapane"]
+    # Listed in both computer and IT, answered once
+    assert names(directory.answer(directory.parse("who is muralibabu"))) == ["Dr.K.Muralibabu"]
+    assert directory.parse("about parankar college") is None
+    assert directory.parse("is ragging allowed") is None
+    # A degree or position alone is only a faculty question in faculty context
+    assert directory.parse("mtech courses") is None
+    assert directory.parse("i want to do phd after btech") is None
+    assert directory.parse("phd", faculty_context=True).qualifications == ("phd",)
+
+
+def test_pages_follow_the_cursor():
+    query = department_query("computer")
+    seen, cursor = directory.page(query, size=4)
+    while cursor is not None:
+        query, offset = decode_cursor(cursor)
+        members, cursor = directory.page(query, offset, size=4)
+        seen += members
+    assert names(seen) == names(directory.search(department="computer"))
+    assert decode_cursor(encode_cursor(directory.parse("assistant with phd", faculty_context=True), 8))[1] == 8
+
+
+def test_cursors_past_the_listing_or_of_unknown_departments_are_invalid():
+    for cursor in ("99999:civil:::", "0:nosuch:::"):
+        try:
+            directory.page(*decode_cursor(cursor))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected {cursor!r} to be rejected")
+    # An empty first page is still a valid (empty) answer
+    assert directory.page(department_query("civil")._replace(names=("zzzz",))) == ([], None)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# Tests for the data-driven fallback topic rules
+
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+from fallback_rules import RuleEngine
+
+
+def test_subtopics_refine_the_topic():
+    engine = RuleEngine()
+    assert engine.match("ragging rules") == "discipline.ragging"
+    assert engine.match("workshop welding section") == "workshop.welding"
+    assert engine.match("Library?") == "library.default"
+
+
+def test_priority_and_conjunctions():
+    engine = RuleEngine()
+    # "admission contact" used to be shadowed by the plain admission branch
+    assert engine.match("admission contact number") == "leadership.admission"
+    assert engine.match("admission dates") == "admission"
+    assert engine.match("college info") == "leadership.default"
+
+
+def test_prefixes_phrases_and_word_boundaries():
+    engine = RuleEngine([
+        {"priority": 1, "path": "a", "when": ["special need*"]},
+        {"priority": 2, "path": "b", "when": ["it"]},
+    ])
+    assert engine.match("facilities for special needs") == "a"
+    assert engine.match("needs special care") is None
+    assert engine.match("is this working") is None
+    assert engine.match("it faculty") == "b"
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Tests for the single-pass intent matcher
+
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+from intent_matcher import KeywordAutomaton, match_intent, tokenize
+
+
+def test_tokens_respect_word_boundaries():
+    # "hi" inside "this" and "it" inside "with" used to trigger greeting/department
+    assert match_intent("Tell me this with details")["intent"] == "general"
+    assert match_intent("hi")["intent"] == "greeting"
+
+
+def test_every_intent_is_scored():
+    result = match_intent("hi, what are the fees?")
+    assert result["intent"] == "fees"
+    assert set(result["scores"]) == {"greeting", "fees"}
+
+
+def test_department_alias_resolves_entity():
+    result = match_intent("Computer engineering ke baare mein batao")
+    assert result["intent"] == "department"
+    assert result["department"] == "computer"
+
+    result = match_intent("civil faculty")
+    assert result["intent"] == "faculty"
+    assert result["department"] == "civil"
+
+    # Plural faculty words outweigh the bare department name
+    result = match_intent("phd professors in civil")
+    assert result["intent"] == "faculty"
+    assert result["department"] == "civil"
+
+
+def test_devanagari_keywords():
+    assert tokenize("फीस कितनी है?") == ["फीस", "कितनी", "है"]
+    assert match_intent("फीस कितनी है?")["intent"] == "fees"
+
+
+def test_automaton_finds_overlapping_phrases():
+    automaton = KeywordAutomaton([("a b", 1), ("b c", 2), ("b", 3), ("a b c d", 4)])
+    hits = sorted(automaton.scan(["x", "a", "b", "c", "d"]))
+    assert hits == [(1, 2, 1), (1, 4, 4), (2, 1, 3), (2, 2, 2)]
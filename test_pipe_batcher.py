@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Tests for the nlp.pipe micro-batcher
+import sys, os
+sys.path.append(os.path.dirname(__file__))
+
+import threading
+import time
+
+from pipe_batcher import PipeBatcher
+
+
+class UpperNLP:
+    """Stands in for a spaCy pipeline; records the batches it was given."""
+
+    def __init__(self, fail=False, delay=0.0):
+        self.batches = []
+        self.fail = fail
+        self.delay = delay
+
+    def __call__(self, text):
+        return self.pipe([text]).__next__()
+
+    def pipe(self, texts, batch_size=None):
+        self.batches.append(list(texts))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model failed")
+        return (text.upper() for text in texts)
+
+
+def test_concurrent_calls_share_a_batch():
+    # Callers arriving while a pipe call runs wait for the next batch
+    nlp = UpperNLP(delay=0.05)
+    batcher = PipeBatcher(nlp, window=0.2, max_batch=8)
+    results = {}
+    barrier = threading.Barrier(5)
+
+    def call(i):
+        barrier.wait()
+        results[i] = batcher(f"message {i}")
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: f"MESSAGE {i}" for i in range(5)}
+    assert len(nlp.batches) < 5
+    stats = batcher.stats()
+    assert stats["texts"] == 5
+    assert sum(count for _, count in stats["queue_delay"]["histogram"]) == 5
+
+
+def test_lone_caller_skips_the_window():
+    nlp = UpperNLP()
+    batcher = PipeBatcher(nlp, window=0.5)
+    for _ in range(3):
+        start = time.perf_counter()
+        assert batcher("hi") == "HI"
+        assert time.perf_counter() - start < 0.1
+    assert batcher.stats()["batch_sizes"] == {1: 3}
+
+
+def test_pipe_errors_reach_every_caller():
+    batcher = PipeBatcher(UpperNLP(fail=True), window=0.001)
+    try:
+        batcher("hello")
+    except RuntimeError as e:
+        assert str(e) == "model failed"
+    else:
+        raise AssertionError("expected the pipe error")
+    # Batching off: plain nlp(text)
+    assert PipeBatcher(UpperNLP(), window=0)("hi") == "HI"
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# Tests for structured response blocks
+
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+import knowledge_base
+from response_blocks import ButtonSets, blocks_of, compose, fee_table
+
+BUTTONS = """<div><button class="dept-button" onclick="sendButtonMessage('civil faculty')">Civil</button></div>"""
+
+
+def test_compose_keeps_the_html_and_its_blocks():
+    sets = ButtonSets()
+    sets.add("departments", BUTTONS)
+    answer = compose("<p>About us</p>", sets.block("departments"))
+    assert answer == "<p>About us</p>" + BUTTONS
+    assert [block["type"] for block in blocks_of(answer)] == ["html", "buttons"]
+    assert sets.catalog() == {"departments": [{"label": "Civil", "message": "civil faculty", "style": "dept-button"}]}
+    assert blocks_of("plain") == ({"type": "html", "html": "plain"},)
+
+
+def test_fee_table_is_parsed_into_rows():
+    _, block = fee_table(knowledge_base.btech_fees["overview"])
+    assert block["title"] == "B.Tech Fee Structure (2024-25)"
+    assert block["columns"][0] == "Category"
+    assert block["rows"][-1] == ["Total Annual Fees", "1,31,000", "2,800"]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Train the character n-gram language identifier used by get_language
+#
+#   python train_language_model.py [--features 16384]
+#
+# Training data: language_corpus.tsv plus every english/hindi/hinglish
+# response sentence in college_data.json. Writes language_model.npy.
+
+import argparse
+import csv
+import json
+import random
+import re
+import time
+
+from intent_matcher import tokenize
+from language_id import HINGLISH_WORDS
+from language_model import LANGUAGES, MODEL_PATH, train
+
+
+def _has_language_signal(sentence, language, english_sentences):
+    """Skip response fragments that are really English (names, phone numbers, ...)."""
+    if language == "hindi":
+        return re.search(r"[ऀ-ॿ]", sentence) is not None
+    if language == "hinglish":
+        return sentence not in english_sentences and bool(set(tokenize(sentence)) & HINGLISH_WORDS)
+    return True
+
+
+def load_examples():
+    """(text, language) pairs from the corpus and the college data responses."""
+    examples = []
+    with open("language_corpus.tsv", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            examples.append((row["text"], row["language"]))
+
+    with open("college_data.json", encoding="utf-8") as f:
+        college_data = json.load(f)
+    sentences = {}
+    for language in LANGUAGES:
+        sentences[language] = []
+        for value in college_data.get(f"{language}_responses", {}).values():
+            for sentence in re.split(r"<br>|[•\n।?!]", re.sub(r"</?strong>", "", str(value))):
+                # Drop emoji/numbers-only fragments; they carry no language signal
+                if len(re.findall(r"[a-zA-Zऀ-ॿ]", sentence)) >= 8:
+                    sentences[language].append(sentence.strip())
+    english_sentences = set(sentences["english"])
+    for language in LANGUAGES:
+        examples.extend((sentence, language) for sentence in sentences[language]
+                        if _has_language_signal(sentence, language, english_sentences))
+    return examples
+
+
+def cross_validate(examples, n_features, folds=5):
+    rng = random.Random(0)
+    shuffled = examples[:]
+    rng.shuffle(shuffled)
+    correct = 0
+    for fold in range(folds):
+        test = shuffled[fold::folds]
+        train_set = [ex for i, ex in enumerate(shuffled) if i % folds != fold]
+        model = train([t for t, _ in train_set], [l for _, l in train_set], n_features)
+        correct += sum(model.predict(text)[0] == label for text, label in test)
+    return correct / len(examples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the character n-gram language identifier")
+    parser.add_argument("--features", type=int, default=1 << 14, help="hashed n-gram buckets")
+    args = parser.parse_args()
+
+    examples = load_examples()
+    counts = {language: sum(1 for _, l in examples if l == language) for language in LANGUAGES}
+    print(f"Training examples: {len(examples)} {counts}")
+    print(f"5-fold accuracy: {cross_validate(examples, args.features):.1%}")
+
+    model = train([t for t, _ in examples], [l for _, l in examples], args.features)
+    model.save(MODEL_PATH)
+    print(f"Saved {MODEL_PATH} ({model.table.nbytes / 1024:.0f} KB)")
+
+    start = time.perf_counter()
+    for text, _ in examples:
+        model.predict(text)
+    per_msg = (time.perf_counter() - start) / len(examples) * 1e6
+    print(f"Prediction: {per_msg:.0f} us per message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# Train the intent classifier used by get_intent_and_entities
+#
+#   python train_model.py [--features 4096] [--seed 0]
+#
+# Example utterances are generated from the keyword lists in intent_matcher.py
+# (INTENT_KEYWORDS, DEPARTMENT_ALIASES) with English and Hinglish templates,
+# plus out-of-scope "general" messages. Those templates say nothing about how
+# confident the model is on real traffic, so intent_corpus.tsv holds messages
+# as users actually write them, most of them out of scope. Per intent, half of
+# the corpus is trained on, 20% fits the softmax temperature and 30% is held
+# out: accuracy and calibration (ECE) are reported on that held-out part only.
+# Writes intent_model.npz.
+
+import argparse
+import csv
+import random
+import time
+
+import numpy as np
+
+from intent_classifier import MODEL_PATH, fit_temperature, train
+from intent_matcher import DEPARTMENT_ALIASES, INTENT_KEYWORDS
+
+TEMPLATES = [
+    "{kw}", "{kw}?", "what is the {kw}", "tell me the {kw}", "i want to know the {kw}",
+    "{kw} details please", "can you tell me {kw} information", "please share {kw}",
+    "{kw} kya hai", "{kw} batao", "mujhe {kw} ki jaankari chahiye", "{kw} kaise hai",
+]
+DEVANAGARI_TEMPLATES = ["{kw}", "{kw} क्या है", "{kw} के बारे में बताइए", "मुझे {kw} की जानकारी चाहिए"]
+GREETING_TEMPLATES = ["{kw}", "{kw}!", "{kw} there", "{kw} bot", "{kw}, anyone here?"]
+DEPARTMENT_TEMPLATES = [
+    "{alias} department", "tell me about {alias} engineering", "{alias} branch",
+    "about {alias}", "{alias} ke baare mein batao", "vision of {alias} engineering",
+]
+FACULTY_TEMPLATES = [
+    "{alias} faculty", "who teaches in {alias}", "{alias} ke teachers kaun hain",
+    "professors of {alias}", "hod of {alias}",
+]
+
+# Messages that belong to no intent; the bot answers them with its default reply
+GENERAL_EXAMPLES = [
+    "what is the weather today", "who won the cricket match",
+    "tell me a joke", "tell me a story", "tell me something funny",
+    "xyz", "ok", "thanks", "thank you so much", "what is the capital of india",
+    "kal milte hai", "random text", "can you sing", "i am bored", "what time is it",
+    "bye", "good night", "who made you", "are you a robot", "lol", "hmm",
+    "where can i eat pizza", "movie recommendations", "how old are you",
+    "मौसम कैसा है", "धन्यवाद", "acha theek hai", "what is love", "asdf qwer",
+]
+
+# Shares of each intent's corpus messages used to fit the temperature and to test
+CALIBRATION_SHARE = 0.2
+TEST_SHARE = 0.3
+
+
+def generate_examples():
+    examples = []
+    for intent, keywords in INTENT_KEYWORDS.items():
+        for kw in keywords:
+            if intent == "greeting":
+                templates = GREETING_TEMPLATES
+            elif not kw.isascii():
+                templates = DEVANAGARI_TEMPLATES
+            else:
+                templates = TEMPLATES
+            examples.extend((t.format(kw=kw), intent) for t in templates)
+    for aliases in DEPARTMENT_ALIASES.values():
+        for alias in aliases:
+            examples.extend((t.format(alias=alias), "department") for t in DEPARTMENT_TEMPLATES)
+            examples.extend((t.format(alias=alias), "faculty") for t in FACULTY_TEMPLATES)
+    examples.extend((text, "general") for text in GENERAL_EXAMPLES)
+    return examples
+
+
+def load_corpus(path="intent_corpus.tsv"):
+    """(text, intent) pairs of real user messages."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return [(row["text"], row["intent"]) for row in csv.DictReader(f, delimiter="\t")]
+
+
+def split_corpus(corpus, seed):
+    """Train, calibration and test parts, stratified by intent."""
+    by_intent = {}
+    for text, intent in corpus:
+        by_intent.setdefault(intent, []).append((text, intent))
+    train_part, calibration, test = [], [], []
+    rng = random.Random(seed)
+    for intent in sorted(by_intent):
+        rows = by_intent[intent]
+        rng.shuffle(rows)
+        n_test = max(1, round(len(rows) * TEST_SHARE))
+        n_calibration = max(1, round(len(rows) * CALIBRATION_SHARE))
+        test += rows[:n_test]
+        calibration += rows[n_test:n_test + n_calibration]
+        train_part += rows[n_test + n_calibration:]
+    return train_part, calibration, test
+
+
+def expected_calibration_error(probs, y, bins=10):
+    confidence = probs.max(axis=1)
+    correct = probs.argmax(axis=1) == y
+    ece = 0.0
+    for lo in np.linspace(0, 1, bins, endpoint=False):
+        mask = (confidence > lo) & (confidence <= lo + 1 / bins)
+        if mask.any():
+            ece += mask.mean() * abs(correct[mask].mean() - confidence[mask].mean())
+    return ece
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the intent classifier and report held-out accuracy and ECE")
+    parser.add_argument("--features", type=int, default=1 << 12, help="hashed n-gram buckets")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    train_part, calibration, test = split_corpus(load_corpus(), args.seed)
+    examples = generate_examples() + train_part
+    random.Random(args.seed).shuffle(examples)
+    print(f"Examples: {len(examples)} train ({len(train_part)} from the corpus), "
+          f"{len(calibration)} calibration, {len(test)} test, "
+          f"{len(set(label for _, label in examples))} intents")
+
+    start = time.perf_counter()
+    model = train([t for t, _ in examples], [l for _, l in examples], args.features)
+    print(f"Trained in {time.perf_counter() - start:.1f}s")
+
+    texts = [t for t, _ in test]
+    y = np.array([model.labels.index(l) for _, l in test])
+    ece_before = expected_calibration_error(model.predict_proba(texts), y)
+    temperature = fit_temperature(model, [t for t, _ in calibration], [l for _, l in calibration])
+    probs = model.predict_proba(texts)
+    print(f"Test accuracy (real messages): {(probs.argmax(axis=1) == y).mean():.1%}")
+    print(f"Temperature: {temperature:.3f} (test ECE {ece_before:.3f} -> {expected_calibration_error(probs, y):.3f})")
+    for (text, label), row in zip(test, probs):
+        intent = model.labels[int(row.argmax())]
+        if intent != label:
+            print(f"  {text!r:48} {intent:<11} {row.max():.2f}  (expected {label})")
+
+    model.save(MODEL_PATH)
+    print(f"Saved {MODEL_PATH}")
+
+    batch = [t for t, _ in examples] * 4
+    start = time.perf_counter()
+    model.predict_proba(batch)
+    print(f"Batch scoring: {(time.perf_counter() - start) / len(batch) * 1e6:.0f} us per message "
+          f"({len(batch)} messages, one matrix multiply)")
+
+
+if __name__ == "__main__":
+    main()